@@ -32,6 +32,7 @@ from .models import NonCollegeSchoolTimeCommitment
 from .models import Notification
 from .models import OfficialSchool
 from .models import OfficialSchoolTerm
+from .models import OutboundEmail
 from .models import Participation
 from .models import PaymentEligibility
 from .models import Project
@@ -497,6 +498,22 @@ class FeedbackAdmin(reversion.admin.VersionAdmin):
             '=intern_selection__applicant__applicant__account__email',
             )
 
+class OutboundEmailAdmin(admin.ModelAdmin):
+    list_display = (
+            'subject',
+            'status',
+            'attempts',
+            'next_attempt',
+            'sent',
+            )
+    list_filter = (
+            'status',
+            )
+    search_fields = (
+            'subject',
+            'to',
+            )
+
 admin.site.unregister(User)
 admin.site.register(User, ComradeAdmin)
 
@@ -520,6 +537,7 @@ admin.site.register(MentorRelationship, MentorRelationshipAdmin)
 admin.site.register(NewCommunity, CommunityAdmin)
 admin.site.register(Notification)
 admin.site.register(OfficialSchool, OfficialSchoolAdmin)
+admin.site.register(OutboundEmail, OutboundEmailAdmin)
 admin.site.register(Participation, ParticipationAdmin)
 admin.site.register(RoundPage)
 admin.site.register(Project, ProjectAdmin)
@@ -0,0 +1,29 @@
+# Backfilling a column that's computed from other columns, like a skill's
+# canonical name or a person's country, one row at a time is slow, but the
+# answers repeat a lot. These helpers only use the queryset they're given,
+# so migrations can call them with historical models too.
+
+def update_computed_fields(queryset, sources, targets, compute):
+    """
+    For every row in the queryset, call compute with the values of the
+    source fields, and store the tuple it returns in the target fields,
+    with one UPDATE for each distinct answer instead of one for each row.
+    Rows that already hold the right answer are left alone. Returns how
+    many rows changed.
+    """
+    groups = {}
+    for row in queryset.values_list('pk', *(sources + targets)).iterator():
+        pk = row[0]
+        values = row[1:1 + len(sources)]
+        current = tuple(row[1 + len(sources):])
+        answer = tuple(compute(*values))
+        if answer != current:
+            groups.setdefault(answer, []).append(pk)
+
+    changed = 0
+    for answer, pks in groups.items():
+        # Keep each query under SQLite's limit on query parameters.
+        for start in range(0, len(pks), 500):
+            changed += queryset.filter(pk__in=pks[start:start + 500]).update(
+                    **dict(zip(targets, answer)))
+    return changed
@@ -1,12 +1,8 @@
-from wagtail.wagtailcore.models import Page
-from .models import ApprovalStatus, DASHBOARD_MODELS
+from .models import get_pending_approvals
 
 def header(request):
     if request.user.is_authenticated:
-        # TODO: don't count objects where the submission_and_approval_deadline has passed
-        pending_approvals = sum(
-                model.objects_for_dashboard(request.user).filter(approval_status=ApprovalStatus.PENDING).distinct().count()
-                for model in DASHBOARD_MODELS)
+        pending_approvals = get_pending_approvals(request.user)
     else:
         pending_approvals = 0
 
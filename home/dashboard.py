@@ -1,7 +1,7 @@
 """
 To add a new dashboard section, there are three steps:
 
-- Define a function that takes a request and returns a context
+- Define a function that takes a Dashboard and returns a context
   value. If the value evaluates false, like False, None, [], or {},
   then this section will be skipped.
 
@@ -23,63 +23,162 @@ The context value can be any type. Here are some examples:
 
 - If it returns a list, then "{% for x in section %}" will loop over
   that list.
+
+The Dashboard passed to each section holds everything sections have in
+common: the request, the current deadline date, the RoundTimeline, and
+one Role per round. Use those instead of querying for rounds yourself.
+
+If a section is only ever shown to staff, or only to people who have
+filled out their Comrade profile, say so with the for_roles decorator,
+and the section won't be run at all for anyone else.
+
+Section contexts are cached per user until the next deadline passes or
+something in the database changes, so they must be picklable. Querysets
+are fine: they're evaluated before they're cached.
 """
 
 from collections import defaultdict
 import datetime
 
+from django.core.cache import cache
+from django.utils.functional import cached_property
+
 from .models import ApplicantApproval
 from .models import ApprovalStatus
 from .models import Community
 from .models import Comrade
+from .models import DASHBOARD_GENERATION_KEY
 from .models import DASHBOARD_MODELS
 from .models import MentorApproval
 from .models import MentorRelationship
 from .models import Participation
 from .models import Role
-from .models import RoundPage
-from .models import get_deadline_date_for
+from .models import RoundTimeline
+from .models import get_cache_generation
 from .models import has_deadline_passed
 
 __all__ = ('get_dashboard_sections',)
 
+STAFF = 'staff'
+COMRADE = 'comrade'
+
+def for_roles(*roles):
+    """
+    Only run the decorated section for people who have at least one of the
+    given roles (STAFF or COMRADE).
+    """
+    def decorator(section):
+        section.roles = roles
+        return section
+    return decorator
+
+
+class Dashboard(object):
+    """
+    The state shared by all the dashboard sections for one request.
+    """
+
+    def __init__(self, request):
+        self.request = request
+        self.user = request.user
+        self.timeline = RoundTimeline.load()
+        self.today = self.timeline.today
+        self.rounds = self.timeline.rounds
+        self._roles = {}
+
+    @cached_property
+    def comrade(self):
+        try:
+            return self.user.comrade
+        except Comrade.DoesNotExist:
+            return None
+
+    def has_role(self, role):
+        if role == STAFF:
+            return self.user.is_staff
+        if role == COMRADE:
+            return self.comrade is not None
+        raise ValueError("unknown dashboard role {!r}".format(role))
+
+    def latest_round(self, field, condition):
+        return self.timeline.latest(field, condition)
+
+    def earliest_round(self, field, condition):
+        return self.timeline.earliest(field, condition)
+
+    def role(self, current_round):
+        """
+        One Role per round, shared by every section that asks about it.
+        """
+        key = current_round.pk if current_round is not None else None
+        try:
+            return self._roles[key]
+        except KeyError:
+            role = Role(self.user, current_round, today=self.today)
+            self._roles[key] = role
+            return role
+
+    def cache_key(self, section):
+        return 'dashboard:{}:{}:{}:{}:{}'.format(
+            get_cache_generation(DASHBOARD_GENERATION_KEY),
+            self.today,
+            self.user.pk,
+            self.user.is_staff,
+            section.__name__,
+        )
+
+    def get_section(self, section):
+        roles = getattr(section, 'roles', None)
+        if roles is not None and not any(self.has_role(role) for role in roles):
+            return None
+
+        key = self.cache_key(section)
+        cached = cache.get(key)
+        if cached is not None:
+            return cached[0]
+
+        context = section(self)
+        # Wrap the context so that sections which are skipped get cached too.
+        cache.set(key, (context,))
+        return context
+
+
 def get_dashboard_sections(request):
+    dashboard = Dashboard(request)
     sections = []
     for section in DASHBOARD_SECTIONS:
-        context = section(request)
+        context = dashboard.get_section(section)
         if context:
             template_name = "home/dashboard/{}.html".format(section.__name__)
             sections.append((template_name, context))
     return sections
 
 
-def intern_announcement(request):
-    now = datetime.datetime.now(datetime.timezone.utc)
-    today = get_deadline_date_for(now)
-    try:
-        # Find the newest round whose intern announcement date has passed.
-        current_round = RoundPage.objects.filter(
-            internannounce__lte=today,
-        ).latest('internannounce')
-    except RoundPage.DoesNotExist:
+@for_roles(STAFF, COMRADE)
+def intern_announcement(dashboard):
+    today = dashboard.today
+
+    # Find the newest round whose intern announcement date has passed.
+    current_round = dashboard.latest_round('internannounce',
+        lambda r: r.internannounce <= today)
+    if current_round is None:
         return None
 
     # Hide this message once the next round starts, where "starts" is defined
     # by pingnew, and "next round" means it has a later intern announcement
     # date than this one.
-    later_open_rounds = RoundPage.objects.filter(
-        pingnew__lte=today,
-        internannounce__gt=current_round.internannounce,
-    )
-    if later_open_rounds.exists():
+    later_open_rounds = [r for r in dashboard.rounds
+        if r.pingnew <= today and r.internannounce > current_round.internannounce]
+    if later_open_rounds:
         return None
 
+    role = dashboard.role(current_round)
     roles = []
-    if current_round.is_coordinator(request.user):
+    if role.is_coordinator:
         roles.append("coordinator")
-    if current_round.is_mentor(request.user):
+    if role.is_mentor:
         roles.append("mentor")
-    if request.user.is_staff:
+    if dashboard.user.is_staff:
         roles.append("organizer")
 
     if not roles:
@@ -91,43 +190,32 @@ def intern_announcement(request):
     }
 
 
-def coordinator_reminder(request):
-    now = datetime.datetime.now(datetime.timezone.utc)
-    today = get_deadline_date_for(now)
-
+@for_roles(COMRADE)
+def coordinator_reminder(dashboard):
     # It's possible that some intern selections may not work out, and a mentor
     # will have to select another intern after the intern announcement date.
     # Show coordinator's communities until the day after their mentors' interns
     # start.
-    try:
-        current_round = RoundPage.objects.filter(
-            internstarts__gt=today,
-        ).earliest('internstarts')
-    except RoundPage.DoesNotExist:
+    current_round = dashboard.timeline.upcoming_round()
+    if current_round is None:
         return None
 
-    role = Role(request.user, current_round)
+    role = dashboard.role(current_round)
     if not role.approved_coordinator_communities:
         return None
 
     return role
 
 
-def application_summary(request):
-    now = datetime.datetime.now(datetime.timezone.utc)
-    today = get_deadline_date_for(now)
-    try:
-        current_round = RoundPage.objects.get(
-            appsopen__lte=today,
-            internannounce__gt=today,
-        )
-    except RoundPage.DoesNotExist:
+@for_roles(STAFF, COMRADE)
+def application_summary(dashboard):
+    today = dashboard.today
+    current_round = dashboard.latest_round('appsopen',
+        lambda r: r.appsopen <= today < r.internannounce)
+    if current_round is None:
         return None
 
-    try:
-        if not request.user.is_staff and not current_round.is_reviewer(request.user):
-            return None
-    except Comrade.DoesNotExist:
+    if not dashboard.user.is_staff and not dashboard.role(current_round).is_reviewer:
         return None
 
     pending_revisions_count = ApplicantApproval.objects.filter(
@@ -157,10 +245,11 @@ def application_summary(request):
     }
 
 
-def staff_subscriptions(request):
+@for_roles(STAFF)
+def staff_subscriptions(dashboard):
     # This template doesn't need any data, it just needs to be
     # hidden for non-staff.
-    return request.user.is_staff
+    return True
 
 
 # This is a list of all reminders that staff need at different times in the
@@ -197,12 +286,9 @@ all_round_events = (
     ('midfeedback', datetime.timedelta(weeks=-1), 'midpoint-feedback-instructions', datetime.timedelta(weeks=5)),
 )
 
-def round_events(request):
-    if not request.user.is_staff:
-        return None
-
-    now = datetime.datetime.now(datetime.timezone.utc)
-    today = get_deadline_date_for(now)
+@for_roles(STAFF)
+def round_events(dashboard):
+    today = dashboard.today
 
     # How long before and after the ideal date should we display each reminder?
     early = datetime.timedelta(weeks=2)
@@ -219,12 +305,8 @@ def round_events(request):
         #   target = field + delta
         #   target >= today - early
         #   target <= today + duration + late
-        # but we can only query against field, so we do a little algebra to
-        # shift the rest of each left-hand side over to the right.
-        rounds = RoundPage.objects.filter(**{
-            field + '__gte': today - delta - early,
-            field + '__lte': today - delta + duration + late,
-        })
+        rounds = [r for r in dashboard.rounds
+            if today - early <= getattr(r, field) + delta <= today + duration + late]
 
         for current_round in rounds:
             events.append({
@@ -242,62 +324,34 @@ def round_events(request):
         }
 
 
-def sponsor_statistics(request):
-    if not request.user.is_staff:
-        return None
+@for_roles(STAFF)
+def sponsor_statistics(dashboard):
+    return dashboard.latest_round('appsopen',
+        lambda r: r.appsopen <= dashboard.today)
 
-    now = datetime.datetime.now(datetime.timezone.utc)
-    today = get_deadline_date_for(now)
-    try:
-        return RoundPage.objects.filter(
-            appsopen__lte=today,
-        ).latest('appsopen')
-    except RoundPage.DoesNotExist:
-        return None
 
+@for_roles(STAFF)
+def staff_intern_progress(dashboard):
+    today = dashboard.today
+    return dashboard.latest_round('initialfeedback',
+        lambda r: r.initialfeedback <= today + datetime.timedelta(days=7)
+            and r.finalfeedback > today - datetime.timedelta(days=30))
 
-def staff_intern_progress(request):
-    if not request.user.is_staff:
-        return None
 
-    now = datetime.datetime.now(datetime.timezone.utc)
-    today = get_deadline_date_for(now)
-    try:
-        return RoundPage.objects.get(
-            initialfeedback__lte=today + datetime.timedelta(days=7),
-            finalfeedback__gt=today - datetime.timedelta(days=30),
-        )
-    except RoundPage.DoesNotExist:
-        return None
+@for_roles(STAFF)
+def staff_intern_selection(dashboard):
+    today = dashboard.today
+    return dashboard.latest_round('appsopen',
+        lambda r: r.appsopen <= today
+            and r.initialfeedback > today + datetime.timedelta(days=7))
 
 
-def staff_intern_selection(request):
-    if not request.user.is_staff:
-        return None
-
-    now = datetime.datetime.now(datetime.timezone.utc)
-    today = get_deadline_date_for(now)
-    try:
-        return RoundPage.objects.get(
-            appsopen__lte=today,
-            initialfeedback__gt=today + datetime.timedelta(days=7),
-        )
-    except RoundPage.DoesNotExist:
-        return None
-
-
-def staff_community_progress(request):
-    if not request.user.is_staff:
-        return None
-
-    now = datetime.datetime.now(datetime.timezone.utc)
-    today = get_deadline_date_for(now)
-    try:
-        current_round = RoundPage.objects.get(
-            appsopen__lte=today,
-            internannounce__gt=today,
-        )
-    except RoundPage.DoesNotExist:
+@for_roles(STAFF)
+def staff_community_progress(dashboard):
+    today = dashboard.today
+    current_round = dashboard.latest_round('appsopen',
+        lambda r: r.appsopen <= today < r.internannounce)
+    if current_round is None:
         return None
 
     pending_participations = Participation.objects.filter(
@@ -317,11 +371,9 @@ def staff_community_progress(request):
     }
 
 
-def selected_intern(request):
-    try:
-        intern_selection = request.user.comrade.get_intern_selection()
-    except Comrade.DoesNotExist:
-        return None
+@for_roles(COMRADE)
+def selected_intern(dashboard):
+    intern_selection = dashboard.comrade.get_intern_selection()
     if not intern_selection:
         return None
 
@@ -335,27 +387,22 @@ def selected_intern(request):
     return intern_selection
 
 
-def intern(request):
+@for_roles(COMRADE)
+def intern(dashboard):
     # TODO: move this function somewhere common
     # or TODO: merge with selected_intern above
     # This import can't be at top-level because views.py imports this
     # file so that would be a circular dependency.
     from .views import intern_in_good_standing
-    return intern_in_good_standing(request.user)
+    return intern_in_good_standing(dashboard.user)
 
 
-def eligibility_prompts(request):
-    now = datetime.datetime.now(datetime.timezone.utc)
-    today = get_deadline_date_for(now)
-    try:
-        current_round = RoundPage.objects.get(
-            appsopen__lte=today,
-            appslate__gt=today,
-        )
-    except RoundPage.DoesNotExist:
+def eligibility_prompts(dashboard):
+    current_round = dashboard.timeline.application_round()
+    if current_round is None:
         return None
 
-    role = Role(request.user, current_round)
+    role = dashboard.role(current_round)
 
     return {
         'current_round': current_round,
@@ -363,7 +410,8 @@ def eligibility_prompts(request):
     }
 
 
-def unselected_intern(request):
+@for_roles(COMRADE)
+def unselected_intern(dashboard):
     """
     Display a message for people who filled out the eligibility form
     but didn't get selected. But only display it once the
@@ -371,13 +419,12 @@ def unselected_intern(request):
     away a few weeks later when the selected interns start working on
     their internships.
     """
-    now = datetime.datetime.now(datetime.timezone.utc)
-    today = get_deadline_date_for(now)
+    today = dashboard.today
     try:
         return ApplicantApproval.objects.exclude(
             internselection__organizer_approved=True,
         ).get(
-            applicant__account=request.user,
+            applicant=dashboard.comrade,
             application_round__internannounce__lte=today,
             application_round__internstarts__gte=today,
         )
@@ -385,28 +432,21 @@ def unselected_intern(request):
         return None
 
 
-def mentor(request):
-    return MentorRelationship.objects.filter(mentor__mentor__account=request.user)
+@for_roles(COMRADE)
+def mentor(dashboard):
+    return MentorRelationship.objects.filter(mentor__mentor=dashboard.comrade)
 
 
-def mentor_projects(request):
-    try:
-        comrade = request.user.comrade
-    except Comrade.DoesNotExist:
-        return None
-
-    now = datetime.datetime.now(datetime.timezone.utc)
-    today = get_deadline_date_for(now)
+@for_roles(COMRADE)
+def mentor_projects(dashboard):
+    comrade = dashboard.comrade
 
     # It's possible that some intern selections may not work out,
     # and a mentor will have to select another intern
     # after the intern announcement date.
     # Show their project until the day after their intern starts.
-    try:
-        current_round = RoundPage.objects.filter(
-            internstarts__gt=today,
-        ).earliest('internstarts')
-    except RoundPage.DoesNotExist:
+    current_round = dashboard.timeline.upcoming_round()
+    if current_round is None:
         return None
 
     # Get all projects where they're an approved mentor
@@ -439,7 +479,8 @@ def mentor_projects(request):
     }
 
 
-def approval_status(request):
+@for_roles(STAFF, COMRADE)
+def approval_status(dashboard):
     """
     Find objects for which the current user is either an approver or a
     submitter, and list them all in one place.
@@ -447,7 +488,7 @@ def approval_status(request):
     by_status = defaultdict(list)
     for model in DASHBOARD_MODELS:
         by_model = defaultdict(list)
-        for obj in model.objects_for_dashboard(request.user).distinct():
+        for obj in model.objects_for_dashboard(dashboard.user).distinct():
             if obj.approval_status == ApprovalStatus.APPROVED or not has_deadline_passed(obj.submission_and_approval_deadline()):
                 by_model[obj.approval_status].append(obj)
 
@@ -1,37 +1,144 @@
-from django.core.mail import send_mail
+from django.core.mail import EmailMessage, get_connection, send_mail
+from django.core.mail.backends.base import BaseEmailBackend
 from django.core.signing import TimestampSigner
-from django.db import transaction
+from django.db import IntegrityError, transaction
 from django.template import TemplateDoesNotExist
+from django.template.context import make_context
 from django.template.loader import get_template
 from django.test import override_settings, RequestFactory
 from email.headerregistry import Address
+import hashlib
+from itertools import chain
 import logging
+import multiprocessing
 
 logger = logging.getLogger(__name__)
 
 organizers = Address("Outreachy Organizers", "organizers", "outreachy.org")
 applicant_help = Address("Outreachy Applicant Helpers", "applicant-help", "outreachy.org")
 
-def send_template_mail(template_name, context, recipient_list, request=None, **kwargs):
-    # Only load the template once, no matter how many messages we're sending.
-    template = get_template(template_name, using='plaintext')
-    for recipient in recipient_list:
-        # Templates used with this function expect the 'recipient' context
-        # variable to contain a single address, not a list, so override
-        # send_group_template_mail's default.
-        context['recipient'] = recipient
-        send_group_template_mail(template, context, [recipient], request, **kwargs)
+class OutboxEmailBackend(BaseEmailBackend):
+    """
+    Email backend that saves messages as OutboundEmail rows for the
+    deliveroutbox command to send, instead of talking to the mail server
+    during the web request.
 
-def send_group_template_mail(template, context, recipient_list, request=None, **kwargs):
+    If the connection is created with an idempotency_key, such as a token
+    from the form that was submitted, then queueing the same message again
+    with the same key does nothing:
+
+        with mail.get_connection(idempotency_key=token) as connection:
+            ...
+    """
+
+    def __init__(self, idempotency_key=None, **kwargs):
+        super(OutboxEmailBackend, self).__init__(**kwargs)
+        self.idempotency_key = idempotency_key
+
+    def message_key(self, message):
+        if not self.idempotency_key:
+            return None
+        key = hashlib.sha256()
+        for part in [self.idempotency_key, message.subject, message.body] + message.recipients():
+            key.update(str(part).encode('utf-8'))
+            key.update(b'\0')
+        return key.hexdigest()
+
+    def send_messages(self, email_messages):
+        from .models import OutboundEmail # oops, circular import dependency :-(
+        count = 0
+        for message in email_messages:
+            try:
+                # A savepoint, so a duplicate key doesn't spoil the
+                # surrounding request's transaction.
+                with transaction.atomic():
+                    OutboundEmail.from_message(message, self.message_key(message)).save()
+            except IntegrityError:
+                logger.info("not queueing duplicate message %r", message.subject)
+                continue
+            count += 1
+        return count
+
+class MessageRequest(object):
+    """
+    The parts of a request that email templates use, in a form that can be
+    sent to another process.
+    """
+
+    def __init__(self, request):
+        self.scheme = request.scheme
+        self.host = request.get_host()
+
+    def get_host(self):
+        return self.host
+
+def render_messages(template, context, overlays, request=None):
+    """
+    Render the template once for each overlay, a dict of context variables
+    for one message layered over the shared context, and return a list of
+    (subject, body) pairs. The first line of the rendered template is the
+    subject.
+    """
     # Load the specified template name unless it's already a Template object.
     if not hasattr(template, 'render'):
         template = get_template(template, using='plaintext')
+    template = template.template
+
+    # Build the context once and push each message's variables on top of
+    # it, instead of copying or changing the caller's dict.
+    context = make_context(context, request, autoescape=template.engine.autoescape)
+    messages = []
+    for overlay in overlays:
+        with context.push(overlay):
+            message = template.render(context).strip()
+        subject, body = message.split('\n', 1)
+        messages.append((subject.strip(), body.strip()))
+    return messages
+
+def render_template_mail(template_name, context, overlays, request=None, processes=None):
+    """
+    Like render_messages, but if processes is given, split the work across
+    that many worker processes. Everything in the context and overlays must
+    be picklable, and must already be loaded from the database: the workers
+    are forked from this process and must not use its database connection.
+    """
+    if not processes or len(overlays) < 2:
+        return render_messages(template_name, context, overlays, request)
+
+    if request is not None:
+        request = MessageRequest(request)
+    chunk_size = max(1, len(overlays) // (processes * 4))
+    chunks = [
+        (template_name, context, overlays[i:i + chunk_size], request)
+        for i in range(0, len(overlays), chunk_size)
+    ]
+    with multiprocessing.get_context('fork').Pool(processes) as pool:
+        return list(chain.from_iterable(pool.starmap(render_messages, chunks)))
+
+def send_bulk_template_mail(template_name, context, overlays, request=None, processes=None, connection=None, **kwargs):
+    """
+    Send one message per overlay, each to the overlay's 'recipient'.
+    """
+    messages = render_template_mail(template_name, context, overlays, request, processes)
+    kwargs.setdefault('from_email', organizers)
+    connection = connection or get_connection()
+    return connection.send_messages([
+        EmailMessage(subject=subject, body=body, to=[overlay['recipient']], connection=connection, **kwargs)
+        for (subject, body), overlay in zip(messages, overlays)
+    ])
+
+def send_template_mail(template_name, context, recipient_list, request=None, **kwargs):
+    # Templates used with this function expect the 'recipient' context
+    # variable to contain a single address, not a list, so override
+    # send_group_template_mail's default.
+    overlays = [{'recipient': recipient} for recipient in recipient_list]
+    send_bulk_template_mail(template_name, context, overlays, request, **kwargs)
 
-    context.setdefault('recipient', recipient_list)
-    message = template.render(context, request).strip()
-    subject, body = message.split('\n', 1)
+def send_group_template_mail(template, context, recipient_list, request=None, **kwargs):
+    overlay = {} if 'recipient' in context else {'recipient': recipient_list}
+    [(subject, body)] = render_messages(template, context, [overlay], request)
     kwargs.setdefault('from_email', organizers)
-    send_mail(message=body.strip(), subject=subject.strip(), recipient_list=recipient_list, **kwargs)
+    send_mail(message=body, subject=subject, recipient_list=recipient_list, **kwargs)
 
 def approval_status_changed(obj, request, **kwargs):
     get_recipients = {
@@ -169,28 +276,32 @@ def applicant_school_info_needs_updated(applicant, request):
         from_email=applicant_help,
         recipient_list=[applicant.email_address()])
 
-def contributor_deadline_reminder(contributor, current_round, request, **kwargs):
+def contributor_overlays(applications):
     from .models import Role # oops, circular import dependency :-(
-    send_template_mail('home/email/contributors-deadline-reminder.txt', {
+    return [
+        {
+            'role': role,
+            'timezone': role.application.applicant.timezone,
+            'comrade': role.application.applicant,
+            'recipient': role.application.applicant.email_address(),
+        }
+        for role in Role.for_applications(applications)
+    ]
+
+def contributor_deadline_reminder(applications, current_round, request, **kwargs):
+    send_bulk_template_mail('home/email/contributors-deadline-reminder.txt', {
         'current_round': current_round,
-        'role': Role(contributor.account, current_round),
-        'timezone': contributor.timezone,
-        'comrade': contributor,
         },
+        contributor_overlays(applications),
         request=request,
-        recipient_list=[contributor.email_address()],
         **kwargs)
 
-def contributor_application_period_ended(contributor, current_round, request, **kwargs):
-    from .models import Role # oops, circular import dependency :-(
-    send_template_mail('home/email/contributors_application_period_ended.txt', {
+def contributor_application_period_ended(applications, current_round, request, **kwargs):
+    send_bulk_template_mail('home/email/contributors_application_period_ended.txt', {
         'current_round': current_round,
-        'role': Role(contributor.account, current_round),
-        'timezone': contributor.timezone,
-        'comrade': contributor,
         },
+        contributor_overlays(applications),
         request=request,
-        recipient_list=[contributor.email_address()],
         **kwargs)
 
 def notify_accepted_intern(intern_selection, request, **kwargs):
@@ -286,6 +397,7 @@ def message_samples():
     """
 
     from . import factories
+    from .models import ApplicantApproval
 
     logging.basicConfig(level=logging.INFO)
 
@@ -303,7 +415,6 @@ def message_samples():
     applicantapproval = intern_selection.applicant
     applicant = applicantapproval.applicant
     factories.ContributionFactory(round=current_round, applicant=applicantapproval, project=project)
-    contributor = applicant
 
     objects = (
         (coordinatorapproval, {}),
@@ -337,8 +448,9 @@ def message_samples():
     # TODO: applicant_deadline_reminder
     applicant_essay_needs_updated(applicant, request)
     applicant_school_info_needs_updated(applicant, request)
-    contributor_deadline_reminder(contributor, current_round, request)
-    contributor_application_period_ended(contributor, current_round, request)
+    contributors = ApplicantApproval.objects.filter(pk=applicantapproval.pk)
+    contributor_deadline_reminder(contributors, current_round, request)
+    contributor_application_period_ended(contributors, current_round, request)
     notify_accepted_intern(intern_selection, request)
     for week in ('one', 'three', 'five'):
         template = 'home/email/internship-week-{}.txt'.format(week)
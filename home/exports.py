@@ -0,0 +1,88 @@
+import csv
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import prefetch_related_objects
+from django.http import StreamingHttpResponse
+from itertools import chain, islice
+import json
+
+def iterate_in_chunks(queryset, prefetch=(), prepare=None, chunk_size=500):
+    """
+    Iterate over a queryset without caching every row, the way .iterator()
+    does, but still follow the prefetch lookups: for each chunk of rows, do
+    one query per lookup, then call prepare(chunk) if given so the caller
+    can load anything else it needs for that chunk. Memory use depends on
+    the chunk size, not on the size of the queryset.
+    """
+    iterator = queryset.iterator()
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        if prefetch:
+            prefetch_related_objects(chunk, *prefetch)
+        if prepare is not None:
+            prepare(chunk)
+        yield from chunk
+
+def json_array(rows):
+    yield '['
+    separator = '\n'
+    for row in rows:
+        yield separator + json.dumps(row, cls=DjangoJSONEncoder)
+        separator = ',\n'
+    yield '\n]\n'
+
+def json_lines(rows):
+    for row in rows:
+        yield json.dumps(row, cls=DjangoJSONEncoder) + '\n'
+
+class Echo(object):
+    """
+    A file-like object for csv.writer that hands back each line instead of
+    storing it.
+    """
+    def write(self, value):
+        return value
+
+def csv_rows(rows, fields=None):
+    writer = csv.writer(Echo())
+    rows = iter(rows)
+    if fields is None:
+        try:
+            first = next(rows)
+        except StopIteration:
+            return
+        fields = list(first)
+        rows = chain([first], rows)
+    yield writer.writerow(fields)
+    for row in rows:
+        yield writer.writerow([csv_value(row.get(field)) for field in fields])
+
+def csv_value(value):
+    # CSV cells can't hold lists or dicts, like the mentors in a contract
+    # export, so write those as JSON.
+    if isinstance(value, (list, dict)):
+        return json.dumps(value, cls=DjangoJSONEncoder)
+    return value
+
+FORMATS = {
+    'json': ('application/json', '.json', json_array),
+    'jsonl': ('application/x-ndjson', '.jsonl', json_lines),
+    'csv': ('text/csv', '.csv', csv_rows),
+}
+
+def export_response(request, rows, filename, fields=None):
+    """
+    Stream rows, which should be dicts generated one at a time, as a
+    download. The format comes from the request's ?format= parameter: a
+    JSON array (the default), JSON Lines, or CSV, with columns in the order
+    of fields if given or else of the first row's keys.
+    """
+    content_type, extension, serialize = FORMATS.get(request.GET.get('format'), FORMATS['json'])
+    if serialize is csv_rows:
+        content = csv_rows(rows, fields)
+    else:
+        content = serialize(rows)
+    response = StreamingHttpResponse(content, content_type=content_type)
+    response['Content-Disposition'] = 'attachment; filename="' + filename + extension + '"'
+    return response
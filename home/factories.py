@@ -61,6 +61,10 @@ class PageFactory(factory.Factory):
         obj = model_class(*args, **kwargs)
         return parent.add_child(instance=obj)
 
+class BlogIndexFactory(PageFactory):
+    class Meta:
+        model = models.BlogIndex
+
 round_dates = (
     'pingold',
     'orgreminder',
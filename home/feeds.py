@@ -1,6 +1,58 @@
 from django.contrib.syndication.views import Feed
+from django.core.cache import cache
 from django.core.exceptions import ObjectDoesNotExist
+from django.http import HttpResponse
+from django.urls import reverse
+from django.utils.cache import get_conditional_response
 from django.utils.feedgenerator import Atom1Feed
+from django.utils.http import http_date, parse_http_date_safe, quote_etag
+import hashlib
+import time
+
+def cached_feed_response(request, key, generation, render):
+    """
+    Feed readers poll constantly, so keep the response from render() in the
+    cache under key and generation, and answer pollers that have already
+    seen it with 304 Not Modified. The generation should change whenever
+    the feed would.
+    """
+    cache_key = '{}:{}'.format(key, generation)
+    cached = cache.get(cache_key)
+    if cached is None:
+        response = render()
+        cached = {
+            'content': response.content,
+            'content_type': response['Content-Type'],
+            'etag': quote_etag(hashlib.md5(response.content).hexdigest()),
+        }
+        # Feed sets Last-Modified from the newest updated date among the
+        # items, if there are any. That goes backwards when the newest item
+        # is taken out, and pollers that only send If-Modified-Since would
+        # never see the change, so it has to be at least as new as the last
+        # version we served, and newer if the content changed since then.
+        last_modified = parse_http_date_safe(response.get('Last-Modified', ''))
+        previous = cache.get(key + ':last-modified')
+        if previous is not None:
+            if previous['etag'] == cached['etag']:
+                last_modified = max(last_modified or 0, previous['last_modified'] or 0) or None
+            elif last_modified is None or last_modified <= (previous['last_modified'] or 0):
+                # HTTP dates only count whole seconds.
+                last_modified = max(int(time.time()), (previous['last_modified'] or 0) + 1)
+        cached['last_modified'] = last_modified
+        cache.set(cache_key, cached)
+        cache.set(key + ':last-modified', {
+            'etag': cached['etag'],
+            'last_modified': last_modified,
+        }, None)
+
+    response = get_conditional_response(request,
+            etag=cached['etag'], last_modified=cached['last_modified'])
+    if response is None:
+        response = HttpResponse(cached['content'], content_type=cached['content_type'])
+    response['ETag'] = cached['etag']
+    if cached['last_modified']:
+        response['Last-Modified'] = http_date(cached['last_modified'])
+    return response
 
 class FullHistoryFeed(Atom1Feed):
     """
@@ -32,7 +84,11 @@ class WagtailFeed(Feed):
         return obj.full_url
 
     def items(self, obj):
-        return obj.get_children().live().order_by('-first_published_at')
+        # Join in each post's author so item_author_name doesn't need a
+        # query per post.
+        return obj.get_children().live().select_related(
+                'owner__comrade',
+                ).order_by('-first_published_at')
 
     def item_title(self, item):
         return item.title
@@ -53,3 +109,114 @@ class WagtailFeed(Feed):
 
     def item_updateddate(self, item):
         return item.last_published_at
+
+class ArchivedFeed(Atom1Feed):
+    """
+    Use this feed type for one document of an archived feed, as specified
+    in RFC5005 ("Feed Paging and Archiving"), section 4 ("Archived
+    Feeds"). The subscription document has the most recent entries and
+    links to the newest archive document; each archive document is marked
+    with <fh:archive/> and links to the archive before it. Pass the link
+    targets as current_url and prev_archive_url, and archive=True for
+    archive documents.
+    """
+
+    def root_attributes(self):
+        attrs = super(ArchivedFeed, self).root_attributes()
+        attrs['xmlns:fh'] = 'http://purl.org/syndication/history/1.0'
+        return attrs
+
+    def add_root_elements(self, handler):
+        super(ArchivedFeed, self).add_root_elements(handler)
+        if self.feed.get('archive'):
+            handler.addQuickElement('fh:archive')
+        for rel in ('current', 'prev-archive'):
+            href = self.feed.get(rel.replace('-', '_') + '_url')
+            if href:
+                handler.addQuickElement('link', '', {'rel': rel, 'href': href})
+
+class WagtailArchivedFeed(WagtailFeed):
+    """
+    An archived feed of a page's children. The object is a (page, number)
+    pair, where number is None for the subscription document, or counts
+    archive documents from the oldest, starting at 1. The page decides
+    which posts go in each document and where archive documents live.
+    """
+    feed_type = ArchivedFeed
+
+    def get_object(self, request, page, number=None):
+        return page, number
+
+    def title(self, obj):
+        page, number = obj
+        return page.title
+
+    def link(self, obj):
+        page, number = obj
+        return page.full_url
+
+    def feed_url(self, obj):
+        page, number = obj
+        if number is None:
+            return None
+        return page.get_feed_archive_url(number)
+
+    def feed_extra_kwargs(self, obj):
+        page, number = obj
+        if number is None:
+            prev_archive = page.get_feed_archive_count()
+        else:
+            prev_archive = number - 1
+        return {
+            'archive': number is not None,
+            'current_url': page.full_url + page.reverse_subpage('feed'),
+            'prev_archive_url': prev_archive and page.get_feed_archive_url(prev_archive),
+        }
+
+    def items(self, obj):
+        page, number = obj
+        return page.get_feed_posts(number)
+
+class PlanetFeed(Feed):
+    """
+    The newest posts from all the intern blogs that fetchplanet collects.
+    The object is the queryset of posts to show.
+    """
+    feed_type = Atom1Feed
+    title = "Outreachy intern blogs"
+    subtitle = "Posts from the blogs of Outreachy interns"
+
+    def get_object(self, request, posts):
+        return posts
+
+    def link(self):
+        return reverse('planet')
+
+    def items(self, posts):
+        return posts
+
+    def item_title(self, post):
+        return post.title
+
+    def item_description(self, post):
+        return post.summary
+
+    def item_link(self, post):
+        return post.link
+
+    def item_guid(self, post):
+        return post.guid
+
+    item_guid_is_permalink = False
+
+    def item_author_name(self, post):
+        return post.blog.comrade.public_name
+
+    def item_author_link(self, post):
+        return post.blog.comrade.blog_url or None
+
+    def item_pubdate(self, post):
+        return post.published
+
+    def item_updateddate(self, post):
+        return post.updated
@@ -0,0 +1,187 @@
+"""
+Full-text search over tables of search documents, using whatever the
+database offers: a GIN index over a weighted tsvector on PostgreSQL, which
+is what we run in production, or an FTS5 table kept in sync by triggers on
+SQLite, which is what most people develop with. On anything else, search
+returns None and callers fall back to substring matches.
+"""
+
+import re
+
+class FullTextIndex(object):
+    """
+    A full-text index over some text columns of one table, which must have
+    an integer primary key. Each column comes with its PostgreSQL weight
+    ('A' through 'D') and its bm25 weight for SQLite, so matches in some
+    columns can rank above matches in others.
+
+    The create and drop methods are meant for RunPython in the migration
+    that adds the table.
+    """
+
+    def __init__(self, table, key, columns):
+        self.table = table
+        self.key = key
+        self.columns = columns
+        self.fts_table = table + '_fts'
+
+    def postgres_vector(self, prefix='d.'):
+        return ' || '.join(
+                "setweight(to_tsvector('english', {}{}), '{}')".format(prefix, column, weight)
+                for column, weight, bm25_weight in self.columns)
+
+    @property
+    def bm25(self):
+        return 'bm25({}, {})'.format(self.fts_table, ', '.join(
+                str(bm25_weight) for column, weight, bm25_weight in self.columns))
+
+    def postgres_setup(self):
+        # PostgreSQL only uses this index for queries that use the same
+        # expression, so build both from postgres_vector.
+        return [
+            'CREATE INDEX {table}_fts ON {table} USING gin (({vector}))'.format(
+                table=self.table, vector=self.postgres_vector(prefix='')),
+        ]
+
+    def postgres_teardown(self):
+        return ['DROP INDEX IF EXISTS {}_fts'.format(self.table)]
+
+    # The FTS5 table doesn't store its own copy of the text; it indexes the
+    # document table, and these triggers tell it when rows change.
+    def sqlite_setup(self):
+        names = ', '.join(column for column, weight, bm25_weight in self.columns)
+        new = ', '.join('new.' + column for column, weight, bm25_weight in self.columns)
+        old = ', '.join('old.' + column for column, weight, bm25_weight in self.columns)
+        statements = (
+            """CREATE VIRTUAL TABLE {fts} USING fts5(
+                {names}, content='{table}', content_rowid='{key}')""",
+            """CREATE TRIGGER {table}_ai AFTER INSERT ON {table} BEGIN
+                INSERT INTO {fts}(rowid, {names}) VALUES (new.{key}, {new});
+            END""",
+            """CREATE TRIGGER {table}_ad AFTER DELETE ON {table} BEGIN
+                INSERT INTO {fts}({fts}, rowid, {names}) VALUES ('delete', old.{key}, {old});
+            END""",
+            """CREATE TRIGGER {table}_au AFTER UPDATE ON {table} BEGIN
+                INSERT INTO {fts}({fts}, rowid, {names}) VALUES ('delete', old.{key}, {old});
+                INSERT INTO {fts}(rowid, {names}) VALUES (new.{key}, {new});
+            END""",
+            "INSERT INTO {fts}({fts}) VALUES ('rebuild')",
+        )
+        return [s.format(fts=self.fts_table, table=self.table, key=self.key, names=names, new=new, old=old)
+                for s in statements]
+
+    def sqlite_teardown(self):
+        return [
+            'DROP TRIGGER IF EXISTS {}_ai'.format(self.table),
+            'DROP TRIGGER IF EXISTS {}_ad'.format(self.table),
+            'DROP TRIGGER IF EXISTS {}_au'.format(self.table),
+            'DROP TABLE IF EXISTS {}'.format(self.fts_table),
+        ]
+
+    def create(self, apps, schema_editor):
+        vendor = schema_editor.connection.vendor
+        if vendor == 'postgresql':
+            statements = self.postgres_setup()
+        elif vendor == 'sqlite':
+            statements = self.sqlite_setup()
+        else:
+            return
+        for statement in statements:
+            schema_editor.execute(statement)
+
+    def drop(self, apps, schema_editor):
+        vendor = schema_editor.connection.vendor
+        if vendor == 'postgresql':
+            statements = self.postgres_teardown()
+        elif vendor == 'sqlite':
+            statements = self.sqlite_teardown()
+        else:
+            return
+        for statement in statements:
+            schema_editor.execute(statement)
+
+    def _query(self, connection, select, query, join, where, params):
+        """
+        Build the SQL for matching query against this index, selecting the
+        select expression with the document table available as 'd'. join
+        and where can narrow down which documents count, using params.
+        The select expression can use {score} for how well each document
+        matches. Returns (sql, params), or None if this database has no
+        full-text index.
+        """
+        if connection.vendor == 'postgresql':
+            sql = 'SELECT {select} FROM {table} d {join}, plainto_tsquery(\'english\', %s) q WHERE {vector} @@ q'
+            score = 'ts_rank({}, q)'.format(self.postgres_vector())
+            query_param = query
+        elif connection.vendor == 'sqlite':
+            sql = 'SELECT {select} FROM {fts} JOIN {table} d ON d.{key} = {fts}.rowid {join} WHERE {fts} MATCH %s'
+            # bm25() scores better matches lower, so flip the sign to rank
+            # like PostgreSQL does.
+            score = '-' + self.bm25
+            query_param = fts5_query(query)
+        else:
+            return None
+        if where:
+            sql += ' AND (' + where + ')'
+        sql = sql.format(select=select.format(score=score), table=self.table, fts=self.fts_table,
+                key=self.key, join=join, vector=self.postgres_vector())
+        return sql, [query_param] + list(params)
+
+    def search(self, connection, query, limit, offset=0, join='', where='', params=()):
+        """
+        Return up to limit (key, score) pairs for documents that match the
+        query, best match first, skipping the first offset of them.
+        Returns None if this database has no full-text index, so the
+        caller can fall back to something slower.
+        """
+        if not search_terms(query):
+            return []
+        # FTS5 tables have a hidden column called rank, so call it score.
+        built = self._query(connection, 'd.{key}, {{score}} AS score'.format(key=self.key),
+                query, join, where, params)
+        if built is None:
+            return None
+        sql, params = built
+        sql += ' ORDER BY score DESC, d.{} LIMIT %s OFFSET %s'.format(self.key)
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params + [limit, offset])
+            return cursor.fetchall()
+
+    def count(self, connection, query, join='', where='', params=()):
+        """
+        Return how many documents match the query, or None if this
+        database has no full-text index.
+        """
+        if not search_terms(query):
+            return 0
+        built = self._query(connection, 'COUNT(*)', query, join, where, params)
+        if built is None:
+            return None
+        sql, params = built
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            return cursor.fetchone()[0]
+
+def search_terms(query):
+    return re.findall(r'\w+', query)
+
+def fts5_query(query):
+    # Quote each word so punctuation in what people type, like the '@' in
+    # an email address, can't be read as FTS5 query syntax. Quoted words
+    # with nothing between them must all match.
+    return ' '.join('"{}"'.format(term) for term in search_terms(query))
+
+# Names, usernames, email addresses and school names are in the 'people'
+# column and count for more than words in the 'essays' column.
+APPLICATIONS = FullTextIndex('home_applicationsearchdocument', 'application_id', (
+        ('people', 'A', 10.0),
+        ('essays', 'D', 1.0),
+        ))
+
+# Titles count for more than descriptions, which count for more than the
+# rest of the text.
+SITE = FullTextIndex('search_sitesearchdocument', 'id', (
+        ('title', 'A', 10.0),
+        ('description', 'B', 4.0),
+        ('body', 'D', 1.0),
+        ))
@@ -0,0 +1,154 @@
+# Having a text location field was a disaster. These tables turn the
+# free-text locations people have entered, plus their timezone, into a city
+# and country we can count. They're built once, when the module is loaded.
+
+from .bulk import update_computed_fields
+
+US_STATE_ABBREVIATIONS = frozenset([
+        'AL', 'AK', 'AZ', 'AR', 'CA', 'CO', 'CT', 'DE', 'FL', 'GA', 'HI', 'ID',
+        'IL', 'IN', 'IA', 'KS', 'KY', 'LA', 'ME', 'MD', 'MA', 'MI', 'MN', 'MS',
+        'MO', 'MT', 'NE', 'NV', 'NH', 'NJ', 'NM', 'NY', 'NC', 'ND', 'OH', 'OK',
+        'OR', 'PA', 'RI', 'SC', 'SD', 'TN', 'TX', 'UT', 'VT', 'VA', 'WA', 'WV',
+        'WI', 'WY', 'AS', 'DC', 'FM', 'GU', 'MH', 'MP', 'PW', 'PR', 'VI',
+        ])
+
+US_STATES = frozenset([
+        'alabama', 'alaska', 'arizona', 'arkansas', 'california', 'colorado',
+        'connecticut', 'delaware', 'florida', 'georgia', 'hawaii', 'idaho',
+        'illinois', 'indiana', 'iowa', 'kansas', 'kentucky', 'louisiana',
+        'maine', 'maryland', 'massachusetts', 'michigan', 'minnesota',
+        'mississippi', 'missouri', 'montana', 'nebraska', 'nevada',
+        'new hampshire', 'new jersey', 'new mexico', 'new york',
+        'north carolina', 'north dakota', 'ohio', 'oklahoma', 'oregon',
+        'pennsylvania', 'rhode island', 'south carolina', 'south dakota',
+        'tennessee', 'texas', 'utah', 'vermont', 'virginia', 'washington',
+        'west virginia', 'wisconsin', 'wyoming', 'american samoa',
+        'district of columbia', 'federated states of micronesia', 'guam',
+        'marshall islands', 'northern mariana islands', 'palau', 'puerto rico',
+        'virgin islands',
+        ])
+
+# Other ways people spell the last, country part of their location.
+COUNTRY_ALIASES = dict(
+        [(state, 'usa') for state in US_STATES] + [
+        ('united states', 'usa'),
+        ('united states of america', 'usa'),
+        ('us', 'usa'),
+        ('india.', 'india'),
+        ('delhi and india', 'india'),
+        ])
+
+def _cities(country, *cities):
+    return [(city, country) for city in cities]
+
+# Locations that are just a city (or a country) with no comma-separated
+# country after it.
+CITY_COUNTRIES = dict(
+        _cities('argentina', 'buenos aires') +
+        _cities('brazil', 'brazil', 'brasil') +
+        _cities('cameroon', 'yaounde') +
+        # There's a Vancouver, WA, but it's more likely to be Canada
+        _cities('canada', 'vancouver', 'canada') +
+        _cities('egypt', 'egypt') +
+        _cities('germany', 'berlin') +
+        _cities('india', 'india', 'india.', 'new delhi', 'hyderabad',
+            'bangalore', 'delhi', 'mumbai', 'chennai', 'noida', 'kerala',
+            'pune', 'jaipur', 'maharashtra', 'new delhi india', 'bengaluru') +
+        _cities('israel', 'israel') +
+        _cities('kenya', 'mombasa', 'nairobi', 'kenya') +
+        _cities('mexico', 'mexico city', 'mexico') +
+        _cities('nigeria', 'port harcourt', 'ibadan', 'nigeria') +
+        # technically there's a saint petersberg FL, but it's more likely to be Russia
+        _cities('russia', 'moscow', 'saint petersburg', 'saint-petersburg', 'russia') +
+        _cities('turkey', 'istanbul', 'turkey') +
+        _cities('united arab emirates', 'kazakhstan', 'united arab emirates') +
+        _cities('usa', 'boston', 'los angeles', 'san francisco',
+            'new york city', 'united states', 'philadelphia', 'madison') +
+        _cities('usa', *US_STATES)
+        )
+
+# Brazilians like to use dashes instead of commas, so some cities are only
+# recognizable by how the location starts.
+CITY_PREFIX_COUNTRIES = (
+        ('argentina', 'argentina'),
+        ('são paulo', 'brazil'),
+        ('curitiba', 'brazil'),
+        ('lagos', 'nigeria'),
+        )
+
+# If the location doesn't say, the timezone might.
+TIMEZONE_COUNTRIES = dict(
+        [(zone, 'usa') for zone in (
+            'America/Los_Angeles',
+            'America/Chicago',
+            'America/New_York',
+            'US/Eastern',
+            'US/Central',
+            'US/Pacific',
+        )] + [
+        ('America/Argentina/Buenos_Aires', 'argentina'),
+        ('America/Sao_Paulo', 'brazil'),
+        ('America/Toronto', 'canada'),
+        ('Africa/Cairo', 'egypt'),
+        ('Europe/Berlin', 'germany'),
+        ('Africa/Nairobi', 'kenya'),
+        ('Africa/Lagos', 'kenya'),
+        ('Asia/Kolkata', 'india'),
+        ('Indian/Mayotte', 'india'),
+        ('Europe/Rome', 'italy'),
+        ('Europe/Dublin', 'ireland'),
+        ('Indian/Antananarivo', 'madagascar'),
+        ('Europe/Bucharest', 'romania'),
+        ('Europe/Moscow', 'russia'),
+        ('Europe/London', 'uk'),
+        ('Europe/Kiev', 'ukraine'),
+        ])
+
+TIMEZONE_PREFIX_COUNTRIES = (
+        ('Australia', 'australia'),
+        ('Canada', 'canada'),
+        )
+
+def normalize_location(location, timezone=''):
+    """
+    Return the (city, country) for a free-form location, falling back to
+    the name of the person's timezone for the country. Either may be the
+    empty string if we can't tell.
+    """
+    parts = location.split(',')
+    city = parts[0].strip().lower()
+
+    country = ''
+    if len(parts) >= 3:
+        country = parts[-1].strip().lower()
+    elif len(parts) == 2:
+        country = parts[-1].strip().lower()
+        if country.upper() in US_STATE_ABBREVIATIONS:
+            country = 'usa'
+
+    if country:
+        country = COUNTRY_ALIASES.get(country, country)
+    else:
+        country = CITY_COUNTRIES.get(city, '')
+        if not country:
+            for prefix, prefix_country in CITY_PREFIX_COUNTRIES:
+                if city.startswith(prefix):
+                    country = prefix_country
+                    break
+        if not country and timezone:
+            country = TIMEZONE_COUNTRIES.get(timezone, '')
+            if not country:
+                for prefix, prefix_country in TIMEZONE_PREFIX_COUNTRIES:
+                    if timezone.startswith(prefix):
+                        country = prefix_country
+                        break
+
+    return city.title(), country.title()
+
+def update_locations(comrades):
+    """
+    Store normalize_location's answer on every Comrade in the given
+    queryset. Returns how many people changed.
+    """
+    return update_computed_fields(comrades, ('location', 'timezone'), ('city', 'country'),
+            lambda location, timezone: normalize_location(location, getattr(timezone, 'zone', '')))
@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand
+from reversion.models import Version
+from home.models import InitialInternFeedback, InitialMentorFeedback, MidpointInternFeedback, MidpointMentorFeedback
+from home.submitters import backfill_all_submitters
+
+FEEDBACK_MODELS = (
+    InitialMentorFeedback,
+    InitialInternFeedback,
+    MidpointMentorFeedback,
+    MidpointInternFeedback,
+)
+
+class Command(BaseCommand):
+    help = 'Records who submitted each piece of feedback, and when, from its revision history'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            dest='batch_size',
+            help='How many feedback objects to load at once (default: 500)',
+        )
+
+    def handle(self, *args, batch_size, **options):
+        for model in FEEDBACK_MODELS:
+            count, missing = backfill_all_submitters(model, model.submitter_accounts,
+                    Version.objects.get_for_model(model), batch_size)
+            self.stdout.write("{}: updated {}, no submitter revision found for {}".format(
+                model._meta.verbose_name_plural, count, missing))
@@ -0,0 +1,40 @@
+from django.core.management.base import BaseCommand
+from home.models import ApplicantApproval, RoundPage
+
+class Command(BaseCommand):
+    help = 'Computes the stored free period for every initial application'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'round_slugs',
+            nargs='*',
+            metavar='round_slug',
+            help='Only update applications in these rounds (default: all rounds)',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            dest='batch_size',
+            help='How many applications to load at once (default: 500)',
+        )
+
+    def handle(self, *args, round_slugs, batch_size, **options):
+        rounds = RoundPage.objects.order_by('internstarts')
+        if round_slugs:
+            rounds = rounds.filter(slug__in=round_slugs)
+
+        for current_round in rounds:
+            applications = ApplicantApproval.objects.filter(
+                application_round=current_round,
+            ).order_by('pk')
+            count = 0
+            last_pk = 0
+            while True:
+                batch = list(applications.filter(pk__gt=last_pk)[:batch_size])
+                if not batch:
+                    break
+                ApplicantApproval.update_free_periods(batch)
+                count += len(batch)
+                last_pk = batch[-1].pk
+            self.stdout.write("{}: updated {} applications".format(current_round.slug, count))
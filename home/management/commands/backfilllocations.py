@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+from home.models import Comrade, bulk_updated_public_pages
+from home.locations import update_locations
+
+class Command(BaseCommand):
+    help = 'Recomputes the city and country for everyone, after changing home/locations.py'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=5000,
+            dest='batch_size',
+            help='How many people to look at in each batch (default: 5000)',
+        )
+
+    def handle(self, *args, batch_size, **options):
+        comrades = Comrade.objects.order_by('pk')
+        changed = 0
+        last_pk = 0
+        while True:
+            pks = list(comrades.filter(pk__gt=last_pk).values_list('pk', flat=True)[:batch_size])
+            if not pks:
+                break
+            changed += update_locations(Comrade.objects.filter(pk__gte=pks[0], pk__lte=pks[-1]))
+            last_pk = pks[-1]
+        if changed:
+            bulk_updated_public_pages(Comrade)
+        self.stdout.write("Updated the location of {} people".format(changed))
@@ -0,0 +1,110 @@
+import copy
+import datetime
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.template.loader import get_template
+from django.test import override_settings, RequestFactory
+from home.email import render_template_mail
+from home.models import ApplicantApproval, Community, Comrade, Participation, Project, Role, RoundPage
+import os
+import pytz
+import random
+import time
+
+TEMPLATE_NAME = 'home/email/contributors-deadline-reminder.txt'
+
+class Command(BaseCommand):
+    help = 'Times rendering contributors-deadline-reminder.txt for many contributors'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--recipients',
+            type=int,
+            default=5000,
+            help='How many messages to render (default: 5000)',
+        )
+        parser.add_argument(
+            '--processes',
+            type=int,
+            default=os.cpu_count(),
+            help='How many worker processes to try rendering with (default: one per CPU)',
+        )
+        parser.add_argument(
+            '--seed',
+            type=int,
+            default=0,
+            help='Seed for the randomly chosen projects',
+        )
+
+    @override_settings(ALLOWED_HOSTS=['www.outreachy.org'])
+    def handle(self, *args, recipients, processes, seed, **options):
+        rng = random.Random(seed)
+        request = RequestFactory().get('/', secure=True, HTTP_HOST='www.outreachy.org')
+        today = datetime.date.today()
+
+        # Nothing here is saved. Giving the page an id keeps Wagtail from
+        # looking up its content type.
+        current_round = RoundPage(
+            id=1,
+            slug='bench',
+            pingnew=today - datetime.timedelta(days=40),
+            appsopen=today - datetime.timedelta(days=30),
+            appsclose=today + datetime.timedelta(days=5),
+            appslate=today + datetime.timedelta(days=12),
+            internannounce=today + datetime.timedelta(days=30),
+            internstarts=today + datetime.timedelta(days=60),
+            internends=today + datetime.timedelta(days=150),
+        )
+        projects = []
+        for i in range(20):
+            community = Community(name='Community {}'.format(i), slug='community-{}'.format(i))
+            participation = Participation(community=community, participating_round=current_round)
+            projects.append(Project(
+                pk=i + 1,
+                slug='project-{}'.format(i),
+                short_title='Project {}'.format(i),
+                project_round=participation,
+                deadline=rng.choice((Project.ONTIME, Project.LATE)),
+            ))
+
+        timezones = [None, pytz.timezone('America/Sao_Paulo'), pytz.timezone('Africa/Nairobi')]
+        overlays = []
+        for i in range(recipients):
+            account = User(username='contributor{}'.format(i), email='contributor{}@example.com'.format(i))
+            comrade = Comrade(account=account, public_name='Contributor {}'.format(i), timezone=rng.choice(timezones))
+            application = ApplicantApproval(applicant=comrade, application_round=current_round)
+            contributed = rng.sample(projects, rng.randint(1, 3))
+            applied = {p.pk for p in contributed if rng.random() < 0.5}
+
+            role = Role(account, current_round, today)
+            role.__dict__['application'] = application
+            role.__dict__['projects_with_upcoming_and_passed_deadlines'] = Role.split_projects_by_deadline(
+                    [copy.copy(p) for p in contributed],
+                    applied)
+            overlays.append({
+                'role': role,
+                'timezone': comrade.timezone,
+                'comrade': comrade,
+                'recipient': comrade.email_address(),
+            })
+        context = {'current_round': current_round}
+
+        template = get_template(TEMPLATE_NAME, using='plaintext')
+        started = time.monotonic()
+        for overlay in overlays:
+            # What send_template_mail used to do: a new context per message.
+            template.render(dict(context, **overlay), request)
+        one_by_one = time.monotonic() - started
+
+        started = time.monotonic()
+        render_template_mail(TEMPLATE_NAME, context, overlays, request)
+        shared = time.monotonic() - started
+
+        started = time.monotonic()
+        render_template_mail(TEMPLATE_NAME, context, overlays, request, processes=processes)
+        parallel = time.monotonic() - started
+
+        self.stdout.write("Rendering {} messages:".format(recipients))
+        self.stdout.write("  one context per message: {:8.2f} s".format(one_by_one))
+        self.stdout.write("  shared context:          {:8.2f} s".format(shared))
+        self.stdout.write("  {:2} processes:            {:8.2f} s".format(processes, parallel))
@@ -0,0 +1,66 @@
+import datetime
+from django.core.management.base import BaseCommand
+from home.models import create_time_commitment_calendar, find_longest_free_period
+from itertools import groupby
+import random
+import timeit
+from types import SimpleNamespace
+
+class Command(BaseCommand):
+    help = 'Compares the speed of the day-by-day and sweeping time commitment calendars'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--applicants',
+            type=int,
+            default=1000,
+            help='How many randomly generated applicants to check (default: 1000)',
+        )
+        parser.add_argument(
+            '--commitments',
+            type=int,
+            default=5,
+            help='How many time commitments each applicant has (default: 5)',
+        )
+        parser.add_argument(
+            '--seed',
+            type=int,
+            default=0,
+            help='Seed for the random time commitments',
+        )
+
+    def handle(self, *args, applicants, commitments, seed, **options):
+        rng = random.Random(seed)
+        internstarts = datetime.date(2018, 12, 4)
+        internends = datetime.date(2019, 3, 4)
+
+        # create_time_commitment_calendar only looks at these two fields.
+        application_round = SimpleNamespace(internstarts=internstarts, internends=internends)
+
+        all_tcs = []
+        for _ in range(applicants):
+            tcs = []
+            for _ in range(commitments):
+                start = internstarts + datetime.timedelta(days=rng.randrange(-60, 90))
+                tcs.append({
+                    'start_date': start,
+                    'end_date': start + datetime.timedelta(days=rng.randrange(120)),
+                    'hours': rng.choice((5, 10, 20, 40)),
+                })
+            all_tcs.append(tcs)
+
+        def calendar():
+            for tcs in all_tcs:
+                calendar = create_time_commitment_calendar(tcs, application_round)
+                max((len(list(group)) for key, group in groupby(calendar, lambda hours: hours <= 20) if key), default=0)
+
+        def sweep():
+            for tcs in all_tcs:
+                find_longest_free_period(tcs, internstarts, internends)
+
+        calendar_time = min(timeit.repeat(calendar, number=1, repeat=3))
+        sweep_time = min(timeit.repeat(sweep, number=1, repeat=3))
+
+        self.stdout.write("{} applicants with {} time commitments each:".format(applicants, commitments))
+        self.stdout.write("  day by day: {:8.2f} ms".format(calendar_time * 1000))
+        self.stdout.write("  sweep:      {:8.2f} ms ({:.0f}x faster)".format(sweep_time * 1000, calendar_time / sweep_time))
@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+from home.models import ProjectSkill, bulk_updated_public_pages
+from home.skills import reclassify_skills
+
+class Command(BaseCommand):
+    help = 'Recomputes the canonical skill for every project skill, after changing home/skills.py'
+
+    def handle(self, *args, **options):
+        changed = reclassify_skills(ProjectSkill.objects.all())
+        if changed:
+            bulk_updated_public_pages(ProjectSkill)
+        self.stdout.write("Reclassified {} project skills".format(changed))
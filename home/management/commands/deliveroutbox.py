@@ -0,0 +1,133 @@
+from concurrent.futures import ThreadPoolExecutor
+import datetime
+from django.conf import settings
+from django.core import mail
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from home.models import OutboundEmail
+import smtplib
+import time
+
+# How long a worker may hold on to a batch before another worker decides it
+# died and tries those messages again.
+LEASE = datetime.timedelta(minutes=10)
+
+# Wait one minute after the first failure, then twice as long after each
+# later failure, but never more than six hours.
+RETRY_DELAY = datetime.timedelta(minutes=1)
+MAX_RETRY_DELAY = datetime.timedelta(hours=6)
+
+def now():
+    return datetime.datetime.now(datetime.timezone.utc)
+
+def claim_batch(batch_size):
+    """
+    Pick the next messages that are due and push their next attempt past
+    the lease, so other workers running at the same time skip them.
+    """
+    start = now()
+    with transaction.atomic():
+        batch = list(OutboundEmail.objects.filter(
+            status=OutboundEmail.PENDING,
+            next_attempt__lte=start,
+        ).order_by('next_attempt', 'pk').select_for_update(skip_locked=True)[:batch_size])
+        OutboundEmail.objects.filter(
+            pk__in=[outbound.pk for outbound in batch],
+        ).update(next_attempt=start + LEASE)
+    return batch
+
+def deliver(outbound_emails):
+    """
+    Send each message over one connection, reconnecting after an error.
+    Returns a list of (message, exception or None) pairs.
+    """
+    results = []
+    connection = mail.get_connection(settings.OUTBOX_DELIVERY_BACKEND)
+    try:
+        for outbound in outbound_emails:
+            try:
+                connection.open()
+                connection.send_messages([outbound.to_message()])
+            except Exception as e:
+                connection.close()
+                results.append((outbound, e))
+            else:
+                results.append((outbound, None))
+    finally:
+        connection.close()
+    return results
+
+def is_permanent(error):
+    # SMTP 5xx replies won't get better by trying again.
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        return all(code >= 500 for code, message in error.recipients.values())
+    return isinstance(error, smtplib.SMTPResponseException) and error.smtp_code >= 500
+
+class Command(BaseCommand):
+    help = 'Sends queued OutboundEmail messages over several concurrent connections'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=4,
+            help='How many connections to the mail server to use at once (default: 4)',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=100,
+            dest='batch_size',
+            help='How many messages to claim from the outbox at once (default: 100)',
+        )
+        parser.add_argument(
+            '--max-attempts',
+            type=int,
+            default=8,
+            dest='max_attempts',
+            help='Give up on a message after this many failed attempts (default: 8)',
+        )
+        parser.add_argument(
+            '--poll',
+            type=float,
+            default=0,
+            metavar='SECONDS',
+            help='Keep checking for new messages this often instead of exiting once the outbox is empty',
+        )
+
+    def handle(self, *args, workers, batch_size, max_attempts, poll, **options):
+        sent = retried = failed = 0
+        started = time.monotonic()
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            while True:
+                batch = claim_batch(batch_size)
+                if not batch:
+                    if not poll:
+                        break
+                    time.sleep(poll)
+                    continue
+
+                chunks = [batch[i::workers] for i in range(workers)]
+                for results in executor.map(deliver, [chunk for chunk in chunks if chunk]):
+                    for outbound, error in results:
+                        outbound.attempts += 1
+                        if error is None:
+                            outbound.status = OutboundEmail.SENT
+                            outbound.sent = now()
+                            outbound.last_error = ''
+                            sent += 1
+                        else:
+                            outbound.last_error = repr(error)
+                            if outbound.attempts >= max_attempts or is_permanent(error):
+                                outbound.status = OutboundEmail.FAILED
+                                failed += 1
+                            else:
+                                delay = min(RETRY_DELAY * 2 ** (outbound.attempts - 1), MAX_RETRY_DELAY)
+                                outbound.next_attempt = now() + delay
+                                retried += 1
+                        outbound.save(update_fields=['status', 'attempts', 'next_attempt', 'last_error', 'sent'])
+
+        elapsed = time.monotonic() - started
+        self.stdout.write("Sent {} messages in {:.2f} s ({:.1f} per second); {} will be retried, {} failed".format(
+            sent, elapsed, sent / elapsed if elapsed else 0, retried, failed))
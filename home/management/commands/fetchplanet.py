@@ -0,0 +1,53 @@
+import datetime
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from home import planet
+from home.models import InternBlog, PLANET_GENERATION_KEY, get_deadline_date_for, new_cache_generation
+
+class Command(BaseCommand):
+    help = "Fetches approved interns' blog feeds for the planet"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--per-host',
+            type=int,
+            default=planet.PER_HOST,
+            dest='per_host',
+            help='How many feeds to fetch from any one host at once (default: {})'.format(planet.PER_HOST),
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=planet.WORKERS,
+            dest='workers',
+            help='How many feeds to fetch at once in total (default: {})'.format(planet.WORKERS),
+        )
+
+    def handle(self, *args, per_host, workers, **options):
+        now = datetime.datetime.now(datetime.timezone.utc)
+        blogs = list(InternBlog.sync_approved_interns(get_deadline_date_for(now)))
+
+        # Fetch everything before touching the database again, so no
+        # transaction stays open while we wait on the network.
+        results = planet.fetch_all(blogs, per_host=per_host, workers=workers)
+
+        now = datetime.datetime.now(datetime.timezone.utc)
+        failed = 0
+        for blog, result in results:
+            try:
+                with transaction.atomic():
+                    blog.update_from(result, now)
+            except Exception as e:
+                # Whatever was wrong with this feed, record it and carry on
+                # with the rest. The validators aren't saved, so the next
+                # run fetches the whole feed again.
+                blog.error = '{}: {}'.format(type(e).__name__, e)[:255]
+                InternBlog.objects.filter(pk=blog.pk).update(fetched=now, error=blog.error)
+            if blog.error:
+                failed += 1
+                self.stderr.write("{}: {}".format(blog.url, blog.error))
+
+        # Bulk creates don't send the signals that would tell anyone the
+        # planet changed.
+        new_cache_generation(PLANET_GENERATION_KEY)
+        self.stdout.write("Fetched {} blogs, {} failed".format(len(results), failed))
@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+from home.models import ApplicantApproval, ApplicationSearchDocument
+
+class Command(BaseCommand):
+    help = 'Rebuilds the search documents reviewers search applications with'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            dest='batch_size',
+            help='How many applications to index at once (default: 500)',
+        )
+
+    def handle(self, *args, batch_size, **options):
+        applications = ApplicantApproval.objects.order_by('pk')
+        count = 0
+        last_pk = 0
+        while True:
+            pks = list(applications.filter(pk__gt=last_pk).values_list('pk', flat=True)[:batch_size])
+            if not pks:
+                break
+            ApplicationSearchDocument.update_for(ApplicantApproval.objects.filter(pk__in=pks))
+            count += len(pks)
+            last_pk = pks[-1]
+        self.stdout.write("Indexed {} applications".format(count))
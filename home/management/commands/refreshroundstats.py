@@ -0,0 +1,41 @@
+from django.core.management.base import BaseCommand
+from home.models import RoundPage, RoundStatistics
+
+class Command(BaseCommand):
+    help = 'Recomputes the statistics snapshot for each internship round'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'round_slugs',
+            nargs='*',
+            metavar='round_slug',
+            help='Only refresh these rounds (default: all rounds)',
+        )
+        parser.add_argument(
+            '--stale',
+            action='store_true',
+            dest='stale',
+            default=False,
+            help='Only refresh rounds whose statistics are out of date',
+        )
+
+    def handle(self, *args, round_slugs, stale, **options):
+        rounds = RoundPage.objects.select_related('statistics').order_by('internstarts')
+        if round_slugs:
+            rounds = rounds.filter(slug__in=round_slugs)
+
+        for current_round in rounds:
+            try:
+                statistics = current_round.statistics
+            except RoundStatistics.DoesNotExist:
+                statistics = RoundStatistics(round=current_round)
+            else:
+                if stale and not statistics.stale:
+                    continue
+
+            statistics.refresh()
+            self.stdout.write("{}: {} applicants, {} contributors, {} funded interns".format(
+                current_round.slug,
+                statistics.applicants,
+                statistics.contributors,
+                statistics.funded_interns))
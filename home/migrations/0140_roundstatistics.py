@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.8 on 2026-10-16 23:06
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('home', '0139_project_minimum_system_requirements'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RoundStatistics',
+            fields=[
+                ('round', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='statistics', serialize=False, to='home.RoundPage')),
+                ('stale', models.BooleanField(default=True)),
+                ('updated', models.DateTimeField(auto_now=True)),
+                ('applicants', models.PositiveIntegerField(default=0)),
+                ('eligible_applicants', models.PositiveIntegerField(default=0)),
+                ('rejected_applicants', models.PositiveIntegerField(default=0)),
+                ('rejected_for_time', models.PositiveIntegerField(default=0)),
+                ('rejected_for_general', models.PositiveIntegerField(default=0)),
+                ('rejected_for_essay', models.PositiveIntegerField(default=0)),
+                ('contributors', models.PositiveIntegerField(default=0)),
+                ('us_contributors', models.PositiveIntegerField(default=0)),
+                ('us_people_of_color_contributors', models.PositiveIntegerField(default=0)),
+                ('cis_contributors', models.PositiveIntegerField(default=0)),
+                ('trans_contributors', models.PositiveIntegerField(default=0)),
+                ('genderqueer_contributors', models.PositiveIntegerField(default=0)),
+                ('final_applicants', models.PositiveIntegerField(default=0)),
+                ('approved_communities_with_projects', models.PositiveIntegerField(default=0)),
+                ('approved_projects', models.PositiveIntegerField(default=0)),
+                ('funded_interns', models.PositiveIntegerField(default=0)),
+                ('sponsored_interns', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'verbose_name_plural': 'round statistics',
+            },
+        ),
+    ]
@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.8 on 2026-10-16 23:36
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('home', '0140_roundstatistics'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='applicantapproval',
+            name='free_period_end',
+            field=models.DateField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='applicantapproval',
+            name='free_period_start',
+            field=models.DateField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='applicantapproval',
+            name='longest_period_free',
+            field=models.PositiveIntegerField(blank=True, db_index=True, null=True),
+        ),
+    ]
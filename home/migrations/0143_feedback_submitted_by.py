@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.8 on 2026-10-17 00:09
+from __future__ import unicode_literals
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+from home.submitters import backfill_all_submitters, intern_accounts, mentor_accounts
+
+def fill_submitters(apps, schema_editor):
+    ContentType = apps.get_model('contenttypes', 'ContentType')
+    Version = apps.get_model('reversion', 'Version')
+    MentorRelationship = apps.get_model('home', 'MentorRelationship')
+    InternSelection = apps.get_model('home', 'InternSelection')
+    for name, get_accounts in (
+            ('InitialMentorFeedback', lambda ids: mentor_accounts(MentorRelationship, ids)),
+            ('MidpointMentorFeedback', lambda ids: mentor_accounts(MentorRelationship, ids)),
+            ('InitialInternFeedback', lambda ids: intern_accounts(InternSelection, ids)),
+            ('MidpointInternFeedback', lambda ids: intern_accounts(InternSelection, ids)),
+            ):
+        model = apps.get_model('home', name)
+        # A new database has no content types yet, and no history either.
+        content_type = ContentType.objects.filter(app_label='home', model=name.lower()).first()
+        if content_type is None:
+            continue
+        backfill_all_submitters(model, get_accounts,
+                Version.objects.filter(content_type=content_type))
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('home', '0142_outboundemail'),
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('reversion', '0001_squashed_0004_auto_20160611_1202'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='initialinternfeedback',
+            name='submitted_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='initialinternfeedback',
+            name='submitted_by',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='initialmentorfeedback',
+            name='submitted_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='initialmentorfeedback',
+            name='submitted_by',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='midpointinternfeedback',
+            name='submitted_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='midpointinternfeedback',
+            name='submitted_by',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='midpointmentorfeedback',
+            name='submitted_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='midpointmentorfeedback',
+            name='submitted_by',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.RunPython(fill_submitters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.8 on 2026-10-17 00:13
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+from home.skills import reclassify_skills
+
+def classify_project_skills(apps, schema_editor):
+    ProjectSkill = apps.get_model('home', 'ProjectSkill')
+    reclassify_skills(ProjectSkill.objects.all())
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('home', '0143_feedback_submitted_by'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='projectskill',
+            name='canonical_skill',
+            field=models.CharField(blank=True, db_index=True, editable=False, max_length=100),
+        ),
+        migrations.AddField(
+            model_name='projectskill',
+            name='secondary_skill',
+            field=models.CharField(blank=True, editable=False, max_length=100),
+        ),
+        migrations.RunPython(classify_project_skills, migrations.RunPython.noop),
+    ]
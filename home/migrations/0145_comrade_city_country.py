@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.8 on 2026-10-17 00:17
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+from home.locations import update_locations
+
+
+def normalize_comrade_locations(apps, schema_editor):
+    Comrade = apps.get_model('home', 'Comrade')
+    update_locations(Comrade.objects.all())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('home', '0144_projectskill_canonical_skill'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='comrade',
+            name='city',
+            field=models.CharField(blank=True, editable=False, max_length=100),
+        ),
+        migrations.AddField(
+            model_name='comrade',
+            name='country',
+            field=models.CharField(blank=True, db_index=True, editable=False, max_length=100),
+        ),
+        migrations.RunPython(normalize_comrade_locations, migrations.RunPython.noop),
+    ]
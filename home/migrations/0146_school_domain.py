@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.8 on 2026-10-17 00:20
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+from home.schools import get_school_domain
+
+
+def fill_school_domains(apps, schema_editor):
+    for name in ('OfficialSchool', 'SchoolInformation'):
+        model = apps.get_model('home', name)
+        websites = model.objects.values_list('university_website', flat=True).distinct()
+        for website in list(websites):
+            model.objects.filter(university_website=website).update(
+                    school_domain=get_school_domain(website))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('home', '0145_comrade_city_country'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='officialschool',
+            name='school_domain',
+            field=models.CharField(blank=True, db_index=True, editable=False, max_length=255),
+        ),
+        migrations.AddField(
+            model_name='schoolinformation',
+            name='school_domain',
+            field=models.CharField(blank=True, db_index=True, editable=False, max_length=255),
+        ),
+        migrations.RunPython(fill_school_domains, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.8 on 2026-10-17 00:24
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+from home import fulltext
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('home', '0146_school_domain'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ApplicationSearchDocument',
+            fields=[
+                ('application', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='search_document', serialize=False, to='home.ApplicantApproval')),
+                ('people', models.TextField(blank=True)),
+                ('essays', models.TextField(blank=True)),
+            ],
+        ),
+        migrations.RunPython(fulltext.APPLICATIONS.create, fulltext.APPLICATIONS.drop),
+    ]
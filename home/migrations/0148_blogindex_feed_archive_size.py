@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.8 on 2026-10-17 00:40
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('home', '0147_applicationsearchdocument'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='blogindex',
+            name='feed_archive_size',
+            field=models.PositiveIntegerField(default=0, help_text='If this is 0, the feed has every post ever in one document. Otherwise, the feed has this many of the newest posts, and older posts are in archive documents of this many posts each (RFC5005 section 4).', verbose_name='Posts per feed archive'),
+        ),
+    ]
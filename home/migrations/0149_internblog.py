@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.8 on 2026-10-17 00:46
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('home', '0148_blogindex_feed_archive_size'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='InternBlog',
+            fields=[
+                ('comrade', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, serialize=False, to='home.Comrade')),
+                ('url', models.URLField()),
+                ('active', models.BooleanField(default=True)),
+                ('etag', models.CharField(blank=True, max_length=255)),
+                ('last_modified', models.CharField(blank=True, max_length=255)),
+                ('fetched', models.DateTimeField(blank=True, null=True)),
+                ('error', models.CharField(blank=True, max_length=255)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='InternBlogPost',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('guid', models.CharField(max_length=500)),
+                ('title', models.CharField(max_length=255)),
+                ('link', models.URLField(max_length=500)),
+                ('summary', models.TextField(blank=True)),
+                ('published', models.DateTimeField(db_index=True)),
+                ('updated', models.DateTimeField()),
+                ('blog', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='home.InternBlog')),
+            ],
+        ),
+        migrations.AlterUniqueTogether(
+            name='internblogpost',
+            unique_together=set([('blog', 'guid')]),
+        ),
+    ]
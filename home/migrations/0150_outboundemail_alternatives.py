@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.8 on 2026-10-17 00:58
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('home', '0149_internblog'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='outboundemail',
+            name='alternatives',
+            field=models.TextField(default='[]'),
+        ),
+        migrations.AddField(
+            model_name='outboundemail',
+            name='attachments',
+            field=models.TextField(default='[]'),
+        ),
+        migrations.AddField(
+            model_name='outboundemail',
+            name='content_subtype',
+            field=models.CharField(default='plain', max_length=50),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.8 on 2026-10-17 02:10
+from __future__ import unicode_literals
+
+from django.db import migrations
+
+from home.skills import reclassify_skills
+
+def classify_project_skills(apps, schema_editor):
+    # Skills that mention more than one secondary skill used to keep only
+    # the first.
+    ProjectSkill = apps.get_model('home', 'ProjectSkill')
+    reclassify_skills(ProjectSkill.objects.all())
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('home', '0150_outboundemail_alternatives'),
+    ]
+
+    operations = [
+        migrations.RunPython(classify_project_skills, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.8 on 2026-10-17 01:30
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('home', '0151_reclassify_secondary_skills'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='roundstatistics',
+            name='times_marked_stale',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
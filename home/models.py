@@ -1,23 +1,37 @@
 from __future__ import absolute_import, unicode_literals
 
 from os import urandom
-from base64 import urlsafe_b64encode
-from collections import Counter
+from base64 import b64decode, b64encode, urlsafe_b64encode
+from collections import Counter, OrderedDict, defaultdict
+import copy
 import datetime
 from email.headerregistry import Address
+import hashlib
+import json
 import random
 import os.path
+import re
+import tempfile
+import uuid
 
 from django.contrib.auth.models import User
 from django.core import validators
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
 from django.core.exceptions import ObjectDoesNotExist
-from django.db import models
+from django.core.mail import EmailMultiAlternatives
+from django.core.mail.message import make_msgid
+from django.db import connections, models, transaction
+from django.db.models.functions import Coalesce
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
 from django.forms import ValidationError
 from django.shortcuts import redirect
 from django.urls import reverse
 from django.utils.functional import cached_property
-from itertools import chain, groupby
-from urllib.parse import urlsplit, urlparse
+from itertools import chain
+from urllib.parse import urljoin, urlsplit
 
 from ckeditor.fields import RichTextField as CKEditorField
 
@@ -31,6 +45,7 @@ from timezone_field.fields import TimeZoneField
 
 from wagtail.wagtailcore.models import Orderable
 from wagtail.wagtailcore.models import Page
+from wagtail.wagtailcore.signals import page_published, page_unpublished
 from wagtail.wagtailcore.fields import RichTextField
 from wagtail.wagtailcore.fields import StreamField
 from wagtail.wagtailadmin.edit_handlers import FieldPanel
@@ -44,7 +59,15 @@ from wagtail.contrib.wagtailroutablepage.models import RoutablePageMixin, route
 from wagtail.wagtailembeds.blocks import EmbedBlock
 
 from . import email
+from . import fulltext
+from . import planet
+from . import submitters
+from .feeds import WagtailArchivedFeed
+from .feeds import cached_feed_response
 from .feeds import WagtailFeed
+from .locations import normalize_location
+from .schools import get_school_domain
+from .skills import classify_skill, split_secondary_skills
 
 class HomePage(Page):
     body = StreamField([
@@ -94,11 +117,137 @@ class StatsRoundFifteen(Page):
         FieldPanel('unused', classname="full"),
     ]
 
+FEED_ARCHIVE_FILENAME = re.compile(r'^(\d+)\.xml$')
+
+def write_feed_archive(name, content):
+    """
+    Replace the archive document with the given name in one step, so two
+    processes writing the same archive at once can't leave a half-written
+    file, or make the storage save a second copy under another name.
+    """
+    try:
+        path = default_storage.path(name)
+    except NotImplementedError:
+        # Storages without local files are expected to overwrite.
+        if default_storage.exists(name):
+            default_storage.delete(name)
+        default_storage.save(name, ContentFile(content))
+        return
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(content)
+        # mkstemp makes files only we can read, but the web server serves
+        # these.
+        os.chmod(temp_path, getattr(default_storage, 'file_permissions_mode', None) or 0o644)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
 class BlogIndex(RoutablePageMixin, Page):
     feed_generator = WagtailFeed()
+    archived_feed_generator = WagtailArchivedFeed()
+
+    feed_archive_size = models.PositiveIntegerField(
+            default=0,
+            verbose_name="Posts per feed archive",
+            help_text="If this is 0, the feed has every post ever in one document. Otherwise, the feed has this many of the newest posts, and older posts are in archive documents of this many posts each (RFC5005 section 4).")
+
+    settings_panels = Page.settings_panels + [
+        FieldPanel('feed_archive_size'),
+    ]
+
+    def get_feed_posts(self, number=None):
+        """
+        Return the posts for the subscription document of the archived feed
+        if number is None, or else for that archive document. Archives are
+        numbered from the oldest posts, so adding new posts never changes
+        which posts are in an archive.
+        """
+        posts = self.get_children().live().select_related('owner__comrade')
+        if number is None:
+            return posts.order_by('-first_published_at', '-pk')[:self.feed_archive_size]
+        start = (number - 1) * self.feed_archive_size
+        return posts.order_by('first_published_at', 'pk')[start:start + self.feed_archive_size]
+
+    def get_feed_archive_count(self):
+        return self.get_children().live().count() // self.feed_archive_size
+
+    def get_feed_archive_name(self, number):
+        # Archives made with a different size have different posts in them.
+        return 'blog-feeds/{}/{}/{}.xml'.format(self.pk, self.feed_archive_size, number)
+
+    def get_feed_archive_url(self, number):
+        return urljoin(self.full_url, default_storage.url(self.get_feed_archive_name(number)))
+
+    def write_feed_archives(self, request):
+        """
+        Write out any archive documents that should exist but don't yet.
+        They're never rewritten after that, so the web server can serve
+        them as static files which clients can cache forever.
+        """
+        for number in range(1, self.get_feed_archive_count() + 1):
+            name = self.get_feed_archive_name(number)
+            if default_storage.exists(name):
+                continue
+            feed = self.archived_feed_generator.get_feed((self, number), request)
+            write_feed_archive(name, feed.writeString('utf-8').encode('utf-8'))
+
+    def remove_feed_archives(self, post):
+        """
+        Remove the archive documents that a post is in, or would be in, and
+        every archive after those, because they're wrong once that post is
+        unpublished or republished. They'll be written again with the
+        subscription document.
+        """
+        if post.first_published_at is None:
+            return
+        earlier = self.get_children().live().filter(
+                models.Q(first_published_at__lt=post.first_published_at) |
+                models.Q(first_published_at=post.first_published_at, pk__lt=post.pk),
+                ).count()
+        root = 'blog-feeds/{}'.format(self.pk)
+        try:
+            sizes, files = default_storage.listdir(root)
+        except FileNotFoundError:
+            return
+        for size in sizes:
+            if not size.isdigit() or int(size) < 1:
+                continue
+            first_stale = earlier // int(size) + 1
+            for filename in default_storage.listdir('{}/{}'.format(root, size))[1]:
+                match = FEED_ARCHIVE_FILENAME.match(filename)
+                if match is None:
+                    # Another process may be about to rename this into
+                    # place, so leave it alone.
+                    if filename.startswith('.'):
+                        continue
+                    # Anything else is a duplicate from a storage that
+                    # wouldn't overwrite, which nothing will ever serve.
+                elif int(match.group(1)) < first_stale:
+                    continue
+                default_storage.delete('{}/{}/{}'.format(root, size, filename))
+
+    def get_feed_generation_key(self):
+        return 'blog-feed-generation:{}'.format(self.pk)
+
+    def invalidate_feed(self):
+        new_cache_generation(self.get_feed_generation_key())
 
     @route(r'^feed/$')
     def feed(self, request):
+        # Keep the rendered feed until a post is published or unpublished.
+        return cached_feed_response(request, 'blog-feed:{}'.format(self.pk),
+                get_cache_generation(self.get_feed_generation_key()),
+                lambda: self.render_feed(request))
+
+    def render_feed(self, request):
+        if self.feed_archive_size:
+            self.write_feed_archives(request)
+            return self.archived_feed_generator(request, self)
         return self.feed_generator(request, self)
 
 # All dates in RoundPage below, if an exact time matters, actually represent
@@ -333,24 +482,13 @@ class RoundPage(Page):
         return [p.community for p in approved_participations]
 
     def number_approved_communities_with_projects(self):
-        return Participation.objects.filter(participating_round=self,
-                approval_status=ApprovalStatus.APPROVED,
-                project__isnull=False).distinct().count()
+        return self.get_statistics().approved_communities_with_projects
 
     def number_approved_projects(self):
-        return Project.objects.filter(project_round__participating_round=self,
-                approval_status=ApprovalStatus.APPROVED,
-                project_round__approval_status=ApprovalStatus.APPROVED).distinct().count()
+        return self.get_statistics().approved_projects
 
     def number_funded_interns(self):
-        participations = Participation.objects.filter(
-                participating_round=self,
-                approval_status=Participation.APPROVED,
-                project__isnull=False).distinct()
-        funded = 0
-        for p in participations:
-            funded += p.interns_funded()
-        return funded
+        return self.get_statistics().funded_interns
 
     def is_coordinator(self, user):
         return CoordinatorApproval.objects.filter(
@@ -424,20 +562,12 @@ class RoundPage(Page):
     def get_communities_with_unused_funding(self):
         participations = Participation.objects.filter(
                 participating_round=self,
-                approval_status=Participation.APPROVED)
-        communities = []
-        for p in participations:
-            funded = p.interns_funded()
-            if funded < 1:
-                continue
-            intern_count = InternSelection.objects.filter(
-                    project__project_round=p,
-                    project__approval_status=Project.APPROVED,
-                    funding_source=InternSelection.ORG_FUNDED).count()
-            if intern_count < funded:
-                communities.append((p.community, intern_count, funded))
-        communities.sort(key=lambda x: x[0].name)
-        return communities
+                approval_status=Participation.APPROVED,
+                ).with_funding().filter(
+                funded_slots__gte=1,
+                org_funded_interns__lt=models.F('funded_slots'),
+                ).select_related('community').order_by('community__name')
+        return [(p.community, p.org_funded_interns, p.funded_slots) for p in participations]
 
     def travel_stipend_starts(self):
         return self.internannounce
@@ -455,221 +585,74 @@ class RoundPage(Page):
         return not has_deadline_passed(self.internstarts + datetime.timedelta(days=365))
 
     def get_common_skills_counter(self):
-        approved_projects = Project.objects.filter(project_round__participating_round=self, approval_status=Project.APPROVED)
-        skills = []
-        for p in approved_projects:
-            for s in p.projectskill_set.all():
-                if 'python' in s.skill.lower():
-                    skills.append('Python')
-                elif 'javascript' in s.skill.lower() or 'JS' in s.skill:
-                    skills.append('JavaScript')
-                elif 'html' in s.skill.lower() or 'css' in s.skill.lower():
-                    skills.append('HTML/CSS')
-                elif 'java' in s.skill.lower():
-                    skills.append('Java')
-                elif 'django' in s.skill.lower():
-                    skills.append('Django')
-                elif 'c program' in s.skill.lower() or 'c language' in s.skill.lower() or 'c code' in s.skill.lower() or 'programming in c' in s.skill.lower() or s.skill == 'C':
-                    skills.append('C programming')
-                elif 'c++' in s.skill.lower():
-                    skills.append('C++')
-                elif 'rust' in s.skill.lower():
-                    skills.append('Rust')
-                elif 'ruby on rails' in s.skill.lower():
-                    skills.append('Ruby on Rails')
-                elif 'ruby' in s.skill.lower():
-                    skills.append('Ruby')
-                elif 'operating systems' in s.skill.lower() or 'kernel' in s.skill.lower():
-                    skills.append('Operating Systems knowledge')
-                elif 'linux' in s.skill.lower():
-                    skills.append('Linux')
-                elif 'web development' in s.skill.lower():
-                    skills.append('Web development')
-                elif 'gtk' in s.skill.lower() or 'gobject' in s.skill.lower():
-                    skills.append('GTK programming')
-                elif 'git' in s.skill.lower():
-                    skills.append('Git')
-                elif 'writing' in s.skill.lower() or 'documentation' in s.skill.lower():
-                    skills.append('Documentation')
-                else:
-                    skills.append(s.skill)
-
-                # A lot of projects list Android in conjunction with another skill
-                if 'android' in s.skill.lower():
-                    skills.append('Android')
-                # Some projects list both Git or mercurial
-                if 'mercurial' in s.skill.lower():
-                    skills.append('Mercurial')
-                # Some projects list both JavaScipt and node.js
-                if 'node.js' in s.skill.lower():
-                    skills.append('node.js')
-        return Counter(skills)
+        return ProjectSkill.count_common_skills([self])[self.pk]
 
     # Statistics functions
     def get_common_skills(self):
         skill_counter = self.get_common_skills_counter()
         return skill_counter.most_common(20)
 
+    def get_statistics(self):
+        """
+        Return this round's RoundStatistics snapshot, first recomputing it if
+        anything it counts has changed since it was last computed.
+        """
+        try:
+            statistics = self.statistics
+        except RoundStatistics.DoesNotExist:
+            statistics = RoundStatistics(round=self)
+            self.statistics = statistics
+        if statistics.stale:
+            statistics.refresh()
+        return statistics
+
     def number_accepted_initial_applications(self):
-        return ApplicantApproval.objects.filter(
-                approval_status=ApplicantApproval.APPROVED,
-                application_round=self).count()
+        return self.get_statistics().eligible_applicants
 
     def number_contributors(self):
-        return ApplicantApproval.objects.filter(
-                application_round=self,
-                approval_status=ApprovalStatus.APPROVED,
-                contribution__isnull=False).distinct().count()
+        return self.get_statistics().contributors
 
     def get_statistics_on_eligibility_check(self):
-        count_all = ApplicantApproval.objects.filter(
-                application_round=self).count()
-        count_approved = ApplicantApproval.objects.filter(
-                approval_status=ApplicantApproval.APPROVED,
-                application_round=self).count()
-        count_rejected_all = ApplicantApproval.objects.filter(
-                approval_status=ApplicantApproval.REJECTED,
-                application_round=self).count()
-        count_rejected_time = ApplicantApproval.objects.filter(
-                approval_status=ApplicantApproval.REJECTED,
-                reason_denied="TIME",
-                application_round=self).count()
-        count_rejected_general = ApplicantApproval.objects.filter(
-                approval_status=ApplicantApproval.REJECTED,
-                reason_denied="GENERAL",
-                application_round=self).count()
-        count_rejected_essay = ApplicantApproval.objects.filter(
-                approval_status=ApplicantApproval.REJECTED,
-                reason_denied__contains="ALIGNMENT",
-                application_round=self).count()
-        if count_rejected_all == 0:
-            return (count_all, count_approved, 0, 0, 0)
-        return (count_all, count_approved, count_rejected_essay * 100 / count_rejected_all, count_rejected_time * 100 / count_rejected_all, count_rejected_general * 100 / count_rejected_all)
+        stats = self.get_statistics()
+        if stats.rejected_applicants == 0:
+            return (stats.applicants, stats.eligible_applicants, 0, 0, 0)
+        return (stats.applicants, stats.eligible_applicants, stats.rejected_for_essay * 100 / stats.rejected_applicants, stats.rejected_for_time * 100 / stats.rejected_applicants, stats.rejected_for_general * 100 / stats.rejected_applicants)
 
     def get_countries_stats(self):
-        all_apps = ApplicantApproval.objects.filter(
+        return list(ApplicantApproval.objects.filter(
                 application_round=self,
-                approval_status=ApplicantApproval.APPROVED)
-        countries = []
-        cities = []
-        for a in all_apps:
-            city, country = a.applicant.get_city_country()
-            if city != '':
-                cities.append(city)
-            if country != '':
-                countries.append(country)
-
-        return Counter(countries).most_common(25)
+                approval_status=ApplicantApproval.APPROVED,
+        ).exclude(
+                applicant__country='',
+        ).values_list(
+                'applicant__country',
+        ).annotate(
+                count=models.Count('pk'),
+        ).order_by('-count', 'applicant__country')[:25])
 
     def get_contributor_demographics(self):
-        applicants = ApplicantApproval.objects.filter(
-                application_round=self,
-                approval_status=ApprovalStatus.APPROVED,
-                contribution__isnull=False).distinct().count()
+        stats = self.get_statistics()
+        if stats.us_contributors == 0:
+            return (stats.contributors, 0, 0)
 
-        us_apps = ApplicantApproval.objects.filter(
-                models.Q(paymenteligibility__us_national_or_permanent_resident=True) | models.Q(paymenteligibility__living_in_us=True),
-                application_round=self,
-                approval_status=ApprovalStatus.APPROVED,
-                contribution__isnull=False).distinct().count()
-
-        us_people_of_color_apps = ApplicantApproval.objects.filter(
-                applicantraceethnicityinformation__us_resident_demographics=True,
-                application_round=self,
-                approval_status=ApprovalStatus.APPROVED,
-                contribution__isnull=False).distinct().count()
-        if us_apps == 0:
-            return (applicants, 0, 0)
-
-        return (applicants, (us_apps - us_people_of_color_apps) * 100 / us_apps, us_people_of_color_apps * 100 / us_apps)
+        return (stats.contributors, (stats.us_contributors - stats.us_people_of_color_contributors) * 100 / stats.us_contributors, stats.us_people_of_color_contributors * 100 / stats.us_contributors)
 
     def get_contributor_gender_stats(self):
-        all_apps = ApplicantApproval.objects.filter(
-                application_round=self,
-                approval_status=ApprovalStatus.APPROVED,
-                contribution__isnull=False).distinct().count()
-
-        if all_apps == 0:
+        stats = self.get_statistics()
+        if stats.contributors == 0:
             return (0, 0, 0)
 
-        cis_apps = ApplicantGenderIdentity.objects.filter(
-                transgender=False,
-                genderqueer=False,
-                demi_boy=False,
-                demi_girl=False,
-                trans_masculine=False,
-                trans_feminine=False,
-                non_binary=False,
-                demi_non_binary=False,
-                genderflux=False,
-                genderfluid=False,
-                demi_genderfluid=False,
-                demi_gender=False,
-                bi_gender=False,
-                tri_gender=False,
-                multigender=False,
-                pangender=False,
-                maxigender=False,
-                aporagender=False,
-                intergender=False,
-                mavrique=False,
-                gender_confusion=False,
-                gender_indifferent=False,
-                graygender=False,
-                agender=False,
-                genderless=False,
-                gender_neutral=False,
-                neutrois=False,
-                androgynous=False,
-                androgyne=False,
-                applicant__application_round=self,
-                applicant__approval_status=ApprovalStatus.APPROVED,
-                applicant__contribution__isnull=False).distinct().count()
-
-        trans_folks_apps = ApplicantGenderIdentity.objects.filter(
-                transgender=True,
-                applicant__application_round=self,
-                applicant__approval_status=ApprovalStatus.APPROVED,
-                applicant__contribution__isnull=False).distinct().count()
-
-        genderqueer_folks_apps = ApplicantGenderIdentity.objects.filter(
-                genderqueer=True,
-                applicant__application_round=self,
-                applicant__approval_status=ApprovalStatus.APPROVED,
-                applicant__contribution__isnull=False).distinct().count()
-
-        return (cis_apps * 100 / all_apps, trans_folks_apps * 100 / all_apps, genderqueer_folks_apps * 100 / all_apps)
+        return (stats.cis_contributors * 100 / stats.contributors, stats.trans_contributors * 100 / stats.contributors, stats.genderqueer_contributors * 100 / stats.contributors)
 
     def get_contributor_applicant_funding_status(self):
-        eligible = ApplicantApproval.objects.filter(
-                approval_status=ApplicantApproval.APPROVED,
-                application_round=self).count()
-
-        contributed = ApplicantApproval.objects.filter(
-                application_round=self,
-                approval_status=ApprovalStatus.APPROVED,
-                contribution__isnull=False).distinct().count()
-
-        applied = ApplicantApproval.objects.filter(
-                application_round=self,
-                approval_status=ApprovalStatus.APPROVED,
-                finalapplication__isnull=False).distinct().count()
-
-        funded = 0
-        participations = Participation.objects.filter(
-                approval_status=Participation.APPROVED,
-                participating_round=self)
-        for p in participations:
-            funded = funded + p.interns_funded()
-
-        return (eligible, contributed, applied, funded)
+        stats = self.get_statistics()
+        return (stats.eligible_applicants, stats.contributors, stats.final_applicants, stats.sponsored_interns)
 
     def serve(self, request, *args, **kwargs):
         # If the project selection page (views.current_round_page) would
         # consider this a current_round, redirect there.
-        now = datetime.datetime.now(datetime.timezone.utc)
-        today = get_deadline_date_for(now)
-        if self.pingnew <= today and self.appslate > today:
+        current_round = RoundTimeline.load().project_selection_round()
+        if current_round is not None and current_round.pk == self.pk:
             return redirect('project-selection')
 
         # Only show this page if we shouldn't be showing the project selection page.
@@ -680,6 +663,267 @@ class RoundPage(Page):
         context['role'] = Role(request.user, self)
         return context
 
+class RoundTimeline(object):
+    """
+    Every round, loaded in one query and cached until a round page is
+    saved, along with answers to questions like "which round's application
+    period is open today?" that don't need any further queries.
+
+    The cached pages are copies, so don't save changes made to them.
+    """
+
+    CACHE_KEY = 'round-timeline'
+
+    def __init__(self, rounds, today=None):
+        self.rounds = rounds
+        if today is None:
+            now = datetime.datetime.now(datetime.timezone.utc)
+            today = get_deadline_date_for(now)
+        self.today = today
+
+    @classmethod
+    def load(cls, today=None):
+        rounds = cache.get(cls.CACHE_KEY)
+        if rounds is None:
+            rounds = list(RoundPage.objects.order_by('internstarts'))
+            cache.set(cls.CACHE_KEY, rounds)
+        return cls(rounds, today)
+
+    @classmethod
+    def invalidate(cls):
+        cache.delete(cls.CACHE_KEY)
+
+    def latest(self, field, condition=lambda r: True):
+        """
+        Return the round with the latest date in the given field among
+        those for which condition(round) is true, or None if there are none.
+        """
+        return max(
+            (r for r in self.rounds if condition(r)),
+            key=lambda r: getattr(r, field),
+            default=None,
+        )
+
+    def earliest(self, field, condition=lambda r: True):
+        return min(
+            (r for r in self.rounds if condition(r)),
+            key=lambda r: getattr(r, field),
+            default=None,
+        )
+
+    def project_selection_round(self):
+        """
+        The round whose projects the project selection page lists: from
+        when mentors are first asked for projects until late applications
+        close.
+        """
+        today = self.today
+        return self.latest('internstarts', lambda r: r.pingnew <= today < r.appslate)
+
+    def previous_project_selection_round(self):
+        today = self.today
+        return self.latest('internstarts', lambda r: r.appslate <= today)
+
+    def application_round(self):
+        """
+        The round whose application period is open.
+        """
+        today = self.today
+        return self.latest('internstarts', lambda r: r.appsopen <= today < r.appslate)
+
+    def community_signup_round(self):
+        """
+        The round communities and mentors can sign up for: from when
+        mentors are first asked for projects until the internships start.
+        """
+        today = self.today
+        return self.latest('internstarts', lambda r: r.pingnew <= today < r.internstarts)
+
+    def previous_community_signup_round(self):
+        today = self.today
+        return self.latest('internstarts', lambda r: r.internstarts <= today)
+
+    def upcoming_round(self):
+        """
+        The soonest round whose internships haven't started yet.
+        """
+        today = self.today
+        return self.earliest('internstarts', lambda r: r.internstarts > today)
+
+# Most of the round statistics are counts over every initial application in
+# the round, which are too slow to recompute on every page view. Instead we
+# keep a snapshot of them here. Changes to anything the snapshot counts mark it
+# stale (see ROUND_STATISTICS_DEPENDENCIES at the end of this file), and it
+# gets recomputed the next time someone looks at it.
+class RoundStatistics(models.Model):
+    round = models.OneToOneField(RoundPage, on_delete=models.CASCADE, primary_key=True, related_name='statistics')
+    stale = models.BooleanField(default=True)
+    updated = models.DateTimeField(auto_now=True)
+    # Counts every time this is marked stale, so refresh can tell whether
+    # anything changed while it was counting.
+    times_marked_stale = models.PositiveIntegerField(default=0)
+
+    # Initial applications
+    applicants = models.PositiveIntegerField(default=0)
+    eligible_applicants = models.PositiveIntegerField(default=0)
+    rejected_applicants = models.PositiveIntegerField(default=0)
+    rejected_for_time = models.PositiveIntegerField(default=0)
+    rejected_for_general = models.PositiveIntegerField(default=0)
+    rejected_for_essay = models.PositiveIntegerField(default=0)
+
+    # Eligible applicants who recorded a contribution
+    contributors = models.PositiveIntegerField(default=0)
+    us_contributors = models.PositiveIntegerField(default=0)
+    us_people_of_color_contributors = models.PositiveIntegerField(default=0)
+    cis_contributors = models.PositiveIntegerField(default=0)
+    trans_contributors = models.PositiveIntegerField(default=0)
+    genderqueer_contributors = models.PositiveIntegerField(default=0)
+
+    # Eligible applicants who created a final application
+    final_applicants = models.PositiveIntegerField(default=0)
+
+    # Approved communities and projects
+    approved_communities_with_projects = models.PositiveIntegerField(default=0)
+    approved_projects = models.PositiveIntegerField(default=0)
+    # Internships funded by approved communities which have projects...
+    funded_interns = models.PositiveIntegerField(default=0)
+    # ...and by all approved communities.
+    sponsored_interns = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        verbose_name_plural = 'round statistics'
+
+    def __str__(self):
+        return 'Statistics for {}'.format(self.round)
+
+    # An applicant is counted as cisgender if they didn't pick any of these.
+    NOT_CISGENDER_FIELDS = (
+            'transgender',
+            'genderqueer',
+            'demi_boy',
+            'demi_girl',
+            'trans_masculine',
+            'trans_feminine',
+            'non_binary',
+            'demi_non_binary',
+            'genderflux',
+            'genderfluid',
+            'demi_genderfluid',
+            'demi_gender',
+            'bi_gender',
+            'tri_gender',
+            'multigender',
+            'pangender',
+            'maxigender',
+            'aporagender',
+            'intergender',
+            'mavrique',
+            'gender_confusion',
+            'gender_indifferent',
+            'graygender',
+            'agender',
+            'genderless',
+            'gender_neutral',
+            'neutrois',
+            'androgynous',
+            'androgyne',
+            )
+
+    def refresh(self):
+        """
+        Recompute every statistic from scratch and save the snapshot. This
+        takes one query over the round's initial applications and one over
+        its participating communities. If the snapshot is marked stale again
+        while this runs, it's saved but stays stale.
+        """
+        # The row has to exist before we start counting, or there'd be
+        # nothing for a change in the meantime to mark.
+        current, created = RoundStatistics.objects.get_or_create(round_id=self.round_id)
+        self._state.adding = False
+        times_marked_stale = current.times_marked_stale
+
+        def count_where(*args, **kwargs):
+            return models.Sum(models.Case(
+                models.When(models.Q(*args, **kwargs), then=1),
+                default=0,
+                output_field=models.IntegerField()))
+
+        approved = models.Q(approval_status=ApprovalStatus.APPROVED)
+        rejected = models.Q(approval_status=ApprovalStatus.REJECTED)
+        # Contribution and FinalApplication are many-to-one, so joining them
+        # would count applicants more than once. Use IN subqueries instead.
+        # The other tables are one-to-one with ApplicantApproval.
+        contributor = approved & models.Q(pk__in=Contribution.objects.filter(
+            applicant__application_round=self.round).values('applicant'))
+        final_applicant = approved & models.Q(pk__in=FinalApplication.objects.filter(
+            applicant__application_round=self.round).values('applicant'))
+
+        applications = ApplicantApproval.objects.filter(
+                application_round=self.round,
+                ).aggregate(
+                applicants=models.Count('pk'),
+                eligible_applicants=count_where(approved),
+                rejected_applicants=count_where(rejected),
+                rejected_for_time=count_where(rejected, reason_denied="TIME"),
+                rejected_for_general=count_where(rejected, reason_denied="GENERAL"),
+                rejected_for_essay=count_where(rejected, reason_denied__contains="ALIGNMENT"),
+                contributors=count_where(contributor),
+                us_contributors=count_where(contributor,
+                    models.Q(paymenteligibility__us_national_or_permanent_resident=True) | models.Q(paymenteligibility__living_in_us=True)),
+                us_people_of_color_contributors=count_where(contributor,
+                    applicantraceethnicityinformation__us_resident_demographics=True),
+                cis_contributors=count_where(contributor, **{
+                    'applicantgenderidentity__' + field: False
+                    for field in self.NOT_CISGENDER_FIELDS
+                    }),
+                trans_contributors=count_where(contributor,
+                    applicantgenderidentity__transgender=True),
+                genderqueer_contributors=count_where(contributor,
+                    applicantgenderidentity__genderqueer=True),
+                final_applicants=count_where(final_applicant),
+                )
+        for name, value in applications.items():
+            setattr(self, name, value or 0)
+
+        participations = Participation.objects.filter(
+                participating_round=self.round,
+                approval_status=ApprovalStatus.APPROVED,
+                ).with_funding().annotate(
+                has_projects=models.Exists(Project.objects.filter(
+                    project_round=models.OuterRef('pk'))),
+                project_count=models.Subquery(
+                    Project.objects.filter(
+                        project_round=models.OuterRef('pk'),
+                        approval_status=ApprovalStatus.APPROVED,
+                    ).order_by().values('project_round').annotate(
+                        count=models.Count('pk'),
+                    ).values('count'),
+                    output_field=models.IntegerField()),
+                ).values_list('funded_slots', 'has_projects', 'project_count')
+
+        self.approved_communities_with_projects = 0
+        self.approved_projects = 0
+        self.funded_interns = 0
+        self.sponsored_interns = 0
+        for funded_slots, has_projects, project_count in participations:
+            self.sponsored_interns += funded_slots
+            self.approved_projects += project_count or 0
+            if has_projects:
+                self.approved_communities_with_projects += 1
+                self.funded_interns += funded_slots
+
+        self.updated = datetime.datetime.now(datetime.timezone.utc)
+        values = {
+            field.attname: getattr(self, field.attname)
+            for field in self._meta.concrete_fields
+            if field.name not in ('round', 'stale', 'times_marked_stale')
+        }
+        statistics = RoundStatistics.objects.filter(round_id=self.round_id)
+        fresh = statistics.filter(times_marked_stale=times_marked_stale).update(stale=False, **values)
+        if not fresh:
+            statistics.update(**values)
+        self.stale = not fresh
+
 class CohortPage(Page):
     round_start = models.DateField("Round start date")
     round_end = models.DateField("Round end date")
@@ -828,6 +1072,11 @@ class Comrade(models.Model):
             blank=True,
             help_text="(Optional) Location - city, state/province, and country.<br>This field is unused for mentors and coordinators. Applicant's location will be shared with their mentors. If selected as an intern, this location will be publicly displayed on the Outreachy website.<br>If you are concerned about keeping your location private, you can share less information, such as just the country, or a larger town nearby.")
 
+    # What normalize_location makes of the location and timezone, kept up to
+    # date when the Comrade is saved so statistics can group by country.
+    city = models.CharField(max_length=SENTENCE_LENGTH, blank=True, editable=False)
+    country = models.CharField(max_length=SENTENCE_LENGTH, blank=True, db_index=True, editable=False)
+
     nick = models.CharField(
             max_length=SENTENCE_LENGTH,
             blank=True,
@@ -875,136 +1124,11 @@ class Comrade(models.Model):
                 pronouns=self.get_pronouns_display(),
                 )
 
-    # Having a text location field was a disaster.
+    def normalize_location(self):
+        self.city, self.country = normalize_location(self.location, getattr(self.timezone, 'zone', ''))
+
     def get_city_country(self):
-        us_state_abbrevs = ['AL', 'AK', 'AZ', 'AR', 'CA', 'CO', 'CT', 'DE', 'FL', 'GA', 'HI', 'ID', 'IL', 'IN', 'IA', 'KS', 'KY', 'LA', 'ME', 'MD', 'MA', 'MI', 'MN', 'MS', 'MO', 'MT', 'NE', 'NV', 'NH', 'NJ', 'NM', 'NY', 'NC', 'ND', 'OH', 'OK', 'OR', 'PA', 'RI', 'SC', 'SD', 'TN', 'TX', 'UT', 'VT', 'VA', 'WA', 'WV', 'WI', 'WY', 'AS', 'DC', 'FM', 'GU', 'MH', 'MP', 'PW', 'PR', 'VI', ]
-        us_states = [ 'alabama', 'alaska', 'arizona', 'arkansas', 'california', 'colorado', 'connecticut', 'delaware', 'florida', 'georgia', 'hawaii', 'idaho', 'illinois', 'indiana', 'iowa', 'kansas', 'kentucky', 'louisiana', 'maine', 'maryland', 'massachusetts', 'michigan', 'minnesota', 'mississippi', 'missouri', 'montana', 'nebraska', 'nevada', 'new hampshire', 'new jersey', 'new mexico', 'new york', 'north carolina', 'north dakota', 'ohiooH', 'oklahoma', 'oregon', 'pennsylvania', 'rhode island', 'south carolina', 'south dakota', 'tennessee', 'texas', 'utah', 'vermont', 'virginia', 'washington', 'west virginia', 'wisconsin', 'wyoming', 'american samoa', 'district of columbia', 'federated states of micronesia', 'guam', 'marshall islands', 'northern mariana islands', 'palau', 'puerto rico', 'virgin islands', ]
-
-        us_cities = [
-                'boston',
-                'los angeles',
-                'san francisco',
-                'new york city',
-                'united states',
-                'philadelphia',
-                'madison',
-                ]
-        us_timezones = [
-                'America/Los_Angeles',
-                'America/Chicago',
-                'America/New_York',
-                'US/Eastern',
-                'US/Central',
-                'US/Pacific',
-                ]
-
-        indian_cities = [
-                'india',
-                'india.',
-                'new delhi',
-                'hyderabad',
-                'bangalore',
-                'delhi',
-                'mumbai',
-                'hyderabad',
-                'chennai',
-                'noida',
-                'kerala',
-                'pune',
-                'jaipur',
-                'maharashtra',
-                'new delhi india',
-                'bengaluru',
-                ]
-        location = self.location.split(',')
-        if location == '':
-            city = ''
-        else:
-            city = location[0].strip().lower()
-
-        country = ''
-        if len(location) >= 3:
-            country = location[-1].strip().lower()
-        elif len(location) == 2:
-            country = location[-1].strip().lower()
-            if country.upper() in us_state_abbrevs or country in us_states:
-                country = 'usa'
-
-        scrubbed_city = ''
-        if country:
-            if country == 'usa' or country == 'united states' or country == 'united states of america' or country == 'us' or country in us_states:
-                country = 'usa'
-            if country == 'india.' or country == 'delhi and india':
-                country = 'india'
-        elif city == 'buenos aires' or city.startswith('argentina'):
-            country = 'argentina'
-        # Brazilians like to use dashes instead of commas??
-        elif city.startswith('são paulo') or city.startswith('curitiba') or city == 'brazil' or city == 'brasil':
-            country = 'brazil'
-        elif city == 'yaounde':
-            country = 'cameroon'
-        # There's a Vancouver, WA, but it's more likely to be Canada
-        elif city == 'vancouver' or city == 'canada':
-            country = 'canada'
-        elif city == 'egypt':
-            country = 'egypt'
-        elif city == 'berlin':
-            country = 'germany'
-        elif city in indian_cities:
-            country = 'india'
-        elif city == 'israel':
-            country = 'israel'
-        elif city == 'mombasa' or city == 'nairobi' or city == 'kenya':
-            country = 'kenya'
-        elif city == 'mexico city' or city == 'mexico':
-            country = 'mexico'
-        elif city.startswith('lagos') or city == 'port harcourt' or city == 'ibadan' or city == 'nigeria':
-            country = 'nigeria'
-        # technically there's a saint petersberg FL, but it's more likely to be Russia
-        elif city == 'moscow' or city == 'saint petersburg' or city == 'saint-petersburg' or city == 'russia':
-            country = 'russia'
-        elif city == 'istanbul' or city == 'turkey':
-            country = 'turkey'
-        elif city == 'kazakhstan' or city == 'united arab emirates':
-            country = 'united arab emirates'
-        elif city in us_cities or city in us_states:
-            country = 'usa'
-        elif self.timezone:
-            timezone = self.timezone.zone
-            if timezone == 'America/Argentina/Buenos_Aires':
-                country = 'argentina'
-            if 'Australia' in timezone:
-                country = 'australia'
-            elif timezone == 'America/Sao_Paulo':
-                country = 'brazil'
-            elif timezone.startswith('Canada') or timezone == 'America/Toronto':
-                country = 'canada'
-            elif timezone == 'Africa/Cairo':
-                country = 'egypt'
-            elif timezone == 'Europe/Berlin':
-                country = 'germany'
-            elif timezone == 'Africa/Nairobi' or timezone == 'Africa/Lagos':
-                country = 'kenya'
-            elif timezone == 'Asia/Kolkata' or timezone == 'Indian/Mayotte':
-                country = 'india'
-            elif timezone == 'Europe/Rome':
-                country = 'italy'
-            elif timezone == 'Europe/Dublin':
-                country = 'ireland'
-            elif timezone == 'Indian/Antananarivo':
-                country = 'madagascar'
-            elif timezone == 'Europe/Bucharest':
-                country = 'romania'
-            elif timezone == 'Europe/Moscow':
-                country = 'russia'
-            elif timezone == 'Europe/London':
-                country = 'uk'
-            elif timezone == 'Europe/Kiev':
-                country = 'ukraine'
-            elif timezone in us_timezones:
-                country = 'usa'
-
-        return (city.title(), country.title())
+        return (self.city, self.country)
 
     def get_mentored_projects(self):
         """
@@ -1071,6 +1195,17 @@ class ApprovalStatus(models.Model):
         """
         return None
 
+    @classmethod
+    def submission_and_approval_deadline_filter(cls, today):
+        """
+        Override in subclasses to return a Q object matching only those
+        instances whose submission_and_approval_deadline has not passed
+        as of the given deadline date. This is the queryset equivalent of
+        calling has_deadline_passed on each instance, so keep the two in
+        sync.
+        """
+        return models.Q()
+
     def is_approver(self, user):
         """
         Override in subclasses to return True if the given user has
@@ -1264,10 +1399,47 @@ class NewCommunity(Community):
     class Meta:
         verbose_name_plural = 'new communities'
 
+class ParticipationQuerySet(ApprovalStatusQuerySet):
+    def with_funding(self):
+        """
+        Annotate each participation with its total_sponsorship, the number
+        of interns that pays for (funded_slots), and the number of interns
+        in approved projects who are marked as funded by the community
+        (org_funded_interns). These come from subqueries, so the whole
+        queryset is still one query no matter how many communities there
+        are.
+        """
+        return self.annotate(
+                total_sponsorship=Coalesce(models.Subquery(
+                    Sponsorship.objects.filter(
+                        participation=models.OuterRef('pk'),
+                    ).order_by().values('participation').annotate(
+                        total=models.Sum('amount'),
+                    ).values('total'),
+                    output_field=models.IntegerField()), 0),
+                org_funded_interns=Coalesce(models.Subquery(
+                    InternSelection.objects.filter(
+                        project__project_round=models.OuterRef('pk'),
+                        project__approval_status=ApprovalStatus.APPROVED,
+                        funding_source=InternSelection.ORG_FUNDED,
+                    ).order_by().values('project__project_round').annotate(
+                        count=models.Count('pk'),
+                    ).values('count'),
+                    output_field=models.IntegerField()), 0),
+                ).annotate(
+                # Both sides are integers, so this rounds down, like the
+                # integer division in Participation.interns_funded.
+                funded_slots=models.ExpressionWrapper(
+                    models.F('total_sponsorship') / 6500,
+                    output_field=models.IntegerField()),
+                )
+
 class Participation(ApprovalStatus):
     community = models.ForeignKey(Community)
     participating_round = models.ForeignKey(RoundPage)
 
+    objects = ParticipationQuerySet.as_manager()
+
     def __str__(self):
         return '{start:%Y %B} to {end:%Y %B} round - {community}'.format(
                 community = self.community.name,
@@ -1276,6 +1448,11 @@ class Participation(ApprovalStatus):
                 )
 
     def interns_funded(self):
+        # Use the annotation if this came from ParticipationQuerySet.with_funding
+        try:
+            return self.funded_slots
+        except AttributeError:
+            pass
         total_funding = self.sponsorship_set.aggregate(total=models.Sum('amount'))['total'] or 0
         # Use integer division so it rounds down.
         return total_funding // 6500
@@ -1311,6 +1488,10 @@ class Participation(ApprovalStatus):
     def submission_and_approval_deadline(self):
         return self.participating_round.lateorgs
 
+    @classmethod
+    def submission_and_approval_deadline_filter(cls, today):
+        return models.Q(participating_round__lateorgs__gt=today)
+
     def is_approver(self, user):
         return user.is_staff
 
@@ -1323,34 +1504,10 @@ class Participation(ApprovalStatus):
     # This function should only be used before applications are open
     # There are a few people who should be approved to see
     # all the details of all projects for a community
-    # before the applications open:
+    # before the applications open. See Role.can_see_all_project_details
+    # for who they are.
     def approved_to_see_all_project_details(self, user):
-        # - staff
-        if user.is_staff:
-            return True
-
-        # Are applications open and everyone should see the projects?
-        # Note in the template, links are still hidden if the
-        # initial application is pending or rejected
-        if self.participating_round.has_application_period_started():
-            return True
-
-        # Remaining conditions all require this person to be logged in
-        if not user.is_authenticated:
-            return False
-
-        role = Role(user, self.participating_round)
-
-        # - an approved coordinator for any approved community
-        if role.is_coordinator:
-            return True
-
-        # - an approved mentor with an approved project for any approved community
-        if role.is_mentor:
-            return True
-
-        # - an approved coordinator for this pending community
-        return self.community.is_coordinator(user)
+        return Role(user, self.participating_round).can_see_all_project_details(self)
 
     # Note that is is more than just the submitter!
     # We want to notify mentors as well as coordinators
@@ -1424,10 +1581,26 @@ class Sponsorship(models.Model):
                 name=self.name,
                 community=self.participation.community)
 
+class ProjectQuerySet(ApprovalStatusQuerySet):
+    def for_catalog(self):
+        """
+        Prefetch everything the public project listings show about each
+        project: its skills, communication channels, and approved mentors.
+        """
+        return self.prefetch_related(
+                'projectskill_set',
+                'communicationchannel_set',
+                models.Prefetch('mentorapproval_set',
+                    queryset=MentorApproval.objects.approved().select_related('mentor__account'),
+                    to_attr='prefetched_approved_mentors'),
+                )
+
 class Project(ApprovalStatus):
     project_round = models.ForeignKey(Participation, verbose_name="Outreachy round and community")
     mentors = models.ManyToManyField(Comrade, through='MentorApproval')
 
+    objects = ProjectQuerySet.as_manager()
+
     THREE_MONTHS = '3M'
     SIX_MONTHS = '6M'
     ONE_YEAR = '1Y'
@@ -1590,6 +1763,10 @@ class Project(ApprovalStatus):
     def submission_and_approval_deadline(self):
         return self.project_round.participating_round.ProjectsDeadline()
 
+    @classmethod
+    def submission_and_approval_deadline_filter(cls, today):
+        return models.Q(project_round__participating_round__lateprojects__gt=today)
+
     def has_application_deadline_passed(self):
         return has_deadline_passed(self.application_deadline())
 
@@ -1619,14 +1796,16 @@ class Project(ApprovalStatus):
         return [ma.mentor.email_address()
                 for ma in self.mentorapproval_set.approved()]
 
+    # These use projectskill_set.all() so they can share skills prefetched by
+    # ProjectQuerySet.for_catalog.
     def required_skills(self):
-        return ProjectSkill.objects.filter(project=self, required=ProjectSkill.STRONG)
+        return [s for s in self.projectskill_set.all() if s.required == ProjectSkill.STRONG]
 
     def preferred_skills(self):
-        return ProjectSkill.objects.filter(project=self, required=ProjectSkill.OPTIONAL)
+        return [s for s in self.projectskill_set.all() if s.required == ProjectSkill.OPTIONAL]
 
     def bonus_skills(self):
-        return ProjectSkill.objects.filter(project=self, required=ProjectSkill.BONUS)
+        return [s for s in self.projectskill_set.all() if s.required == ProjectSkill.BONUS]
 
     def get_applicants_and_contributions_list(self):
         applicants = ApplicantApproval.objects.filter(
@@ -1673,7 +1852,11 @@ class Project(ApprovalStatus):
         return InternSelection.objects.filter(project = self).all()
 
     def get_approved_mentors(self):
-        return self.mentorapproval_set.filter(approval_status=ApprovalStatus.APPROVED)
+        # Use the mentors from ProjectQuerySet.for_catalog if we have them.
+        try:
+            return self.prefetched_approved_mentors
+        except AttributeError:
+            return self.mentorapproval_set.filter(approval_status=ApprovalStatus.APPROVED)
 
     def get_mentor_email_list(self):
         emails = []
@@ -1708,6 +1891,12 @@ class ProjectSkill(models.Model):
 
     skill = models.CharField(max_length=SENTENCE_LENGTH, verbose_name="Skill description", help_text="What is one skill an the applicant needs to have in order to contribute to this internship project, or what skill will they need to be willing to learn?")
 
+    # What classify_skill makes of the description, kept up to date when the
+    # skill is saved so statistics can group by it. A description can
+    # mention several secondary skills, which are all kept, comma-separated.
+    canonical_skill = models.CharField(max_length=SENTENCE_LENGTH, blank=True, db_index=True, editable=False)
+    secondary_skill = models.CharField(max_length=SENTENCE_LENGTH, blank=True, editable=False)
+
     TEACH_YOU = 'WTU'
     CONCEPTS = 'CON'
     EXPERIMENTATION = 'EXP'
@@ -1756,6 +1945,30 @@ class ProjectSkill(models.Model):
         if self.experience_level == self.CHALLENGE:
             return "5"
 
+    def classify(self):
+        self.canonical_skill, self.secondary_skill = classify_skill(self.skill)
+
+    @staticmethod
+    def count_common_skills(rounds):
+        """
+        Count how many skills in approved projects fall under each canonical
+        skill, for each of the given rounds, in one query. Returns a Counter
+        for each round's pk.
+        """
+        counters = defaultdict(Counter)
+        for round_pk, canonical, secondary, count in ProjectSkill.objects.filter(
+                project__project_round__participating_round__in=rounds,
+                project__approval_status=ApprovalStatus.APPROVED,
+        ).values_list(
+                'project__project_round__participating_round',
+                'canonical_skill',
+                'secondary_skill',
+        ).annotate(count=models.Count('pk')).order_by():
+            counters[round_pk][canonical] += count
+            for name in split_secondary_skills(secondary):
+                counters[round_pk][name] += count
+        return counters
+
     def __str__(self):
         return '{start:%Y %B} to {end:%Y %B} round - {community} - {title} - {skill}'.format(
                 start = self.project.project_round.participating_round.internstarts,
@@ -1898,6 +2111,10 @@ class MentorApproval(ApprovalStatus):
     def submission_and_approval_deadline(self):
         return self.project.project_round.participating_round.internends + datetime.timedelta(days=7*5)
 
+    @classmethod
+    def submission_and_approval_deadline_filter(cls, today):
+        return models.Q(project__project_round__participating_round__internends__gt=today - datetime.timedelta(days=7*5))
+
     def is_approver(self, user):
         return self.project.project_round.community.is_coordinator(user)
 
@@ -2021,6 +2238,60 @@ def create_time_commitment_calendar(tcs, application_round):
             date = date + datetime.timedelta(days=1)
     return calendar
 
+def find_longest_free_period(tcs, first_day, last_day, max_hours=20):
+    """
+    Find the longest run of days from first_day to last_day (inclusive)
+    during which the given time commitments add up to at most max_hours
+    hours per week. Each commitment is a dict with 'start_date', 'end_date'
+    and 'hours', as for create_time_commitment_calendar.
+
+    Returns the number of days in the run and its first and last days. If
+    there's more than one longest run, the earliest wins; if no day is free,
+    returns (None, None, None).
+
+    Rather than adding up every commitment on every day, this sorts the days
+    on which the total changes and sweeps over them, so it only takes time
+    proportional to the number of commitments (times its log).
+    """
+    one_day = datetime.timedelta(days=1)
+    end = last_day + one_day
+
+    changes = defaultdict(int)
+    for tc in tcs:
+        start = max(tc['start_date'], first_day)
+        stop = min(tc['end_date'] + one_day, end)
+        if start < stop and tc['hours']:
+            changes[start] += tc['hours']
+            changes[stop] -= tc['hours']
+
+    longest = 0
+    longest_start = None
+    run_start = None
+    hours = 0
+    boundaries = sorted(set(changes) | {first_day, end})
+    for day in boundaries:
+        if day == end:
+            break
+        hours += changes.get(day, 0)
+        # School hours are fractional, and adding and then removing them can
+        # leave rounding noise behind that the day-by-day sum wouldn't have.
+        if round(hours, 9) <= max_hours:
+            if run_start is None:
+                run_start = day
+        elif run_start is not None:
+            if (day - run_start).days > longest:
+                longest = (day - run_start).days
+                longest_start = run_start
+            run_start = None
+
+    if run_start is not None and (end - run_start).days > longest:
+        longest = (end - run_start).days
+        longest_start = run_start
+
+    if longest == 0:
+        return None, None, None
+    return longest, longest_start, longest_start + datetime.timedelta(days=longest - 1)
+
 class ApplicationReviewer(ApprovalStatus):
     comrade = models.ForeignKey(Comrade)
     reviewing_round = models.ForeignKey(RoundPage)
@@ -2033,6 +2304,27 @@ class ApplicationReviewer(ApprovalStatus):
 # citizen of a U.S. export-regulated countries).
 # Once the tool sets them to rejected, they won't be able to edit the information,
 # which is fine.
+class ApplicantApprovalQuerySet(ApprovalStatusQuerySet):
+    def for_review_grid(self):
+        """
+        Fetch everything the reviewer tables show about each application,
+        including every review and its reviewer, in a fixed number of
+        queries.
+        """
+        return self.select_related(
+                'applicant__account',
+                'application_round',
+                'review_owner__comrade',
+                'workeligibility',
+                'priorfossexperience',
+                'barrierstoparticipation',
+                'schoolinformation',
+                ).prefetch_related(
+                models.Prefetch('initialapplicationreview_set',
+                    queryset=InitialApplicationReview.objects.select_related('reviewer__comrade'),
+                    to_attr='prefetched_reviews'),
+                )
+
 class ApplicantApproval(ApprovalStatus):
     applicant = models.ForeignKey(Comrade, on_delete=models.CASCADE)
     application_round = models.ForeignKey(RoundPage, on_delete=models.CASCADE)
@@ -2041,6 +2333,18 @@ class ApplicantApproval(ApprovalStatus):
     ip_address = models.GenericIPAddressField(protocol="both")
     review_owner = models.ForeignKey(ApplicationReviewer, blank=True, null=True)
 
+    objects = ApplicantApprovalQuerySet.as_manager()
+
+    # A copy of the free period from get_time_commitments(), so reviewers
+    # can filter and sort on it. These are kept up to date when an
+    # application is submitted and when time commitments or round dates
+    # change. longest_period_free is 0 if the applicant has no free days,
+    # and null only if it hasn't been computed yet (see the
+    # backfillfreeperiods command).
+    longest_period_free = models.PositiveIntegerField(blank=True, null=True, db_index=True)
+    free_period_start = models.DateField(blank=True, null=True)
+    free_period_end = models.DateField(blank=True, null=True)
+
     def is_approver(self, user):
         return user.is_staff
 
@@ -2116,8 +2420,7 @@ class ApplicantApproval(ApprovalStatus):
             return 'Self-identified their gender'
 
         if self.reason_denied == 'TIME':
-            tcs = self.get_time_commitments()
-            return 'Not enough days free: ' + str(tcs['longest_period_free']) + ' days free / ' + str(tcs['internship_total_days'].days) + ' days total, 49 days free required'
+            return 'Not enough days free: ' + self.get_days_free_summary()
 
         if self.reason_denied[:5] == 'ALIGN':
             return 'Essay answers not aligned with Outreachy program goals'
@@ -2128,10 +2431,7 @@ class ApplicantApproval(ApprovalStatus):
         # Not everyone filled out the school information model
         try:
             if self.schoolinformation and self.schoolinformation.applicant_should_update:
-                tcs = self.get_time_commitments()
-                time_string = str(tcs['longest_period_free']) + ' days free / ' + str(tcs['internship_total_days'].days) + ' days total, 49 days free required'
-
-                return 'Revisions to school info requested: ' + time_string
+                return 'Revisions to school info requested: ' + self.get_days_free_summary()
         except SchoolInformation.DoesNotExist:
             pass
 
@@ -2140,6 +2440,17 @@ class ApplicantApproval(ApprovalStatus):
 
         return 'Unknown'
 
+    def get_days_free_summary(self):
+        internship_total_days = self.application_round.internends - self.application_round.internstarts
+        if self.longest_period_free is None:
+            # Saved before we stored free periods, and backfillfreeperiods
+            # hasn't got to it yet. This is shown for every row of the
+            # review grid, so don't compute it here.
+            days_free = 'Free days not computed yet'
+        else:
+            days_free = str(self.longest_period_free) + ' days free'
+        return days_free + ' / ' + str(internship_total_days.days) + ' days total, 49 days free required'
+
     def get_reviewer_comments(self):
         reviews = InitialApplicationReview.objects.filter(application=self)
         if not reviews:
@@ -2157,60 +2468,110 @@ class ApplicantApproval(ApprovalStatus):
                 }
 
     def get_time_commitments(self):
-        current_round = self.application_round
-        noncollege_school_time_commitments = NonCollegeSchoolTimeCommitment.objects.filter(applicant=self)
-        school_time_commitments = SchoolTimeCommitment.objects.filter(applicant=self)
-        volunteer_time_commitments = VolunteerTimeCommitment.objects.filter(applicant=self)
-        employment_time_commitments = EmploymentTimeCommitment.objects.filter(applicant=self)
-        tcs = [ self.time_commitment_from_model(d, d.hours_per_week)
-                for d in volunteer_time_commitments or []
-                if d ]
-        ctcs = [ self.time_commitment_from_model(d, d.hours_per_week)
-                for d in noncollege_school_time_commitments or []
-                if d ]
-
-        etcs = [ self.time_commitment_from_model(d, 0 if d.quit_on_acceptance else d.hours_per_week)
-                for d in employment_time_commitments or []
-                if d ]
-
-        stcs = [ self.time_commitment_from_model(d, 40 * (d.get_total_credits() / d.typical_credits))
-                for d in school_time_commitments or []
-                if d ]
-        calendar = create_time_commitment_calendar(chain(tcs, ctcs, etcs, stcs), current_round)
-
-        longest_period_free = 0
-        free_period_start_day = 0
-        counter = 0
-        for key, group in groupby(calendar, lambda hours: hours <= 20):
-            group_len = len(list(group))
-            if key is True and group_len > longest_period_free:
-                longest_period_free = group_len
-                free_period_start_day = counter
-            counter = counter + group_len
-        # Catch the case where the person is never free during the internship period
-        if longest_period_free == 0 and free_period_start_day == 0 and counter != 0:
-            longest_period_free = None
-            free_period_start_date = None
-            free_period_end_date = None
-        else:
-            free_period_start_date = current_round.internstarts + datetime.timedelta(days=free_period_start_day)
-            free_period_end_date = current_round.internstarts + datetime.timedelta(days=free_period_start_day + longest_period_free - 1)
-        internship_total_days = current_round.internends - current_round.internstarts
+        # Use the summary from summarize_time_commitments if a view already
+        # computed it for a whole table of applications.
+        try:
+            return self.prefetched_time_commitments
+        except AttributeError:
+            return ApplicantApproval.summarize_time_commitments([self])[self.pk]
 
-        return {
-                'longest_period_free': longest_period_free,
-                'free_period_start_date': free_period_start_date,
-                'free_period_end_date': free_period_end_date,
-                'internship_total_days': internship_total_days,
-                'school_time_commitments': school_time_commitments,
-                'noncollege_school_time_commitments': noncollege_school_time_commitments,
-                'volunteer_time_commitments': volunteer_time_commitments,
-                'employment_time_commitments': employment_time_commitments,
-                }
+    @classmethod
+    def summarize_time_commitments(cls, applications):
+        """
+        Summarize the time commitments of each of the given applications
+        (a queryset or a list), the same way get_time_commitments() does.
+        Returns a dictionary mapping each application's primary key to its
+        summary, and also stores each summary on its application so later
+        calls to get_time_commitments() don't query again.
+
+        This takes four queries however many applications there are, plus
+        one to evaluate the queryset if given one.
+        """
+        applications = list(applications)
+        rounds = {r.pk: r for r in RoundTimeline.load().rounds}
+
+        commitments = {}
+        for model in (NonCollegeSchoolTimeCommitment, SchoolTimeCommitment, VolunteerTimeCommitment, EmploymentTimeCommitment):
+            by_applicant = defaultdict(list)
+            for tc in model.objects.filter(applicant__in=[a.pk for a in applications]):
+                by_applicant[tc.applicant_id].append(tc)
+            commitments[model] = by_applicant
+
+        summaries = {}
+        for application in applications:
+            current_round = rounds.get(application.application_round_id) or application.application_round
+            noncollege_school_time_commitments = commitments[NonCollegeSchoolTimeCommitment][application.pk]
+            school_time_commitments = commitments[SchoolTimeCommitment][application.pk]
+            volunteer_time_commitments = commitments[VolunteerTimeCommitment][application.pk]
+            employment_time_commitments = commitments[EmploymentTimeCommitment][application.pk]
+            tcs = [ application.time_commitment_from_model(d, d.hours_per_week)
+                    for d in volunteer_time_commitments or []
+                    if d ]
+            ctcs = [ application.time_commitment_from_model(d, d.hours_per_week)
+                    for d in noncollege_school_time_commitments or []
+                    if d ]
+
+            etcs = [ application.time_commitment_from_model(d, 0 if d.quit_on_acceptance else d.hours_per_week)
+                    for d in employment_time_commitments or []
+                    if d ]
+
+            stcs = [ application.time_commitment_from_model(d, 40 * (d.get_total_credits() / d.typical_credits))
+                    for d in school_time_commitments or []
+                    if d ]
+            longest_period_free, free_period_start_date, free_period_end_date = find_longest_free_period(
+                    chain(tcs, ctcs, etcs, stcs), current_round.internstarts, current_round.internends)
+            internship_total_days = current_round.internends - current_round.internstarts
+
+            application.prefetched_time_commitments = summaries[application.pk] = {
+                    'longest_period_free': longest_period_free,
+                    'free_period_start_date': free_period_start_date,
+                    'free_period_end_date': free_period_end_date,
+                    'internship_total_days': internship_total_days,
+                    'school_time_commitments': school_time_commitments,
+                    'noncollege_school_time_commitments': noncollege_school_time_commitments,
+                    'volunteer_time_commitments': volunteer_time_commitments,
+                    'employment_time_commitments': employment_time_commitments,
+                    }
+        return summaries
+
+    @classmethod
+    def update_free_periods(cls, applications):
+        """
+        Recompute and save the stored free period of each of the given
+        applications (a queryset or a list), using only the queries that
+        summarize_time_commitments() needs plus one update per application
+        whose free period changed.
+        """
+        applications = list(applications)
+        summaries = cls.summarize_time_commitments(applications)
+        for application in applications:
+            summary = summaries[application.pk]
+            free_period = {
+                # find_longest_free_period says None for no free days, but
+                # here None means we haven't looked yet.
+                'longest_period_free': summary['longest_period_free'] or 0,
+                'free_period_start': summary['free_period_start_date'],
+                'free_period_end': summary['free_period_end_date'],
+            }
+            if all(getattr(application, field) == value for field, value in free_period.items()):
+                continue
+            for field, value in free_period.items():
+                setattr(application, field, value)
+            # Use update() rather than save() so this doesn't set off the
+            # signal handlers for ApplicantApproval.
+            cls.objects.filter(pk=application.pk).update(**free_period)
+        return applications
+
+    def get_reviews(self):
+        # Use the reviews from ApplicantApprovalQuerySet.for_review_grid if we have them.
+        try:
+            return self.prefetched_reviews
+        except AttributeError:
+            return InitialApplicationReview.objects.filter(application=self)
 
     def get_essay_ratings(self):
         ratings_list = []
-        ratings = InitialApplicationReview.objects.filter(application=self)
+        ratings = self.get_reviews()
         for r in ratings:
            ratings_list.append(r.get_essay_rating())
         return ratings_list
@@ -2234,7 +2595,7 @@ class ApplicantApproval(ApprovalStatus):
 
     def get_all_red_flags(self):
         red_flags_list = []
-        reviews = InitialApplicationReview.objects.filter(application=self)
+        reviews = self.get_reviews()
         for r in reviews:
            red_flags_list.append(r.get_red_flags())
         return red_flags_list
@@ -2650,6 +3011,9 @@ class OfficialSchool(models.Model):
     university_website = models.URLField(
             help_text="University or college website")
 
+    # get_school_domain(university_website), kept up to date on save.
+    school_domain = models.CharField(max_length=255, blank=True, db_index=True, editable=False)
+
 class OfficialSchoolTerm(models.Model):
     school = models.ForeignKey(OfficialSchool, on_delete=models.CASCADE)
     term_name = models.CharField(
@@ -2748,6 +3112,9 @@ class SchoolInformation(models.Model):
 
     university_website = models.URLField(help_text="University or college website")
 
+    # get_school_domain(university_website), kept up to date on save.
+    school_domain = models.CharField(max_length=255, blank=True, db_index=True, editable=False)
+
     current_academic_calendar = models.URLField(verbose_name="Link to your official academic calendar for your *current* school term",
             help_text="For some students, their academic calendar is not available online (or is only available to students). In this case, please upload a copy of the PDF or a picture of your official academic calendar to a file sharing site and add the link to the file here. Do not leave off your academic calendar or your initial application will not be processed promptly.")
 
@@ -2767,65 +3134,46 @@ class SchoolInformation(models.Model):
     applicant_should_update = models.BooleanField(default=False)
 
     def find_official_terms(self):
-        school_url = urlparse(self.university_website)
-        school_domain = school_url.netloc
-
-        # find all OfficialSchools with the same domain
-        matches = OfficialSchool.objects.filter(university_website__icontains=school_domain)
-        if not matches:
-            return []
+        if not self.school_domain:
+            return OfficialSchoolTerm.objects.none()
+        return OfficialSchoolTerm.objects.filter(
+                school__school_domain=self.school_domain,
+        ).select_related('school').order_by('school__university_website', 'start_date')
 
-        # We need to be able to combine querysets with Q
-        # https://docs.djangoproject.com/en/1.11/topics/db/queries/#complex-lookups-with-q-objects
-        results = OfficialSchoolTerm.objects.all()
-        query = models.Q()
-        for school_match in matches:
-            query = query | models.Q(school=school_match)
-        return results.filter(query).order_by('school__university_website', 'start_date')
-
-    def pending_classmates(self):
-        school_url = urlparse(self.university_website)
-        school_domain = school_url.netloc
-
-        # find the number of classmates applied this round
-        return ApplicantApproval.objects.filter(
-                approval_status=ApprovalStatus.PENDING,
-                application_round=self.applicant.application_round,
-                schoolinformation__university_website__icontains=school_domain).count()
-
-    def total_classmates(self):
-        school_url = urlparse(self.university_website)
-        school_domain = school_url.netloc
-
-        # find the number of classmates applied this round
-        return ApplicantApproval.objects.filter(
-                application_round=self.applicant.application_round,
-                schoolinformation__university_website__icontains=school_domain).count()
-
-    def acceptance_rate(self):
-        school_url = urlparse(self.university_website)
-        school_domain = school_url.netloc
-
-        # find the number of classmates applied this round
-        total_classmates = self.total_classmates()
-        accepted = ApplicantApproval.objects.filter(
-                approval_status=ApprovalStatus.APPROVED,
-                application_round=self.applicant.application_round,
-                schoolinformation__university_website__icontains=school_domain).count()
-        return accepted / total_classmates * 100
-
-    def time_rejection_rate(self):
-        school_url = urlparse(self.university_website)
-        school_domain = school_url.netloc
-
-        # find the number of classmates applied this round
-        total_classmates = self.total_classmates()
-        rejected = ApplicantApproval.objects.filter(
-                approval_status=ApprovalStatus.REJECTED,
-                reason_denied="TIME",
-                application_round=self.applicant.application_round,
-                schoolinformation__university_website__icontains=school_domain).count()
-        return rejected / total_classmates * 100
+    @cached_property
+    def classmate_stats(self):
+        """
+        How many people applied this round from a school with the same
+        website domain, including this applicant, and how their
+        applications went, in one query.
+        """
+        def count_where(**conditions):
+            return models.Sum(models.Case(
+                models.When(then=1, **conditions),
+                default=0,
+                output_field=models.IntegerField()))
+
+        stats = {'total': 0, 'pending': 0, 'accepted': 0, 'time_rejected': 0}
+        if self.school_domain:
+            stats.update(ApplicantApproval.objects.filter(
+                    application_round_id=self.applicant.application_round_id,
+                    schoolinformation__school_domain=self.school_domain,
+            ).aggregate(
+                    total=models.Count('pk'),
+                    pending=count_where(approval_status=ApprovalStatus.PENDING),
+                    accepted=count_where(approval_status=ApprovalStatus.APPROVED),
+                    time_rejected=count_where(approval_status=ApprovalStatus.REJECTED, reason_denied='TIME'),
+            ))
+        # Sum over no rows is None, not zero.
+        for key, value in stats.items():
+            stats[key] = value or 0
+
+        if stats['total']:
+            stats['acceptance_rate'] = stats['accepted'] / stats['total'] * 100
+            stats['time_rejection_rate'] = stats['time_rejected'] / stats['total'] * 100
+        else:
+            stats['acceptance_rate'] = stats['time_rejection_rate'] = 0
+        return stats
 
     def print_terms(school_info):
         print(school_info.applicant.get_approval_status_display(), " ", school_info.applicant.applicant.public_name, " <", school_info.applicant.applicant.account.email, ">")
@@ -2936,6 +3284,89 @@ class PromotionTracking(models.Model):
 # reviewer models
 # --------------------------------------------------------------------------- #
 
+class ApplicationSearchDocument(models.Model):
+    """
+    The text reviewers can search for in each application, kept up to date
+    by the signal handlers at the end of this file. The full-text index over
+    it is whatever home/fulltext.py could create for this database.
+    """
+    application = models.OneToOneField(ApplicantApproval, on_delete=models.CASCADE, primary_key=True, related_name='search_document')
+    people = models.TextField(blank=True)
+    essays = models.TextField(blank=True)
+
+    @classmethod
+    def update_for(cls, applications):
+        """
+        Rebuild the search documents for the given ApplicantApproval
+        queryset in a fixed number of queries.
+        """
+        documents = []
+        for application in applications.select_related(
+                'applicant__account',
+                'schoolinformation',
+                'barrierstoparticipation',
+        ):
+            people = [
+                    application.applicant.public_name,
+                    application.applicant.legal_name,
+                    application.applicant.account.username,
+                    application.applicant.account.email,
+            ]
+            essays = []
+            try:
+                people.append(application.schoolinformation.university_name)
+            except SchoolInformation.DoesNotExist:
+                pass
+            try:
+                barriers = application.barrierstoparticipation
+                essays.extend((
+                    barriers.barriers_to_contribution,
+                    barriers.systematic_bias,
+                    barriers.lacking_representation,
+                ))
+            except BarriersToParticipation.DoesNotExist:
+                pass
+            documents.append(cls(
+                application=application,
+                people='\n'.join(people),
+                essays='\n\n'.join(essays),
+            ))
+
+        # Replacing the rows keeps this to two queries however many
+        # documents there are.
+        cls.objects.filter(application__in=[d.application_id for d in documents]).delete()
+        cls.objects.bulk_create(documents)
+
+    @staticmethod
+    def search(query, current_round, applications=None, limit=50):
+        """
+        Return up to limit applications in this round that match the
+        query, best match first. If given, the applications are loaded
+        from the applications queryset, so callers can choose what to
+        fetch along with them.
+        """
+        if applications is None:
+            applications = ApplicantApproval.objects.all()
+        connection = connections[ApplicationSearchDocument.objects.db]
+        matches = fulltext.APPLICATIONS.search(connection, query, limit,
+                join='JOIN home_applicantapproval a ON a.id = d.application_id',
+                where='a.application_round_id = %s',
+                params=[current_round.pk])
+        if matches is None:
+            # No full-text index, so look for each word anywhere.
+            terms = fulltext.search_terms(query)
+            if not terms:
+                return []
+            applications = applications.filter(application_round=current_round)
+            for term in terms:
+                applications = applications.filter(
+                        models.Q(search_document__people__icontains=term)
+                        | models.Q(search_document__essays__icontains=term))
+            return list(applications.order_by('-pk')[:limit])
+
+        found = applications.in_bulk([pk for pk, score in matches])
+        return [found[pk] for pk, score in matches if pk in found]
+
 class InitialApplicationReview(models.Model):
     application = models.ForeignKey(ApplicantApproval)
     reviewer = models.ForeignKey(ApplicationReviewer)
@@ -3480,6 +3911,11 @@ class BaseFeedback(models.Model):
     allow_edits = models.BooleanField()
     ip_address = models.GenericIPAddressField(protocol="both")
 
+    # Who last submitted this feedback through the feedback form, and when.
+    # Staff edits in the admin don't change these.
+    submitted_by = models.ForeignKey(User, null=True, blank=True, on_delete=models.SET_NULL, related_name='+')
+    submitted_at = models.DateTimeField(null=True, blank=True)
+
     def intern_name(self):
         return self.intern_selection.intern_name()
 
@@ -3492,6 +3928,19 @@ class BaseFeedback(models.Model):
     def project_name(self):
         return self.intern_selection.project_name()
 
+    def get_submission_date(self):
+        return self.submitted_at
+
+    @classmethod
+    def backfill_submitters(cls, feedbacks):
+        """
+        Fill in submitted_by and submitted_at on feedback saved before we
+        recorded them, from the latest revision made by one of the accounts
+        that cls.submitter_accounts says could have submitted it.
+        """
+        accounts = cls.submitter_accounts([f.intern_selection_id for f in feedbacks])
+        return submitters.backfill_submitters(feedbacks, accounts, Version.objects.get_for_model(cls))
+
     class Meta:
         abstract = True
 
@@ -3510,56 +3959,29 @@ class BaseMentorFeedback(BaseFeedback):
 
     termination_reason = RichTextField(verbose_name="Why you feel the internship should be terminated?", help_text="Please elaborate on the efforts you have put in to get your intern back on track, and the results of those efforts. Tell us about your intern's work efforts, communication frequency, and meeting attendance since their last extension. Provide links to any work that is still in progress or has been completed since their last extension. Please let us know any additional information about why the internship should be terminated.", blank=True, null=True)
 
-    def get_versions(self):
-        return Version.objects.get_for_object(self)
-
-    def find_version_mentor_edited(self):
-        # When a staff member modifies the initial feedback to approve payment or change internship dates,
-        # it counts as a revision. Look for the latest feedback from an approved mentor.
-        # (Note: this may not won't work if we switch mentors.
-        # we could ignore all revisions made by staff, but staff can be mentors too.)
-        versions = Version.objects.get_for_object(self)
-        for v in versions:
-            if self.intern_selection.mentors.all().approved().filter(mentor__account=v.revision.user).exists():
-                return v
-        return None
-
-    def get_submission_date(self):
-        version = self.find_version_mentor_edited()
-        if version:
-            return version.revision.date_created
+    @staticmethod
+    def submitter_accounts(intern_selection_ids):
+        return submitters.mentor_accounts(MentorRelationship, intern_selection_ids)
 
     def get_mentor_public_name(self):
-        version = self.find_version_mentor_edited()
-        if version:
-            return version.revision.user.comrade.public_name
+        if self.submitted_by:
+            return self.submitted_by.comrade.public_name
 
     def get_mentor_legal_name(self):
-        version = self.find_version_mentor_edited()
-        if version:
-            return version.revision.user.comrade.legal_name
+        if self.submitted_by:
+            return self.submitted_by.comrade.legal_name
 
     def get_mentor_email(self):
-        version = self.find_version_mentor_edited()
-        if version:
-            return version.revision.user.email
-
-    def get_date_submitted(self):
-        version = self.find_version_mentor_edited()
-        if version:
-            return version.revision.date_created
+        if self.submitted_by:
+            return self.submitted_by.email
 
     class Meta:
         abstract = True
 
-# There shouldn't be a need to record which mentor filled out the form.
-# The revision control on the object should store which Django user made the changes.
-#
-# We can dig out the latest feedback version
-# (assuming self references the InitialMentorFeedback object):
-# from reversion.models import Version
-# versions = Version.objects.get_for_object(self)
-# print('On {:%Y-%m-%d at %I:%M%p} %u wrote:\n{}'.format(versions[0].revision.date_created, versions[0].revision.user))
+# The feedback form records which mentor filled it out in submitted_by.
+# The revision control on the object also stores which Django user made each
+# change, including staff edits; backfill_submitters digs the submitter out
+# of those revisions for feedback saved before submitted_by existed.
 #
 # This also allows us to keep the feedback around, even if a mentor withdraws from the project.
 # As long as their Django user account is intact, the feedback should remain intact.
@@ -3659,19 +4081,9 @@ class BaseInternFeedback(BaseFeedback):
 
     mentor_support = models.TextField(verbose_name="Please provide a paragraph describing how your mentor has (or has not) been helping you. This information will only be seen by Outreachy mentors. We want you to be honest with us if you are having trouble with your mentor, so we can help you get a better internship experience.")
 
-    def find_version_intern_edited(self):
-        # When a staff member modifies the initial feedback to approve payment or change internship dates,
-        # it counts as a revision. Look for the latest feedback from the intern.
-        versions = Version.objects.get_for_object(self)
-        for v in versions:
-            if self.intern_selection.applicant.applicant.account == v.revision.user:
-                return v
-        return None
-
-    def get_submission_date(self):
-        version = self.find_version_intern_edited()
-        if version:
-            return version.revision.date_created
+    @staticmethod
+    def submitter_accounts(intern_selection_ids):
+        return submitters.intern_accounts(InternSelection, intern_selection_ids)
 
     class Meta:
         abstract = True
@@ -4214,6 +4626,246 @@ class AlumSurvey(models.Model):
             return self.survey_tracker.alumni_info.community
         return None
 
+PLANET_GENERATION_KEY = 'planet-generation'
+
+class InternBlog(models.Model):
+    """
+    An intern's blog feed, as the fetchplanet command last saw it. Interns
+    who are no longer approved or in good standing keep their row, with
+    their posts, but aren't shown on the planet.
+    """
+    comrade = models.OneToOneField(Comrade, primary_key=True, on_delete=models.CASCADE)
+    url = models.URLField()
+    active = models.BooleanField(default=True)
+
+    # Sent back with the next fetch, so unchanged feeds can answer 304 Not
+    # Modified.
+    etag = models.CharField(max_length=255, blank=True)
+    last_modified = models.CharField(max_length=255, blank=True)
+
+    fetched = models.DateTimeField(null=True, blank=True)
+    error = models.CharField(max_length=255, blank=True)
+
+    def __str__(self):
+        return self.url
+
+    @classmethod
+    def sync_approved_interns(cls, today):
+        """
+        Make sure there's an active InternBlog for every approved intern in
+        good standing who has given us a blog feed, from every round that
+        has announced its interns, and mark every other one inactive.
+        Returns the active blogs.
+        """
+        interns = InternSelection.objects.filter(
+                organizer_approved=True,
+                in_good_standing=True,
+                project__approval_status=ApprovalStatus.APPROVED,
+                project__project_round__approval_status=ApprovalStatus.APPROVED,
+                project__project_round__participating_round__internannounce__lte=today,
+                ).exclude(
+                funding_source=InternSelection.NOT_FUNDED,
+                )
+        comrades = Comrade.objects.filter(
+                pk__in=interns.values('applicant__applicant'),
+                ).exclude(blog_rss_url='')
+        feed_urls = dict(comrades.values_list('pk', 'blog_rss_url'))
+
+        blogs = cls.objects.in_bulk(list(feed_urls))
+        for comrade_id, url in feed_urls.items():
+            blog = blogs.get(comrade_id)
+            if blog is None:
+                blog = cls(comrade_id=comrade_id, url=url)
+            elif blog.url == url and blog.active:
+                continue
+            elif blog.url != url:
+                # The validators from the old feed mean nothing to the new
+                # one.
+                blog.url = url
+                blog.etag = ''
+                blog.last_modified = ''
+            blog.active = True
+            blog.save()
+        cls.objects.filter(active=True).exclude(pk__in=list(feed_urls)).update(active=False)
+        return cls.objects.filter(active=True).order_by('pk')
+
+    def update_from(self, result, now):
+        """
+        Store the result of planet.fetch for this blog: any new or changed
+        posts, and the headers to send with the next fetch.
+        """
+        self.fetched = now
+        self.error = ''
+        if result.error:
+            self.error = result.error[:255]
+        elif result.status == 304:
+            pass
+        elif result.status != 200:
+            self.error = 'HTTP status {}'.format(result.status)
+        else:
+            try:
+                posts = planet.parse_feed(result.content)
+            except ValueError as e:
+                self.error = str(e)[:255]
+            else:
+                self.store_posts(posts)
+                self.etag = result.etag[:255]
+                self.last_modified = result.last_modified[:255]
+        self.save()
+
+    def store_posts(self, posts):
+        # Feeds sometimes repeat an entry, and guids can also collide once
+        # they're cut down to fit, so only keep the first (newest) post
+        # with each one.
+        unique = OrderedDict()
+        for fields in posts:
+            unique.setdefault(fields['guid'][:500], dict(fields, guid=fields['guid'][:500]))
+        posts = list(unique.values())
+
+        existing = {
+            post.guid: post
+            for post in self.internblogpost_set.filter(guid__in=[post['guid'] for post in posts])
+        }
+        new_posts = []
+        for fields in posts:
+            post = existing.get(fields['guid'])
+            if post is None:
+                new_posts.append(InternBlogPost(blog=self, **fields))
+            elif post.updated != fields['updated']:
+                for name, value in fields.items():
+                    setattr(post, name, value)
+                post.save()
+        InternBlogPost.objects.bulk_create(new_posts)
+
+class InternBlogPost(models.Model):
+    blog = models.ForeignKey(InternBlog, on_delete=models.CASCADE)
+    guid = models.CharField(max_length=500)
+    title = models.CharField(max_length=255)
+    link = models.URLField(max_length=500)
+    # Plain text; the HTML from the feed isn't kept.
+    summary = models.TextField(blank=True)
+    published = models.DateTimeField(db_index=True)
+    updated = models.DateTimeField()
+
+    class Meta:
+        unique_together = (
+                ('blog', 'guid'),
+                )
+
+    def __str__(self):
+        return self.title
+
+    @staticmethod
+    def for_planet(limit=50):
+        return InternBlogPost.objects.filter(
+                blog__active=True,
+                ).select_related('blog__comrade').order_by('-published', '-pk')[:limit]
+
+class OutboundEmail(models.Model):
+    """
+    A message waiting to be delivered by the deliveroutbox command. Web
+    requests only write these rows, inside the request's transaction, so a
+    request that fails sends nothing and a large mailing can't make a
+    request time out.
+    """
+    PENDING = 'P'
+    SENT = 'S'
+    FAILED = 'F'
+    STATUS_CHOICES = (
+        (PENDING, 'Pending'),
+        (SENT, 'Sent'),
+        (FAILED, 'Failed'),
+    )
+    status = models.CharField(max_length=1, choices=STATUS_CHOICES, default=PENDING)
+
+    # Messages queued twice with the same key, for example by a
+    # double-clicked form, are only stored and sent once.
+    idempotency_key = models.CharField(max_length=64, unique=True, null=True, blank=True)
+
+    created = models.DateTimeField(auto_now_add=True)
+    next_attempt = models.DateTimeField(db_index=True)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    last_error = models.TextField(blank=True)
+    sent = models.DateTimeField(null=True, blank=True)
+
+    # Addresses are stored one per line.
+    from_email = models.TextField()
+    to = models.TextField(blank=True)
+    cc = models.TextField(blank=True)
+    bcc = models.TextField(blank=True)
+    reply_to = models.TextField(blank=True)
+    subject = models.TextField(blank=True)
+    body = models.TextField(blank=True)
+    # Extra headers as a JSON object, including a fixed Message-ID so
+    # recipients can spot a message that was sent again after a crash.
+    headers = models.TextField(default='{}')
+    # 'plain' or 'html', for the body.
+    content_subtype = models.CharField(max_length=50, default='plain')
+    # Other versions of the body, like an HTML one, as a JSON list of
+    # [content, mimetype] pairs.
+    alternatives = models.TextField(default='[]')
+    # A JSON list of [filename, base64 content, mimetype] triples.
+    attachments = models.TextField(default='[]')
+
+    def __str__(self):
+        return '{} to {}'.format(self.subject, ', '.join(self.to.splitlines()))
+
+    @classmethod
+    def from_message(cls, message, idempotency_key=None):
+        headers = dict(message.extra_headers)
+        headers.setdefault('Message-ID', make_msgid())
+        attachments = []
+        for attachment in message.attachments:
+            if not isinstance(attachment, tuple):
+                # Ready-made MIME parts can't be stored faithfully, and
+                # silently sending the message without them would be
+                # worse than not queueing it.
+                raise ValueError("Can't queue an email with a MIME attachment: {}".format(message.subject))
+            filename, content, mimetype = attachment
+            if isinstance(content, str):
+                content = content.encode('utf-8')
+            attachments.append([filename, b64encode(content).decode('ascii'), mimetype])
+        return cls(
+            idempotency_key=idempotency_key,
+            next_attempt=datetime.datetime.now(datetime.timezone.utc),
+            from_email=str(message.from_email),
+            to='\n'.join(str(address) for address in message.to),
+            cc='\n'.join(str(address) for address in message.cc),
+            bcc='\n'.join(str(address) for address in message.bcc),
+            reply_to='\n'.join(str(address) for address in message.reply_to),
+            subject=message.subject,
+            body=message.body,
+            headers=json.dumps(headers),
+            content_subtype=message.content_subtype,
+            alternatives=json.dumps(getattr(message, 'alternatives', [])),
+            attachments=json.dumps(attachments),
+        )
+
+    def to_message(self, connection=None):
+        message = EmailMultiAlternatives(
+            subject=self.subject,
+            body=self.body,
+            from_email=self.from_email,
+            to=self.to.splitlines(),
+            cc=self.cc.splitlines(),
+            bcc=self.bcc.splitlines(),
+            reply_to=self.reply_to.splitlines(),
+            headers=json.loads(self.headers),
+            alternatives=[tuple(alternative) for alternative in json.loads(self.alternatives)],
+            connection=connection,
+        )
+        message.content_subtype = self.content_subtype
+        for filename, content, mimetype in json.loads(self.attachments):
+            content = b64decode(content)
+            # EmailMessage wants text attachments as str.
+            if mimetype and mimetype.startswith('text/'):
+                try:
+                    content = content.decode('utf-8')
+                except UnicodeDecodeError:
+                    pass
+            message.attach(filename, content, mimetype)
+        return message
+
 class Role(object):
     """
     Compute the role which the current visitor most likely is interested in for
@@ -4299,6 +4951,18 @@ class Role(object):
             )
         return Community.objects.none()
 
+    @cached_property
+    def coordinated_community_ids(self):
+        """
+        Get the IDs of all communities where this person is an approved
+        coordinator, whether or not the community is participating.
+        """
+        if self.user.is_authenticated:
+            return frozenset(CoordinatorApproval.objects.approved().filter(
+                coordinator__account=self.user,
+            ).values_list('community_id', flat=True))
+        return frozenset()
+
     @cached_property
     def projects_with_upcoming_and_passed_deadlines(self):
         applicant = self.application
@@ -4307,7 +4971,10 @@ class Role(object):
 
         all_projects = applicant.get_projects_contributed_to()
         applied_projects = set(applicant.get_projects_applied_to().values_list('pk', flat=True))
+        return self.split_projects_by_deadline(all_projects, applied_projects)
 
+    @staticmethod
+    def split_projects_by_deadline(all_projects, applied_projects):
         upcoming_deadlines = []
         passed_deadlines = []
         for project in all_projects:
@@ -4320,6 +4987,55 @@ class Role(object):
         passed_deadlines.sort(key=lambda x: x.did_apply, reverse=True)
         return upcoming_deadlines, passed_deadlines
 
+    @classmethod
+    def for_applications(cls, applications, today=None):
+        """
+        Build the Role of the applicant behind each of the given initial
+        applications, with the application and the projects they've
+        contributed to already loaded. This takes the same number of queries
+        however many applications there are, so it's the way to go when
+        sending the same email to many applicants. Pass a queryset, or
+        applications loaded with their applicant's account.
+        """
+        if isinstance(applications, models.QuerySet):
+            applications = applications.select_related('applicant__account', 'application_round')
+        applications = list(applications)
+
+        contributed = defaultdict(set)
+        for applicant_id, project_id in Contribution.objects.filter(
+                applicant__in=applications,
+        ).values_list('applicant_id', 'project_id'):
+            contributed[applicant_id].add(project_id)
+
+        applied = defaultdict(set)
+        for applicant_id, project_id in FinalApplication.objects.filter(
+                applicant__in=applications,
+        ).values_list('applicant_id', 'project_id'):
+            applied[applicant_id].add(project_id)
+
+        all_projects = Project.objects.filter(
+            pk__in=set(chain.from_iterable(contributed.values())),
+        ).select_related(
+            'project_round__community',
+            'project_round__participating_round',
+        ).order_by(
+            '-deadline',
+            'project_round__community__name',
+            'short_title',
+        )
+        all_projects = list(all_projects)
+
+        roles = []
+        for application in applications:
+            role = cls(application.applicant.account, application.application_round, today)
+            role.__dict__['application'] = application
+            # Each applicant needs their own copies, because splitting the
+            # projects records whether this applicant applied on them.
+            projects = [copy.copy(p) for p in all_projects if p.pk in contributed[application.pk]]
+            role.__dict__['projects_with_upcoming_and_passed_deadlines'] = cls.split_projects_by_deadline(projects, applied[application.pk])
+            roles.append(role)
+        return roles
+
     # Anything that just uses other properties does not need to be cached:
 
     @property
@@ -4339,6 +5055,38 @@ class Role(object):
         """
         return self.is_organizer or self.is_mentor or self.is_coordinator or self.is_reviewer
 
+    @property
+    def can_see_all_project_details_in_round(self):
+        """
+        There are a few people who should be approved to see all the details
+        of all projects for every community in the current round before the
+        applications open:
+        """
+        # - staff
+        if self.user.is_staff:
+            return True
+
+        # Are applications open and everyone should see the projects?
+        # Note in the template, links are still hidden if the
+        # initial application is pending or rejected
+        if self.current_round is not None and self.current_round.has_application_period_started():
+            return True
+
+        # Remaining conditions all require this person to be logged in
+        if not self.user.is_authenticated:
+            return False
+
+        # - an approved coordinator for any approved community
+        # - an approved mentor with an approved project for any approved community
+        return self.is_coordinator or self.is_mentor
+
+    def can_see_all_project_details(self, participation):
+        if self.can_see_all_project_details_in_round:
+            return True
+
+        # - an approved coordinator for this pending community
+        return participation.community_id in self.coordinated_community_ids
+
     @property
     def needs_application(self):
         """
@@ -4368,6 +5116,11 @@ class Role(object):
         upcoming, passed = self.projects_with_upcoming_and_passed_deadlines
         return passed
 
+    @property
+    def projects_applied_to(self):
+        upcoming, passed = self.projects_with_upcoming_and_passed_deadlines
+        return [ p for p in chain(upcoming, passed) if p.did_apply ]
+
     @property
     def passed_projects_not_applied_to(self):
         return [ p for p in self.projects_with_passed_deadlines if not p.did_apply ]
@@ -4380,3 +5133,257 @@ DASHBOARD_MODELS = (
         Project,
         MentorApproval,
         )
+
+# The header on every page shows how many requests are waiting on the
+# logged-in user, so that count is cached per user. Rather than trying to work
+# out which users a change affects, any change to an approval invalidates
+# everyone's count by switching to a new cache key generation.
+PENDING_APPROVALS_GENERATION_KEY = 'pending-approvals-generation'
+
+def count_pending_approvals(user, today):
+    """
+    Count the pending requests in DASHBOARD_MODELS which the given user can
+    act on, leaving out any whose submission and approval deadline has
+    passed. All the models are counted together in one query.
+    """
+    querysets = [
+            model.objects_for_dashboard(user).filter(
+                model.submission_and_approval_deadline_filter(today),
+                approval_status=ApprovalStatus.PENDING,
+            ).order_by().annotate(
+                dashboard_model=models.Value(index, output_field=models.IntegerField()),
+            ).values_list('dashboard_model', 'pk')
+            for index, model in enumerate(DASHBOARD_MODELS)
+            ]
+    # UNION (not UNION ALL) drops the duplicate rows that the joins in
+    # objects_for_dashboard produce, the same way distinct() would.
+    return querysets[0].union(*querysets[1:]).count()
+
+def get_cache_generation(key):
+    """
+    Return the current generation stored under the given cache key. Cached
+    values include the generation in their own keys, so storing a new
+    generation invalidates all of them at once.
+    """
+    generation = cache.get(key)
+    if generation is None:
+        generation = uuid.uuid4().hex
+        cache.add(key, generation, None)
+        generation = cache.get(key, generation)
+    return generation
+
+def new_cache_generation(key):
+    cache.set(key, uuid.uuid4().hex, None)
+
+def get_pending_approvals(user):
+    now = datetime.datetime.now(datetime.timezone.utc)
+    today = get_deadline_date_for(now)
+
+    generation = get_cache_generation(PENDING_APPROVALS_GENERATION_KEY)
+
+    # Deadlines pass at a fixed time each day, and staff see everything, so
+    # both of those have to be part of the key too.
+    key = 'pending-approvals:{}:{}:{}:{}'.format(generation, today, user.pk, user.is_staff)
+    pending_approvals = cache.get(key)
+    if pending_approvals is None:
+        pending_approvals = count_pending_approvals(user, today)
+        cache.set(key, pending_approvals)
+    return pending_approvals
+
+@receiver(post_save)
+@receiver(post_delete)
+def invalidate_pending_approvals(sender, **kwargs):
+    if issubclass(sender, ApprovalStatus):
+        new_cache_generation(PENDING_APPROVALS_GENERATION_KEY)
+
+PUBLIC_PAGES_GENERATION_KEY = 'public-pages-generation'
+
+# Saving or deleting any of these can change what the public round and
+# community pages show to logged-out visitors.
+PUBLIC_PAGES_DEPENDENCIES = (
+        RoundPage,
+        CohortPage,
+        AlumInfo,
+        Community,
+        Participation,
+        Sponsorship,
+        Project,
+        ProjectSkill,
+        CommunicationChannel,
+        MentorApproval,
+        InternSelection,
+        Comrade,
+        )
+
+def get_public_page_cache_key(request):
+    """
+    Cache key for the page at this request's URL as shown to logged-out
+    visitors. Pages change when a deadline passes, so the current deadline
+    date is part of the key.
+    """
+    now = datetime.datetime.now(datetime.timezone.utc)
+    today = get_deadline_date_for(now)
+    generation = get_cache_generation(PUBLIC_PAGES_GENERATION_KEY)
+    url = hashlib.md5(request.build_absolute_uri().encode('utf-8')).hexdigest()
+    return 'public-page:{}:{}:{}'.format(generation, today, url)
+
+@receiver(post_save)
+@receiver(post_delete)
+def invalidate_public_pages(sender, **kwargs):
+    if issubclass(sender, PUBLIC_PAGES_DEPENDENCIES):
+        new_cache_generation(PUBLIC_PAGES_GENERATION_KEY)
+
+def bulk_updated_public_pages(model):
+    """
+    Call this after updating rows of the given model in bulk, since
+    QuerySet.update doesn't send the signals that usually invalidate the
+    cached public pages which show them.
+    """
+    invalidate_public_pages(model)
+
+@receiver(post_save, sender=RoundPage)
+@receiver(post_delete, sender=RoundPage)
+def invalidate_round_timeline(sender, **kwargs):
+    RoundTimeline.invalidate()
+
+@receiver(page_published)
+@receiver(page_unpublished)
+@receiver(post_delete)
+def invalidate_blog_feed(sender, instance, **kwargs):
+    if not isinstance(instance, Page):
+        return
+    if isinstance(instance, BlogIndex):
+        instance.invalidate_feed()
+        return
+    # A post was published, unpublished, or deleted; its parent may not
+    # exist any more if this is part of deleting the whole blog.
+    parent = BlogIndex.objects.filter(
+            path=instance.path[:-instance.steplen],
+            depth=instance.depth - 1,
+            ).first()
+    if parent is not None:
+        parent.remove_feed_archives(instance)
+        parent.invalidate_feed()
+
+TIME_COMMITMENT_MODELS = (
+        NonCollegeSchoolTimeCommitment,
+        SchoolTimeCommitment,
+        VolunteerTimeCommitment,
+        EmploymentTimeCommitment,
+        )
+
+@receiver(post_save)
+@receiver(post_delete)
+def update_applicant_free_period(sender, instance, **kwargs):
+    if sender in TIME_COMMITMENT_MODELS:
+        ApplicantApproval.update_free_periods(
+            ApplicantApproval.objects.filter(pk=instance.applicant_id))
+
+@receiver(post_save, sender=ApplicantApproval)
+def index_application(sender, instance, **kwargs):
+    ApplicationSearchDocument.update_for(ApplicantApproval.objects.filter(pk=instance.pk))
+
+@receiver(post_save, sender=SchoolInformation)
+@receiver(post_save, sender=BarriersToParticipation)
+def index_application_parts(sender, instance, **kwargs):
+    ApplicationSearchDocument.update_for(ApplicantApproval.objects.filter(pk=instance.applicant_id))
+
+@receiver(post_delete, sender=SchoolInformation)
+@receiver(post_delete, sender=BarriersToParticipation)
+def reindex_application_parts(sender, instance, **kwargs):
+    # This may be part of deleting the whole application, so wait until
+    # that's done; then there's nothing left to index.
+    applications = ApplicantApproval.objects.filter(pk=instance.applicant_id)
+    transaction.on_commit(lambda: ApplicationSearchDocument.update_for(applications))
+
+@receiver(post_save, sender=Comrade)
+def index_applicant(sender, instance, created, **kwargs):
+    if not created:
+        ApplicationSearchDocument.update_for(instance.applicantapproval_set.all())
+
+@receiver(post_save, sender=User)
+def index_applicant_account(sender, instance, created, update_fields=None, **kwargs):
+    # Logging in saves last_login, which isn't in any search document.
+    if created or (update_fields is not None and not {'username', 'email'} & set(update_fields)):
+        return
+    ApplicationSearchDocument.update_for(ApplicantApproval.objects.filter(applicant__account=instance))
+
+@receiver(pre_save, sender=SchoolInformation)
+@receiver(pre_save, sender=OfficialSchool)
+def update_school_domain(sender, instance, **kwargs):
+    instance.school_domain = get_school_domain(instance.university_website)
+
+@receiver(pre_save, sender=Comrade)
+def normalize_comrade_location(sender, instance, **kwargs):
+    instance.normalize_location()
+
+@receiver(pre_save, sender=ProjectSkill)
+def classify_project_skill(sender, instance, **kwargs):
+    instance.classify()
+
+@receiver(pre_save, sender=RoundPage)
+def remember_internship_dates(sender, instance, **kwargs):
+    instance._saved_internship_dates = RoundPage.objects.filter(
+        pk=instance.pk,
+    ).values_list('internstarts', 'internends').first()
+
+@receiver(post_save, sender=RoundPage)
+def update_round_free_periods(sender, instance, created, **kwargs):
+    # Free periods are counted within the internship dates, so if those
+    # move, every application in the round needs recomputing.
+    saved_dates = getattr(instance, '_saved_internship_dates', None)
+    if created or saved_dates is None:
+        return
+    if saved_dates != (instance.internstarts, instance.internends):
+        ApplicantApproval.update_free_periods(instance.applicantapproval_set.all())
+
+DASHBOARD_GENERATION_KEY = 'dashboard-generation'
+
+# Every model that home/dashboard.py reads while building a section, or
+# that Role reads for it. A change to any of these could change someone's
+# cached sections, so it throws away everyone's. Keep this in step with the
+# sections: changes to models that aren't listed here don't reach the
+# dashboard until the next deadline passes.
+DASHBOARD_SECTION_MODELS = DASHBOARD_MODELS + (
+        ApplicantApproval,
+        ApplicationReviewer,
+        BarriersToParticipation,
+        Community,
+        Comrade,
+        InternSelection,
+        MentorRelationship,
+        RoundPage,
+        SchoolInformation,
+        )
+
+@receiver(post_save)
+@receiver(post_delete)
+def invalidate_dashboard_sections(sender, **kwargs):
+    if issubclass(sender, DASHBOARD_SECTION_MODELS):
+        new_cache_generation(DASHBOARD_GENERATION_KEY)
+
+# Changes to any of these models can change the statistics for some round.
+# Each entry is the lookup from RoundStatistics to the changed model, and the
+# attribute on the changed instance to match it against.
+ROUND_STATISTICS_DEPENDENCIES = {
+        ApplicantApproval: ('round', 'application_round_id'),
+        Contribution: ('round__applicantapproval', 'applicant_id'),
+        FinalApplication: ('round__applicantapproval', 'applicant_id'),
+        PaymentEligibility: ('round__applicantapproval', 'applicant_id'),
+        ApplicantGenderIdentity: ('round__applicantapproval', 'applicant_id'),
+        ApplicantRaceEthnicityInformation: ('round__applicantapproval', 'applicant_id'),
+        Participation: ('round', 'participating_round_id'),
+        Sponsorship: ('round__participation', 'participation_id'),
+        Project: ('round__participation', 'project_round_id'),
+        }
+
+@receiver(post_save)
+@receiver(post_delete)
+def mark_round_statistics_stale(sender, instance, **kwargs):
+    try:
+        lookup, attribute = ROUND_STATISTICS_DEPENDENCIES[sender]
+    except KeyError:
+        return
+    RoundStatistics.objects.filter(**{
+        lookup: getattr(instance, attribute),
+        }).update(stale=True, times_marked_stale=models.F('times_marked_stale') + 1)
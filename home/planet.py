@@ -0,0 +1,223 @@
+"""
+Fetching and parsing interns' blog feeds for the planet, the combined feed
+of all intern blogs. Fetches run concurrently on an asyncio event loop,
+with a limit on how many go to any one host at once. Each fetch sends back
+the ETag and Last-Modified headers from the last time, so blogs that
+haven't changed just answer 304 Not Modified.
+
+Nothing in here touches the database; see InternBlog.update_from for
+storing the results.
+"""
+
+import asyncio
+import collections
+from concurrent.futures import ThreadPoolExecutor
+import datetime
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+from xml.etree import ElementTree
+from xml.parsers import expat
+
+from django.utils.dateparse import parse_datetime
+from django.utils.html import strip_tags
+from django.utils.text import Truncator
+import requests
+
+USER_AGENT = 'Outreachy planet (https://www.outreachy.org/)'
+
+# Don't let one broken or hostile blog hold up or fill up everything.
+TIMEOUT = 30
+MAX_FEED_SIZE = 5 * 1024 * 1024
+
+# Most blogs are on a few big hosts, which don't want us fetching
+# hundreds of feeds from them at once.
+PER_HOST = 2
+WORKERS = 16
+
+# Only keep the newest posts from each feed, in case a feed has years of
+# them.
+MAX_POSTS = 50
+
+ATOM = '{http://www.w3.org/2005/Atom}'
+RSS1 = '{http://purl.org/rss/1.0/}'
+RDF = '{http://www.w3.org/1999/02/22-rdf-syntax-ns#}'
+DC = '{http://purl.org/dc/elements/1.1/}'
+CONTENT = '{http://purl.org/rss/1.0/modules/content/}'
+
+FetchResult = collections.namedtuple('FetchResult', 'status etag last_modified content error')
+
+def fetch(url, etag='', last_modified=''):
+    """
+    Fetch one feed, asking for it only if it changed since the response
+    with the given ETag and Last-Modified headers. Never raises for
+    network or HTTP errors, so one bad feed can't stop the rest.
+    """
+    headers = {'User-Agent': USER_AGENT}
+    if etag:
+        headers['If-None-Match'] = etag
+    if last_modified:
+        headers['If-Modified-Since'] = last_modified
+    try:
+        with requests.get(url, headers=headers, timeout=TIMEOUT, stream=True) as response:
+            content = b''
+            if response.status_code == 200:
+                content = response.raw.read(MAX_FEED_SIZE + 1, decode_content=True)
+                if len(content) > MAX_FEED_SIZE:
+                    return FetchResult(None, '', '', b'', 'Feed is too big')
+            return FetchResult(
+                    response.status_code,
+                    response.headers.get('ETag', ''),
+                    response.headers.get('Last-Modified', ''),
+                    content,
+                    None)
+    except requests.RequestException as e:
+        return FetchResult(None, '', '', b'', str(e))
+
+async def fetch_each(blogs, per_host, executor):
+    loop = asyncio.get_event_loop()
+    limits = collections.defaultdict(lambda: asyncio.Semaphore(per_host))
+
+    async def fetch_one(blog):
+        async with limits[urlsplit(blog.url).hostname]:
+            result = await loop.run_in_executor(executor, fetch, blog.url, blog.etag, blog.last_modified)
+        return blog, result
+
+    return await asyncio.gather(*[fetch_one(blog) for blog in blogs])
+
+def fetch_all(blogs, per_host=PER_HOST, workers=WORKERS):
+    """
+    Fetch the feed for each blog, which needs url, etag and last_modified
+    attributes. Returns a list of (blog, FetchResult) pairs.
+
+    requests doesn't speak asyncio, so the event loop schedules the fetches
+    and a pool of threads does the blocking network I/O.
+    """
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    executor = ThreadPoolExecutor(workers)
+    try:
+        return loop.run_until_complete(fetch_each(blogs, per_host, executor))
+    finally:
+        executor.shutdown()
+        asyncio.set_event_loop(None)
+        loop.close()
+
+def parse_date(text):
+    if not text:
+        return None
+    text = text.strip()
+    try:
+        # RSS 2.0 uses RFC 822 dates.
+        date = parsedate_to_datetime(text)
+    except (TypeError, ValueError, IndexError):
+        # Atom and Dublin Core use ISO 8601 dates.
+        try:
+            date = parse_datetime(text)
+        except ValueError:
+            date = None
+        if date is None:
+            return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=datetime.timezone.utc)
+    return date
+
+def summarize(html):
+    # Feeds can have any HTML in them, so only keep the text.
+    return Truncator(strip_tags(html or '').strip()).words(100)
+
+def text(element, path):
+    found = element.find(path)
+    if found is None or found.text is None:
+        return ''
+    return found.text.strip()
+
+def parse_atom_entry(entry):
+    link = ''
+    for element in entry.findall(ATOM + 'link'):
+        if element.get('rel', 'alternate') == 'alternate':
+            link = element.get('href', '')
+            break
+    summary = text(entry, ATOM + 'summary') or text(entry, ATOM + 'content')
+    updated = parse_date(text(entry, ATOM + 'updated'))
+    return {
+        'guid': text(entry, ATOM + 'id') or link,
+        'title': text(entry, ATOM + 'title'),
+        'link': link,
+        'summary': summarize(summary),
+        'published': parse_date(text(entry, ATOM + 'published')) or updated,
+        'updated': updated,
+    }
+
+def parse_rss_item(item, namespace=''):
+    link = text(item, namespace + 'link')
+    summary = text(item, namespace + 'description') or text(item, CONTENT + 'encoded')
+    published = parse_date(text(item, 'pubDate')) or parse_date(text(item, DC + 'date'))
+    return {
+        'guid': text(item, 'guid') or item.get(RDF + 'about') or link,
+        'title': text(item, namespace + 'title'),
+        'link': link,
+        'summary': summarize(summary),
+        'published': published,
+        'updated': published,
+    }
+
+class _Prolog(Exception):
+    pass
+
+def check_prolog(content):
+    """
+    Raise ValueError if the feed declares a DOCTYPE. Feeds don't need one,
+    and the entities it could declare can expand a few bytes into gigabytes
+    or pull in local files. A DOCTYPE has to come before the first element,
+    so there's no need to read any further than that.
+    """
+    def doctype(*args):
+        raise ValueError("Feeds with a DOCTYPE aren't allowed")
+
+    def first_element(*args):
+        raise _Prolog()
+
+    parser = expat.ParserCreate()
+    parser.StartDoctypeDeclHandler = doctype
+    parser.EntityDeclHandler = doctype
+    parser.StartElementHandler = first_element
+    try:
+        parser.Parse(content, True)
+    except _Prolog:
+        pass
+    except expat.ExpatError as e:
+        raise ValueError("Feed isn't valid XML: {}".format(e))
+
+def parse_feed(content):
+    """
+    Parse an Atom, RSS 2.0 or RSS 1.0 feed into a list of dicts, one for
+    each post, newest first. Posts without a web link are left out, as are
+    posts without a date, since we couldn't put them in order. Raises
+    ValueError if this isn't a feed we understand, or declares a DOCTYPE.
+    """
+    check_prolog(content)
+    try:
+        root = ElementTree.fromstring(content)
+    except ElementTree.ParseError as e:
+        raise ValueError("Feed isn't valid XML: {}".format(e))
+
+    if root.tag == ATOM + 'feed':
+        posts = [parse_atom_entry(entry) for entry in root.findall(ATOM + 'entry')]
+    elif root.tag == 'rss':
+        posts = [parse_rss_item(item) for item in root.findall('channel/item')]
+    elif root.tag == RDF + 'RDF':
+        posts = [parse_rss_item(item, RSS1) for item in root.findall(RSS1 + 'item')]
+    else:
+        raise ValueError("Not an Atom or RSS feed")
+
+    # Links end up on our own pages, so only allow web links.
+    posts = [post for post in posts
+            if urlsplit(post['link']).scheme in ('http', 'https')
+            and len(post['link']) <= 500
+            and post['published']]
+    for post in posts:
+        post['title'] = Truncator(post['title'] or post['link']).chars(255)
+        post['guid'] = post['guid'][:500]
+        post['updated'] = post['updated'] or post['published']
+    posts.sort(key=lambda post: post['published'], reverse=True)
+    return posts[:MAX_POSTS]
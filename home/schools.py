@@ -0,0 +1,16 @@
+from urllib.parse import urlparse
+
+# Applicants type their school's website in many ways, so schools are
+# matched against each other by the host name alone. This lives outside
+# models.py so migrations can use it too.
+
+def get_school_domain(url):
+    """
+    The host name from a school's website, in the form we use to match
+    schools against each other: lowercase, without any port or leading
+    "www.".
+    """
+    domain = (urlparse(url).hostname or '').rstrip('.')
+    if domain.startswith('www.'):
+        domain = domain[len('www.'):]
+    return domain
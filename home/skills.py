@@ -0,0 +1,82 @@
+import re
+
+from .bulk import update_computed_fields
+
+# Ways mentors describe common skills, in the order we check them: the first
+# pattern that matches a skill description picks its canonical name. Order
+# matters, so 'javascript' comes before 'java' and 'ruby on rails' before
+# 'ruby'. Patterns are matched against the lowercased description.
+CANONICAL_SKILLS = (
+        ('Python', r'python'),
+        ('JavaScript', r'javascript|\bjs\b'),
+        ('HTML/CSS', r'html|css'),
+        ('Java', r'java'),
+        ('Django', r'django'),
+        ('C programming', r'c program|c language|c code|programming in c|^c$'),
+        ('C++', r'c\+\+'),
+        ('Rust', r'rust'),
+        ('Ruby on Rails', r'ruby on rails'),
+        ('Ruby', r'ruby'),
+        ('Operating Systems knowledge', r'operating systems|kernel'),
+        ('Linux', r'linux'),
+        ('Web development', r'web development'),
+        ('GTK programming', r'gtk|gobject'),
+        ('Git', r'git'),
+        ('Documentation', r'writing|documentation'),
+        )
+
+# Skills that projects often list in the same description as another skill,
+# like "Python and Android". These are counted as well as the canonical
+# skill.
+SECONDARY_SKILLS = (
+        ('Android', r'android'),
+        ('Mercurial', r'mercurial'),
+        ('node.js', r'node\.js'),
+        )
+
+# None of the skill names above have a comma in them.
+SECONDARY_SEPARATOR = ','
+
+_CANONICAL_PATTERNS = [(name, re.compile(pattern)) for name, pattern in CANONICAL_SKILLS]
+_SECONDARY_PATTERNS = [(name, re.compile(pattern)) for name, pattern in SECONDARY_SKILLS]
+
+def classify_skill(skill):
+    """
+    Return the (canonical, secondary) skill names for a free-form skill
+    description. Descriptions that don't match any known skill are their
+    own canonical skill, with surrounding whitespace removed. secondary is
+    every one of the SECONDARY_SKILLS that the description also mentions,
+    joined with SECONDARY_SEPARATOR, or the empty string if there are none.
+    """
+    skill = skill.strip()
+    lowered = skill.lower()
+
+    canonical = skill
+    for name, pattern in _CANONICAL_PATTERNS:
+        if pattern.search(lowered):
+            canonical = name
+            break
+
+    secondary = []
+    for name, pattern in _SECONDARY_PATTERNS:
+        # Don't count "Android" twice when that's the whole description.
+        if pattern.search(lowered) and name.lower() != canonical.lower():
+            secondary.append(name)
+
+    return canonical, SECONDARY_SEPARATOR.join(secondary)
+
+def split_secondary_skills(secondary):
+    """
+    The list of skill names in a secondary value from classify_skill.
+    """
+    if not secondary:
+        return []
+    return secondary.split(SECONDARY_SEPARATOR)
+
+def reclassify_skills(project_skills):
+    """
+    Store classify_skill's answer on every ProjectSkill in the given
+    queryset. Returns how many skills changed.
+    """
+    return update_computed_fields(project_skills, ('skill',), ('canonical_skill', 'secondary_skill'),
+            classify_skill)
@@ -0,0 +1,86 @@
+from collections import defaultdict
+
+# Feedback saved before the feedback forms recorded who submitted it only
+# has django-reversion's history to go on. These functions only use the
+# models they're given, so the migration that added submitted_by can run
+# them with its historical models, and the backfillfeedbacksubmitters
+# command with the real ones.
+
+def mentor_accounts(MentorRelationship, intern_selection_ids):
+    """
+    The accounts of the approved mentors for each of the given intern
+    selections, who are the only people that submit mentor feedback.
+    """
+    # When a staff member modifies the feedback to approve payment or
+    # change internship dates, it counts as a revision. (Note: this may not
+    # work if we switch mentors. We could ignore all revisions made by
+    # staff, but staff can be mentors too.)
+    accounts = defaultdict(set)
+    for intern_selection_id, account_id in MentorRelationship.objects.filter(
+            intern_selection__in=intern_selection_ids,
+            # ApprovalStatus.APPROVED, which can't be imported from
+            # models.py here.
+            mentor__approval_status='A',
+    ).values_list('intern_selection_id', 'mentor__mentor__account_id'):
+        accounts[intern_selection_id].add(account_id)
+    return accounts
+
+def intern_accounts(InternSelection, intern_selection_ids):
+    """
+    The intern's account for each of the given intern selections. Only the
+    intern submits intern feedback; other revisions are staff edits.
+    """
+    accounts = defaultdict(set)
+    for intern_selection_id, account_id in InternSelection.objects.filter(
+            pk__in=intern_selection_ids,
+    ).values_list('pk', 'applicant__applicant__account_id'):
+        accounts[intern_selection_id].add(account_id)
+    return accounts
+
+def backfill_submitters(feedbacks, accounts, versions):
+    """
+    Fill in submitted_by and submitted_at on the given feedback from the
+    latest revision made by one of the accounts that could have submitted
+    it. versions holds the reversion Versions for this kind of feedback.
+    Loads the revisions for all of the given feedback in one query, and
+    returns the feedback that was updated.
+    """
+    by_object = defaultdict(list)
+    for version in versions.filter(
+            object_id__in=[str(f.pk) for f in feedbacks],
+    ).select_related('revision').order_by('-pk'):
+        by_object[version.object_id].append(version)
+
+    updated = []
+    for feedback in feedbacks:
+        submitters = accounts[feedback.intern_selection_id]
+        for version in by_object[str(feedback.pk)]:
+            if version.revision.user_id in submitters:
+                feedback.submitted_by_id = version.revision.user_id
+                feedback.submitted_at = version.revision.date_created
+                feedback.save(update_fields=['submitted_by', 'submitted_at'])
+                updated.append(feedback)
+                break
+    return updated
+
+def backfill_all_submitters(model, get_accounts, versions, batch_size=500):
+    """
+    Run backfill_submitters over every feedback of the given model that
+    has no submission time yet, a batch at a time. get_accounts is called
+    with each batch's intern selection ids. Returns how many were updated
+    and how many had no revision by anyone who could have submitted them.
+    """
+    feedbacks = model.objects.filter(submitted_at__isnull=True).order_by('pk')
+    count = 0
+    missing = 0
+    last_pk = 0
+    while True:
+        batch = list(feedbacks.filter(pk__gt=last_pk)[:batch_size])
+        if not batch:
+            break
+        accounts = get_accounts([f.intern_selection_id for f in batch])
+        updated = len(backfill_submitters(batch, accounts, versions))
+        count += updated
+        missing += len(batch) - updated
+        last_pk = batch[-1].pk
+    return count, missing
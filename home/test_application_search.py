@@ -0,0 +1,52 @@
+from django.test import TestCase
+
+from . import models
+from .factories import ApplicantApprovalFactory
+from .factories import RoundPageFactory
+
+
+class ApplicationSearchTestCase(TestCase):
+    def setUp(self):
+        self.current_round = RoundPageFactory(start_from='appsopen')
+
+    def apply(self, essay='', **kwargs):
+        application = ApplicantApprovalFactory(application_round=self.current_round, **kwargs)
+        models.BarriersToParticipation.objects.create(
+            applicant=application,
+            barriers_to_contribution=essay,
+            systematic_bias='',
+            lacking_representation='',
+        )
+        return application
+
+    def search(self, query):
+        return models.ApplicationSearchDocument.search(query, self.current_round)
+
+    def test_search_names_and_essays(self):
+        named = self.apply(applicant__public_name='Ada Lovelace')
+        essay = self.apply(essay='My friend Lovelace taught me to program.')
+        self.apply(essay='Nothing relevant here.')
+        ApplicantApprovalFactory(applicant__public_name='Ada Lovelace')
+
+        # A match on the name ranks above a match in an essay, and
+        # applications from other rounds aren't found.
+        self.assertEqual(self.search('lovelace'), [named, essay])
+        self.assertEqual(self.search('Ada Lovelace'), [named])
+        self.assertEqual(self.search('"ada'), [named])
+        self.assertEqual(self.search('babbage'), [])
+        self.assertEqual(self.search('  '), [])
+
+    def test_index_follows_changes(self):
+        application = self.apply(applicant__account__email='old@example.com')
+        self.assertEqual(self.search('old@example.com'), [application])
+
+        account = application.applicant.account
+        account.email = 'new@example.com'
+        account.save()
+        self.assertEqual(self.search('old@example.com'), [])
+        self.assertEqual(self.search('new@example.com'), [application])
+
+        barriers = application.barrierstoparticipation
+        barriers.systematic_bias = 'Teachers ignored me.'
+        barriers.save()
+        self.assertEqual(self.search('teachers'), [application])
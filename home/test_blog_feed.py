@@ -0,0 +1,148 @@
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.test import TestCase, RequestFactory
+from xml.etree import ElementTree
+import os.path
+import shutil
+import tempfile
+
+from wagtail.wagtailcore.models import Page
+
+from .factories import BlogIndexFactory
+from .factories import ComradeFactory
+from .models import write_feed_archive
+
+ATOM = '{http://www.w3.org/2005/Atom}'
+FH = '{http://purl.org/syndication/history/1.0}'
+
+class BlogFeedTestCase(TestCase):
+    def setUp(self):
+        self.blog = BlogIndexFactory()
+        self.author = ComradeFactory(public_name='Ada Lovelace')
+
+    def post(self, title):
+        post = self.blog.add_child(instance=Page(title=title, slug=title.lower(), owner=self.author.account))
+        post.save_revision(user=self.author.account).publish()
+        return post
+
+    def get_feed(self, **headers):
+        request = RequestFactory().get(self.blog.url + 'feed/', **headers)
+        return self.blog.feed(request)
+
+    def test_feed_cached_until_publish(self):
+        self.post('First')
+        self.post('Second')
+
+        # Rendering the feed takes the same number of queries no matter how
+        # many posts there are.
+        with self.assertNumQueries(1):
+            response = self.get_feed()
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, 'Ada Lovelace', count=2)
+        self.assertIn('ETag', response)
+        self.assertIn('Last-Modified', response)
+
+        with self.assertNumQueries(0):
+            cached = self.get_feed()
+        self.assertEqual(cached.content, response.content)
+
+        not_modified = self.get_feed(HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(not_modified.status_code, 304)
+        not_modified = self.get_feed(HTTP_IF_MODIFIED_SINCE=response['Last-Modified'])
+        self.assertEqual(not_modified.status_code, 304)
+
+        third = self.post('Third')
+        response = self.get_feed(HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, 'Third')
+
+        # Taking out the newest post mustn't move Last-Modified backwards,
+        # or pollers that only send If-Modified-Since would keep it.
+        third.unpublish()
+        response = self.get_feed(HTTP_IF_MODIFIED_SINCE=response['Last-Modified'])
+        self.assertEqual(response.status_code, 200)
+        self.assertNotContains(response, 'Third')
+
+class ArchivedBlogFeedTestCase(TestCase):
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        settings = self.settings(MEDIA_ROOT=media_root)
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+        self.blog = BlogIndexFactory(feed_archive_size=2)
+        self.author = ComradeFactory()
+
+    def post(self, title):
+        post = self.blog.add_child(instance=Page(title=title, slug=title.lower(), owner=self.author.account))
+        post.save_revision(user=self.author.account).publish()
+        return post
+
+    def get_feed(self):
+        request = RequestFactory().get(self.blog.url + 'feed/')
+        return ElementTree.fromstring(self.blog.feed(request).content)
+
+    def get_archive(self, number):
+        with default_storage.open(self.blog.get_feed_archive_name(number)) as f:
+            return ElementTree.fromstring(f.read())
+
+    def titles(self, feed):
+        return [e.findtext(ATOM + 'title') for e in feed.findall(ATOM + 'entry')]
+
+    def links(self, feed):
+        return {l.get('rel'): l.get('href') for l in feed.findall(ATOM + 'link')}
+
+    def test_archives(self):
+        posts = [self.post(title) for title in ('One', 'Two', 'Three', 'Four', 'Five')]
+
+        feed = self.get_feed()
+        self.assertEqual(self.titles(feed), ['Five', 'Four'])
+        self.assertIsNone(feed.find(FH + 'archive'))
+        self.assertIsNone(feed.find(FH + 'complete'))
+        self.assertEqual(self.links(feed)['prev-archive'], self.blog.get_feed_archive_url(2))
+
+        first = self.get_archive(1)
+        self.assertIsNotNone(first.find(FH + 'archive'))
+        self.assertEqual(sorted(self.titles(first)), ['One', 'Two'])
+        self.assertNotIn('prev-archive', self.links(first))
+        self.assertEqual(self.links(first)['current'], self.blog.full_url + 'feed/')
+
+        second = self.get_archive(2)
+        self.assertEqual(sorted(self.titles(second)), ['Four', 'Three'])
+        self.assertEqual(self.links(second)['prev-archive'], self.blog.get_feed_archive_url(1))
+
+        # Archives aren't rewritten when new posts arrive, but they are
+        # when an archived post goes away.
+        self.post('Six')
+        self.get_feed()
+        with default_storage.open(self.blog.get_feed_archive_name(1)) as f:
+            archived = f.read()
+        self.assertEqual(sorted(self.titles(self.get_archive(3))), ['Five', 'Six'])
+
+        posts[2].refresh_from_db()
+        posts[2].unpublish()
+        self.assertFalse(default_storage.exists(self.blog.get_feed_archive_name(2)))
+        self.get_feed()
+        self.assertEqual(sorted(self.titles(self.get_archive(2))), ['Five', 'Four'])
+        with default_storage.open(self.blog.get_feed_archive_name(1)) as f:
+            self.assertEqual(f.read(), archived)
+        self.assertFalse(default_storage.exists(self.blog.get_feed_archive_name(3)))
+
+    def test_stray_archive_files(self):
+        posts = [self.post(title) for title in ('One', 'Two', 'Three')]
+        self.get_feed()
+        directory = os.path.dirname(self.blog.get_feed_archive_name(1))
+
+        # Rewriting an archive replaces it rather than saving a copy.
+        write_feed_archive(self.blog.get_feed_archive_name(1), b'<feed/>')
+        self.assertEqual(default_storage.listdir(directory)[1], ['1.xml'])
+
+        # Copies left behind by a storage that wouldn't overwrite are
+        # removed along with the stale archives, but not in-progress
+        # writes.
+        default_storage.save(directory + '/1_AbCdEfG.xml', ContentFile(b'<feed/>'))
+        default_storage.save(directory + '/.1.xml.tmp', ContentFile(b''))
+        posts[2].refresh_from_db()
+        posts[2].unpublish()
+        self.assertEqual(sorted(default_storage.listdir(directory)[1]), ['.1.xml.tmp', '1.xml'])
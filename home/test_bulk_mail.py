@@ -0,0 +1,70 @@
+from django.core import mail
+from django.test import override_settings, RequestFactory, TestCase
+
+from . import email
+from . import models
+from .factories import ApplicantApprovalFactory
+from .factories import ContributionFactory
+from .factories import FinalApplicationFactory
+from .factories import ProjectFactory
+from .factories import RoundPageFactory
+
+
+@override_settings(ALLOWED_HOSTS=['www.outreachy.org'])
+class BulkMailTestCase(TestCase):
+    def setUp(self):
+        self.request = RequestFactory().get('/', secure=True, HTTP_HOST='www.outreachy.org')
+        self.current_round = RoundPageFactory(start_from='appsopen')
+        self.projects = [
+            ProjectFactory(
+                project_round__participating_round=self.current_round,
+                approval_status=models.ApprovalStatus.APPROVED,
+                project_round__approval_status=models.ApprovalStatus.APPROVED,
+            )
+            for _ in range(2)
+        ]
+
+    def add_contributor(self, apply=False):
+        application = ApplicantApprovalFactory(
+            application_round=self.current_round,
+            approval_status=models.ApprovalStatus.APPROVED,
+        )
+        for project in self.projects:
+            ContributionFactory(round=self.current_round, applicant=application, project=project)
+        if apply:
+            FinalApplicationFactory(round=self.current_round, applicant=application, project=self.projects[0])
+        return application
+
+    def test_deadline_reminder_queries_independent_of_contributors(self):
+        applied = self.add_contributor(apply=True)
+        self.add_contributor()
+        applications = models.ApplicantApproval.objects.filter(application_round=self.current_round)
+
+        # applications, contributions, final applications, projects
+        with self.assertNumQueries(4):
+            email.contributor_deadline_reminder(applications, self.current_round, self.request)
+        self.assertEqual(len(mail.outbox), 2)
+
+        self.add_contributor()
+        mail.outbox = []
+        with self.assertNumQueries(4):
+            email.contributor_deadline_reminder(applications, self.current_round, self.request)
+        self.assertEqual(len(mail.outbox), 3)
+
+        bodies = {message.to[0].addr_spec: message.body for message in mail.outbox}
+        applied_body = bodies.pop(applied.applicant.account.email)
+        self.assertEqual(applied_body.count('Your internship application will be reviewed'), 1)
+        for body in bodies.values():
+            self.assertNotIn('Your internship application will be reviewed', body)
+            self.assertEqual(body.count('You have NOT submitted an application'), 2)
+
+    def test_process_pool_matches_serial(self):
+        self.add_contributor(apply=True)
+        self.add_contributor()
+        overlays = email.contributor_overlays(models.ApplicantApproval.objects.all())
+        context = {'current_round': self.current_round}
+        template_name = 'home/email/contributors-deadline-reminder.txt'
+
+        serial = email.render_template_mail(template_name, context, overlays, self.request)
+        parallel = email.render_template_mail(template_name, context, overlays, self.request, processes=2)
+        self.assertEqual(parallel, serial)
@@ -0,0 +1,71 @@
+from datetime import datetime, timedelta, timezone
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import RequestFactory, TestCase
+
+from . import models
+from .dashboard import Dashboard
+from .dashboard import get_dashboard_sections
+from .dashboard import sponsor_statistics
+from .factories import MentorApprovalFactory
+from .factories import RoundPageFactory
+from .factories import UserFactory
+
+
+class DashboardTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def dashboard_for(self, user):
+        request = RequestFactory().get('/dashboard/')
+        request.user = user
+        return Dashboard(request)
+
+    def test_staff_sections_skipped_without_queries(self):
+        dashboard = self.dashboard_for(UserFactory())
+        with self.assertNumQueries(0):
+            self.assertIsNone(dashboard.get_section(sponsor_statistics))
+
+    def test_rounds_loaded_once(self):
+        RoundPageFactory(start_from='appsopen')
+        staff = UserFactory(is_staff=True)
+        dashboard = self.dashboard_for(staff)
+        dashboard.rounds
+        self.assertEqual(dashboard.role(dashboard.rounds[0]), dashboard.role(dashboard.rounds[0]))
+        with self.assertNumQueries(0):
+            dashboard.latest_round('appsopen', lambda r: True)
+            dashboard.earliest_round('internstarts', lambda r: True)
+
+    def test_sections_cached_until_something_changes(self):
+        today = models.get_deadline_date_for(datetime.now(timezone.utc))
+        current_round = RoundPageFactory(start_from='appsopen', start_date=today - timedelta(days=1))
+        mentor_approval = MentorApprovalFactory(
+                approval_status=models.ApprovalStatus.APPROVED,
+                project__approval_status=models.ApprovalStatus.APPROVED,
+                project__project_round__approval_status=models.ApprovalStatus.APPROVED,
+                project__project_round__participating_round=current_round)
+        request = RequestFactory().get('/dashboard/')
+        request.user = mentor_approval.mentor.account
+
+        get_dashboard_sections(request)
+        request = RequestFactory().get('/dashboard/')
+        request.user = User.objects.get(pk=mentor_approval.mentor.account_id)
+        # Only the Comrade lookup, to decide which sections apply.
+        with self.assertNumQueries(1):
+            cached = get_dashboard_sections(request)
+        self.assertIn('home/dashboard/mentor_projects.html', [name for name, context in cached])
+
+        mentor_approval.approval_status = models.ApprovalStatus.WITHDRAWN
+        mentor_approval.save()
+        request = RequestFactory().get('/dashboard/')
+        request.user = mentor_approval.mentor.account
+        sections = get_dashboard_sections(request)
+        self.assertNotIn('home/dashboard/mentor_projects.html', [name for name, context in sections])
+
+    def test_only_dashboard_models_invalidate(self):
+        generation = models.get_cache_generation(models.DASHBOARD_GENERATION_KEY)
+        models.OutboundEmail.objects.create(next_attempt=datetime.now(timezone.utc), subject='Hi')
+        self.assertEqual(models.get_cache_generation(models.DASHBOARD_GENERATION_KEY), generation)
+
+        RoundPageFactory(start_from='appsopen')
+        self.assertNotEqual(models.get_cache_generation(models.DASHBOARD_GENERATION_KEY), generation)
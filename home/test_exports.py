@@ -0,0 +1,74 @@
+from django.test import TestCase
+from django.urls import reverse
+import json
+import reversion
+
+from . import models
+from .factories import ComradeFactory
+from .factories import ContributionFactory
+from .factories import InitialMentorFeedbackFactory
+from .factories import InternSelectionFactory
+from .factories import RoundPageFactory
+
+
+class ExportTestCase(TestCase):
+    def setUp(self):
+        staff = ComradeFactory(account__is_staff=True).account
+        self.client.force_login(staff)
+
+    def download(self, name, current_round, **params):
+        response = self.client.get(reverse(name, kwargs={'round_slug': current_round.slug}), params)
+        self.assertEqual(response.status_code, 200)
+        return b''.join(response.streaming_content).decode('utf-8')
+
+    def test_contract_export_queries_independent_of_interns(self):
+        current_round = RoundPageFactory(start_from='internannounce')
+        InternSelectionFactory(active=True, round=current_round, mentors=2)
+
+        # site, session, user, round, interns, mentors
+        with self.assertNumQueries(6):
+            contracts = json.loads(self.download('contract-export', current_round))
+        self.assertEqual(len(contracts), 1)
+        self.assertEqual(len(contracts[0]['mentors']), 2)
+
+        for _ in range(3):
+            InternSelectionFactory(active=True, round=current_round, mentors=2)
+        with self.assertNumQueries(6):
+            contracts = json.loads(self.download('contract-export', current_round))
+        self.assertEqual(len(contracts), 4)
+
+    def test_feedback_export_backfills_submitter(self):
+        feedback = InitialMentorFeedbackFactory()
+        current_round = feedback.intern_selection.project.project_round.participating_round
+        mentor = feedback.intern_selection.mentors.get().mentor
+        with reversion.create_revision():
+            reversion.set_user(mentor.account)
+            feedback.save()
+        # A later staff edit isn't the submission.
+        with reversion.create_revision():
+            reversion.set_user(ComradeFactory(account__is_staff=True).account)
+            feedback.save()
+
+        self.assertEqual(models.InitialMentorFeedback.backfill_submitters([feedback]), [feedback])
+        feedback.refresh_from_db()
+        self.assertEqual(feedback.submitted_by, mentor.account)
+
+        lines = self.download('initial-feedback-export', current_round, format='jsonl').splitlines()
+        self.assertEqual(len(lines), 1)
+        row = json.loads(lines[0])
+        self.assertEqual(row['mentor email address'], mentor.account.email)
+        self.assertEqual(row['intern email address'], feedback.intern_selection.applicant.applicant.account.email)
+        self.assertEqual(row['feedback submitted on'], str(feedback.submitted_at))
+
+    def test_csv_exports(self):
+        contribution = ContributionFactory()
+        current_round = contribution.project.project_round.participating_round
+
+        lines = self.download('contribution-export', current_round, format='csv').splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertTrue(lines[0].startswith('applicant public name,applicant email address,community,project'))
+        self.assertIn(contribution.url, lines[1])
+
+        lines = self.download('applicant-export', current_round, format='csv').splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertIn(contribution.applicant.applicant.account.email, lines[1])
@@ -106,6 +106,9 @@ class InternSelectionTestCase(TestCase):
                 # only allow submitting once
                 self.assertFalse(feedback.allow_edits)
 
+                self.assertEqual(feedback.submitted_by, internselection.mentors.get().mentor.account)
+                self.assertIsNotNone(feedback.submitted_at)
+
                 self.assertEqual(Version.objects.get_for_object(feedback).count(), 1)
 
     def test_invalid_duplicate_mentor_feedback(self):
@@ -237,6 +240,9 @@ class InternSelectionTestCase(TestCase):
         # only allow submitting once
         self.assertFalse(feedback.allow_edits)
 
+        self.assertEqual(feedback.submitted_by, internselection.applicant.applicant.account)
+        self.assertIsNotNone(feedback.submitted_at)
+
         self.assertEqual(Version.objects.get_for_object(feedback).count(), 1)
 
     @staticmethod
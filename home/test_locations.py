@@ -0,0 +1,51 @@
+from django.test import TestCase
+import pytz
+
+from . import models
+from .factories import ApplicantApprovalFactory
+from .factories import ComradeFactory
+from .factories import RoundPageFactory
+from .locations import normalize_location, update_locations
+
+
+class LocationTestCase(TestCase):
+    def test_normalize_location(self):
+        for location, timezone, expected in (
+                ('Portland, OR', '', ('Portland', 'Usa')),
+                ('Columbus, Ohio', '', ('Columbus', 'Usa')),
+                ('Pune, Maharashtra, India.', '', ('Pune', 'India')),
+                ('Nairobi', '', ('Nairobi', 'Kenya')),
+                ('São Paulo - SP', '', ('São Paulo - Sp', 'Brazil')),
+                ('Somewhere', 'Australia/Sydney', ('Somewhere', 'Australia')),
+                ('', 'Europe/London', ('', 'Uk')),
+                ('', '', ('', '')),
+                ):
+            with self.subTest(location=location, timezone=timezone):
+                self.assertEqual(normalize_location(location, timezone), expected)
+
+    def test_location_normalized_on_save(self):
+        comrade = ComradeFactory(location='Lagos', timezone=pytz.timezone('Africa/Lagos'))
+        self.assertEqual(comrade.get_city_country(), ('Lagos', 'Nigeria'))
+
+        models.Comrade.objects.filter(pk=comrade.pk).update(city='', country='')
+        self.assertEqual(update_locations(models.Comrade.objects.all()), 1)
+        comrade.refresh_from_db()
+        self.assertEqual(comrade.country, 'Nigeria')
+
+    def test_countries_stats_in_one_query(self):
+        current_round = RoundPageFactory(start_from='internstarts')
+        for location in ('Berlin', 'Boston', 'Portland, OR', 'Atlantis'):
+            ApplicantApprovalFactory(
+                application_round=current_round,
+                approval_status=models.ApprovalStatus.APPROVED,
+                applicant__location=location,
+            )
+        ApplicantApprovalFactory(
+            application_round=current_round,
+            approval_status=models.ApprovalStatus.REJECTED,
+            applicant__location='Berlin',
+        )
+
+        with self.assertNumQueries(1):
+            stats = current_round.get_countries_stats()
+        self.assertEqual(stats, [('Usa', 2), ('Germany', 1)])
@@ -0,0 +1,155 @@
+from django.core import mail
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from io import StringIO
+import socketserver
+import threading
+
+from .models import OutboundEmail
+
+
+class SMTPHandler(socketserver.StreamRequestHandler):
+    """
+    Just enough of an SMTP server to accept messages from smtplib. The
+    server's reject_first attribute makes it refuse that many messages with
+    a temporary error first.
+    """
+
+    def reply(self, line):
+        self.wfile.write(line.encode('ascii') + b'\r\n')
+
+    def handle(self):
+        self.reply('220 localhost ready')
+        for line in self.rfile:
+            command = line.decode('ascii').strip().upper()
+            if command.startswith(('EHLO', 'HELO')):
+                self.reply('250 localhost')
+            elif command.startswith('MAIL FROM'):
+                with self.server.lock:
+                    if self.server.reject_first > 0:
+                        self.server.reject_first -= 1
+                        self.reply('451 try again later')
+                        continue
+                self.reply('250 OK')
+            elif command.startswith('RCPT TO'):
+                self.reply('250 OK')
+            elif command == 'DATA':
+                self.reply('354 go ahead')
+                data = []
+                for line in self.rfile:
+                    if line == b'.\r\n':
+                        break
+                    data.append(line)
+                with self.server.lock:
+                    self.server.messages.append(b''.join(data))
+                self.reply('250 OK')
+            elif command == 'RSET' or command == 'NOOP':
+                self.reply('250 OK')
+            elif command == 'QUIT':
+                self.reply('221 bye')
+                return
+            else:
+                self.reply('502 not implemented')
+
+
+class SMTPServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self):
+        super(SMTPServer, self).__init__(('127.0.0.1', 0), SMTPHandler)
+        self.lock = threading.Lock()
+        self.messages = []
+        self.reject_first = 0
+
+
+class OutboxTestCase(TestCase):
+    def setUp(self):
+        self.server = SMTPServer()
+        thread = threading.Thread(target=self.server.serve_forever)
+        thread.daemon = True
+        thread.start()
+        self.settings = override_settings(
+            EMAIL_BACKEND='home.email.OutboxEmailBackend',
+            OUTBOX_DELIVERY_BACKEND='django.core.mail.backends.smtp.EmailBackend',
+            EMAIL_HOST='127.0.0.1',
+            EMAIL_PORT=self.server.server_address[1],
+            EMAIL_HOST_USER='',
+            EMAIL_HOST_PASSWORD='',
+        )
+        self.settings.enable()
+
+    def tearDown(self):
+        self.settings.disable()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def deliver(self, **options):
+        out = StringIO()
+        call_command('deliveroutbox', stdout=out, **options)
+        return out.getvalue()
+
+    def test_queued_then_delivered(self):
+        for i in range(50):
+            mail.send_mail('Reminder {}'.format(i), 'Body', 'organizers@outreachy.org', ['person{}@example.com'.format(i)])
+        self.assertEqual(self.server.messages, [])
+        self.assertEqual(OutboundEmail.objects.filter(status=OutboundEmail.PENDING).count(), 50)
+
+        output = self.deliver(workers=4, batch_size=20)
+        self.assertIn('Sent 50 messages', output)
+        self.assertEqual(len(self.server.messages), 50)
+        self.assertEqual(OutboundEmail.objects.filter(status=OutboundEmail.SENT).count(), 50)
+
+        # Nothing is sent twice.
+        self.deliver()
+        self.assertEqual(len(self.server.messages), 50)
+
+    def test_idempotency_key(self):
+        for _ in range(2):
+            with mail.get_connection(idempotency_key='form-token') as connection:
+                mail.send_mail('Reminder', 'Body', 'organizers@outreachy.org', ['a@example.com', 'b@example.com'], connection=connection)
+                mail.send_mail('Reminder', 'Body', 'organizers@outreachy.org', ['c@example.com'], connection=connection)
+        self.assertEqual(OutboundEmail.objects.count(), 2)
+
+        self.deliver()
+        self.assertEqual(len(self.server.messages), 2)
+
+    def test_temporary_failure_retried_later(self):
+        self.server.reject_first = 1
+        mail.send_mail('Reminder', 'Body', 'organizers@outreachy.org', ['a@example.com'])
+        output = self.deliver()
+        self.assertIn('1 will be retried', output)
+        outbound = OutboundEmail.objects.get()
+        self.assertEqual(outbound.status, OutboundEmail.PENDING)
+        self.assertEqual(outbound.attempts, 1)
+        self.assertIn('451', outbound.last_error)
+        message_id = outbound.to_message().extra_headers['Message-ID']
+
+        # Not due yet.
+        self.deliver()
+        self.assertEqual(self.server.messages, [])
+
+        OutboundEmail.objects.update(next_attempt=outbound.created)
+        self.deliver()
+        self.assertEqual(len(self.server.messages), 1)
+        self.assertIn(message_id.encode('ascii'), self.server.messages[0])
+        self.assertEqual(OutboundEmail.objects.get().status, OutboundEmail.SENT)
+
+    def test_alternatives_and_attachments_kept(self):
+        message = mail.EmailMultiAlternatives('Contract', 'Plain body', 'organizers@outreachy.org', ['a@example.com'])
+        message.attach_alternative('<p>HTML body</p>', 'text/html')
+        message.attach('contract.md', 'Signed by me', 'text/markdown')
+        message.attach('logo.png', b'\x89PNG\r\n', 'image/png')
+        message.send()
+
+        queued = OutboundEmail.objects.get().to_message()
+        self.assertEqual(queued.alternatives, [('<p>HTML body</p>', 'text/html')])
+        self.assertEqual(queued.attachments, [
+            ('contract.md', 'Signed by me', 'text/markdown'),
+            ('logo.png', b'\x89PNG\r\n', 'image/png'),
+        ])
+
+        self.deliver()
+        self.assertEqual(len(self.server.messages), 1)
+        self.assertIn(b'text/html', self.server.messages[0])
+        self.assertIn(b'contract.md', self.server.messages[0])
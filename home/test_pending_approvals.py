@@ -0,0 +1,67 @@
+from datetime import datetime, timedelta, timezone
+from django.test import TestCase
+
+from . import models
+from .factories import CoordinatorApprovalFactory
+from .factories import MentorApprovalFactory
+from .factories import ProjectFactory
+
+
+class PendingApprovalsTestCase(TestCase):
+    def setUp(self):
+        now = datetime.now(timezone.utc)
+        self.today = models.get_deadline_date_for(now)
+
+    def make_coordinator(self, community):
+        return CoordinatorApprovalFactory(
+                community=community,
+                approval_status=models.ApprovalStatus.APPROVED,
+                ).coordinator
+
+    def test_pending_project_before_deadline(self):
+        project = ProjectFactory(
+                approval_status=models.ApprovalStatus.PENDING,
+                project_round__approval_status=models.ApprovalStatus.APPROVED,
+                project_round__participating_round__start_from='lateprojects',
+                project_round__participating_round__start_date=self.today + timedelta(days=7))
+        coordinator = self.make_coordinator(project.project_round.community)
+
+        self.assertEqual(models.count_pending_approvals(coordinator.account, self.today), 1)
+
+    def test_pending_project_after_deadline(self):
+        project = ProjectFactory(
+                approval_status=models.ApprovalStatus.PENDING,
+                project_round__approval_status=models.ApprovalStatus.APPROVED,
+                project_round__participating_round__start_from='lateprojects',
+                project_round__participating_round__start_date=self.today)
+        coordinator = self.make_coordinator(project.project_round.community)
+
+        self.assertEqual(models.count_pending_approvals(coordinator.account, self.today), 0)
+
+    def test_counts_each_request_once(self):
+        # A mentor who is also a coordinator matches the project query twice.
+        mentor_approval = MentorApprovalFactory(
+                approval_status=models.ApprovalStatus.APPROVED,
+                project__approval_status=models.ApprovalStatus.PENDING,
+                project__project_round__participating_round__start_from='lateprojects',
+                project__project_round__participating_round__start_date=self.today + timedelta(days=7))
+        project = mentor_approval.project
+        CoordinatorApprovalFactory(
+                coordinator=mentor_approval.mentor,
+                community=project.project_round.community,
+                approval_status=models.ApprovalStatus.APPROVED)
+
+        self.assertEqual(models.count_pending_approvals(mentor_approval.mentor.account, self.today), 1)
+
+    def test_cached_count_invalidated_on_save(self):
+        project = ProjectFactory(
+                approval_status=models.ApprovalStatus.APPROVED,
+                project_round__approval_status=models.ApprovalStatus.APPROVED,
+                project_round__participating_round__start_from='lateprojects',
+                project_round__participating_round__start_date=self.today + timedelta(days=7))
+        coordinator = self.make_coordinator(project.project_round.community)
+        self.assertEqual(models.get_pending_approvals(coordinator.account), 0)
+
+        project.approval_status = models.ApprovalStatus.PENDING
+        project.save()
+        self.assertEqual(models.get_pending_approvals(coordinator.account), 1)
@@ -0,0 +1,224 @@
+from django.core.management import call_command
+from django.test import TestCase, RequestFactory
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from io import StringIO
+from socketserver import ThreadingMixIn
+from xml.etree import ElementTree
+import threading
+import time
+from unittest import mock
+
+from . import models
+from . import planet
+from . import views
+from .factories import InternSelectionFactory
+from .factories import RoundPageFactory
+
+ATOM = '{http://www.w3.org/2005/Atom}'
+
+ATOM_FEED = '''<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <title>{name}'s blog</title>
+  <entry>
+    <id>tag:example.com,2018:{name}-1</id>
+    <title>{name} starts an internship</title>
+    <link href="https://example.com/{name}/1"/>
+    <updated>2018-05-14T10:00:00Z</updated>
+    <summary type="html">&lt;p&gt;Hello &lt;script&gt;world&lt;/script&gt;&lt;/p&gt;</summary>
+  </entry>
+  <entry>
+    <id>tag:example.com,2018:{name}-2</id>
+    <title>Sneaky</title>
+    <link href="javascript:alert(1)"/>
+    <updated>2018-05-15T10:00:00Z</updated>
+  </entry>
+</feed>
+'''
+
+RSS_FEED = '''<?xml version="1.0" encoding="utf-8"?>
+<rss version="2.0"><channel>
+  <title>{name}'s blog</title>
+  <item>
+    <title>{name} fixes a bug</title>
+    <link>https://example.com/{name}/2</link>
+    <pubDate>Wed, 16 May 2018 10:00:00 +0000</pubDate>
+    <description>It was a tricky one.</description>
+  </item>
+</channel></rss>
+'''
+
+class StandInServer(ThreadingMixIn, HTTPServer):
+    """
+    Serves feeds from memory, like a blog host would, and keeps track of
+    the requests it gets.
+    """
+    daemon_threads = True
+
+    def __init__(self):
+        super(StandInServer, self).__init__(('127.0.0.1', 0), StandInHandler)
+        self.feeds = {}
+        self.delay = 0
+        self.lock = threading.Lock()
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def url(self, path):
+        return 'http://127.0.0.1:{}{}'.format(self.server_port, path)
+
+class StandInHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.requests.append((self.path, self.headers.get('If-None-Match')))
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+        try:
+            time.sleep(server.delay)
+            if self.path not in server.feeds:
+                self.send_response(404)
+                self.end_headers()
+                return
+            content = server.feeds[self.path].encode('utf-8')
+            etag = '"{}"'.format(hash(content))
+            if self.headers.get('If-None-Match') == etag:
+                self.send_response(304)
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/xml')
+            self.send_header('Content-Length', str(len(content)))
+            self.send_header('ETag', etag)
+            self.end_headers()
+            self.wfile.write(content)
+        finally:
+            with server.lock:
+                server.in_flight -= 1
+
+    def log_message(self, *args):
+        pass
+
+
+class PlanetTestCase(TestCase):
+    def setUp(self):
+        self.server = StandInServer()
+        thread = threading.Thread(target=self.server.serve_forever)
+        thread.daemon = True
+        thread.start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+        self.current_round = RoundPageFactory(start_from='internstarts')
+
+    def intern(self, name, feed=ATOM_FEED, **kwargs):
+        path = '/{}/feed'.format(name)
+        self.server.feeds[path] = feed.format(name=name)
+        kwargs.setdefault('active', True)
+        return InternSelectionFactory(
+            round=self.current_round,
+            applicant__applicant__public_name=name,
+            applicant__applicant__blog_rss_url=self.server.url(path),
+            **kwargs)
+
+    def fetch(self, *args):
+        stdout = StringIO()
+        call_command('fetchplanet', *args, stdout=stdout, stderr=StringIO())
+        return stdout.getvalue()
+
+    def test_parse_feed(self):
+        posts = planet.parse_feed(ATOM_FEED.format(name='ada'))
+        self.assertEqual([post['link'] for post in posts], ['https://example.com/ada/1'])
+        self.assertEqual(posts[0]['summary'], 'Hello world')
+
+        posts = planet.parse_feed(RSS_FEED.format(name='ada'))
+        self.assertEqual(posts[0]['guid'], 'https://example.com/ada/2')
+        self.assertEqual(posts[0]['published'].day, 16)
+
+        with self.assertRaises(ValueError):
+            planet.parse_feed('<html></html>')
+
+        # Entities can expand without limit, so DOCTYPEs are refused before
+        # anything is expanded.
+        with self.assertRaises(ValueError):
+            planet.parse_feed('<?xml version="1.0"?><!DOCTYPE feed [<!ENTITY a "aaaa">'
+                    '<!ENTITY b "&a;&a;&a;&a;">]><feed xmlns="http://www.w3.org/2005/Atom">&b;</feed>')
+        with self.assertRaises(ValueError):
+            planet.parse_feed(b'<!DOCTYPE rss SYSTEM "file:///etc/passwd"><rss/>')
+
+        # Markup inside a post is just text, though.
+        feed = ATOM_FEED.format(name='ada').replace('<summary type="html">',
+                '<summary type="html"><![CDATA[<!DOCTYPE html>]]>')
+        self.assertEqual(len(planet.parse_feed(feed)), 1)
+
+    def test_fetch_with_conditional_requests(self):
+        self.intern('ada')
+        self.intern('grace', feed=RSS_FEED)
+        self.intern('mallory', organizer_approved=False, in_good_standing=True)
+
+        self.assertIn('Fetched 2 blogs, 0 failed', self.fetch())
+        self.assertEqual(sorted(path for path, etag in self.server.requests), ['/ada/feed', '/grace/feed'])
+        self.assertEqual(models.InternBlogPost.objects.count(), 2)
+
+        # Feeds that haven't changed answer 304 and nothing is stored
+        # twice.
+        self.server.requests = []
+        self.fetch()
+        self.assertTrue(all(etag for path, etag in self.server.requests))
+        self.assertEqual(models.InternBlogPost.objects.count(), 2)
+
+        self.server.feeds['/ada/feed'] = self.server.feeds['/ada/feed'].replace(
+                'starts', 'begins').replace('2018-05-14T10', '2018-05-14T12')
+        self.fetch()
+        self.assertEqual(models.InternBlogPost.objects.count(), 2)
+
+        response = views.planet_feed(RequestFactory().get('/planet/feed/'))
+        feed = ElementTree.fromstring(response.content)
+        titles = [e.findtext(ATOM + 'title') for e in feed.findall(ATOM + 'entry')]
+        self.assertEqual(titles, ['grace fixes a bug', 'ada begins an internship'])
+        self.assertIn('ETag', response)
+
+        # The merged feed comes from the cache until the next fetch.
+        with self.assertNumQueries(0):
+            response = views.planet_feed(RequestFactory().get('/planet/feed/',
+                HTTP_IF_NONE_MATCH=response['ETag']))
+        self.assertEqual(response.status_code, 304)
+
+    def test_per_host_limit(self):
+        for name in ('ada', 'grace', 'katherine', 'margaret'):
+            self.intern(name)
+        self.server.delay = 0.2
+
+        self.fetch('--per-host', '1')
+        self.assertEqual(len(self.server.requests), 4)
+        self.assertEqual(self.server.max_in_flight, 1)
+
+        self.server.max_in_flight = 0
+        self.fetch('--per-host', '4')
+        self.assertGreater(self.server.max_in_flight, 1)
+
+    def test_repeated_guids(self):
+        blog = models.InternBlog.objects.create(comrade=self.intern('ada').applicant.applicant, url='https://example.com/')
+        posts = planet.parse_feed(ATOM_FEED.format(name='ada'))
+        long_guid = dict(posts[0], guid='x' * 500 + 'first')
+        posts = [long_guid, dict(long_guid, guid='x' * 500 + 'second')] + posts + posts
+        blog.store_posts(posts)
+        self.assertEqual(sorted(blog.internblogpost_set.values_list('guid', flat=True)),
+                ['tag:example.com,2018:ada-1', 'x' * 500])
+
+    def test_one_bad_blog_does_not_stop_the_rest(self):
+        self.intern('ada')
+        self.intern('grace', feed=RSS_FEED)
+        store_posts = models.InternBlog.store_posts
+
+        def fail_for_ada(blog, posts):
+            store_posts(blog, posts)
+            if blog.comrade.public_name == 'ada':
+                raise RuntimeError('disk full')
+
+        with mock.patch.object(models.InternBlog, 'store_posts', fail_for_ada):
+            self.assertIn('Fetched 2 blogs, 1 failed', self.fetch())
+        ada = models.InternBlog.objects.get(comrade__public_name='ada')
+        self.assertEqual(ada.error, 'RuntimeError: disk full')
+        self.assertEqual(ada.etag, '')
+        self.assertFalse(ada.internblogpost_set.exists())
+        self.assertEqual(models.InternBlogPost.objects.get().title, 'grace fixes a bug')
@@ -0,0 +1,51 @@
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.middleware.csrf import get_token
+from django.test import RequestFactory, TestCase
+
+from .factories import ComradeFactory
+from .factories import ProjectFactory
+from .views import cache_page_for_anonymous
+
+
+class AnonymousPageCacheTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.calls = 0
+
+        @cache_page_for_anonymous
+        def view(request):
+            self.calls += 1
+            return HttpResponse('page {}'.format(self.calls))
+        self.view = view
+
+    def get(self, path='/apply/project-selection/', user=None):
+        request = RequestFactory().get(path)
+        request.user = user or AnonymousUser()
+        return self.view(request)
+
+    def test_anonymous_requests_share_a_response(self):
+        self.assertEqual(self.get().content, b'page 1')
+        self.assertEqual(self.get().content, b'page 1')
+        self.assertEqual(self.get('/past-projects/').content, b'page 2')
+
+    def test_logged_in_requests_are_not_cached(self):
+        user = ComradeFactory().account
+        self.assertEqual(self.get(user=user).content, b'page 1')
+        self.assertEqual(self.get(user=user).content, b'page 2')
+
+    def test_responses_for_one_visitor_are_not_cached(self):
+        @cache_page_for_anonymous
+        def view(request):
+            self.calls += 1
+            get_token(request)
+            return HttpResponse('page {}'.format(self.calls))
+        self.view = view
+        self.assertEqual(self.get().content, b'page 1')
+        self.assertEqual(self.get().content, b'page 2')
+
+    def test_saving_a_project_invalidates_pages(self):
+        self.assertEqual(self.get().content, b'page 1')
+        ProjectFactory()
+        self.assertEqual(self.get().content, b'page 2')
@@ -0,0 +1,110 @@
+import datetime
+from django.db.models import Value
+from django.db.models.functions import Coalesce
+from django.test import TestCase
+
+from . import models
+from .factories import ApplicantApprovalFactory
+from .factories import ApplicationReviewerFactory
+from .factories import RoundPageFactory
+from .views import ApplicationReviewFilterForm
+from .views import keyset_page
+from .views import load_review_grid
+
+
+class ReviewGridTestCase(TestCase):
+    def test_query_count_independent_of_applications(self):
+        current_round = RoundPageFactory()
+        reviewers = [ApplicationReviewerFactory(reviewing_round=current_round) for _ in range(2)]
+        for _ in range(3):
+            application = ApplicantApprovalFactory(
+                    application_round=current_round,
+                    approval_status=models.ApprovalStatus.REJECTED,
+                    reason_denied='TIME')
+            for reviewer in reviewers:
+                models.InitialApplicationReview.objects.create(
+                        application=application,
+                        reviewer=reviewer,
+                        essay_rating=models.InitialApplicationReview.GOOD,
+                        review_work=True)
+
+        applications = models.ApplicantApproval.objects.filter(application_round=current_round)
+        # applications with their one-to-ones, then the reviews
+        with self.assertNumQueries(2):
+            rows = load_review_grid(applications)
+            for row in rows:
+                self.assertTrue(row.reason_for_status.startswith('Not enough days free'))
+                self.assertEqual(len(row.essay_ratings), 2)
+                self.assertEqual(row.red_flags[0][0], ['Review work commitments'])
+                self.assertFalse(row.needs_revision)
+        self.assertEqual(len(rows), 3)
+
+    def test_keyset_pages_cover_every_application_once(self):
+        current_round = RoundPageFactory()
+        day = datetime.date(2018, 1, 1)
+        for i in range(7):
+            ApplicantApprovalFactory(application_round=current_round, submission_date=day + datetime.timedelta(days=i // 2))
+
+        applications = models.ApplicantApproval.objects.filter(application_round=current_round)
+        expected = list(applications.order_by('submission_date', 'pk'))
+        seen = []
+        after = None
+        while True:
+            page, after = keyset_page(applications, ('submission_date', 'pk'), False, after, 3)
+            seen.extend(page)
+            if after is None:
+                break
+        self.assertEqual(seen, expected)
+
+        seen = []
+        after = None
+        while True:
+            page, after = keyset_page(applications, ('submission_date', 'pk'), True, after, 2)
+            seen.extend(page)
+            if after is None:
+                break
+        self.assertEqual(seen, expected[::-1])
+
+    def test_keyset_pages_by_days_free(self):
+        current_round = RoundPageFactory()
+        for days in (None, 30, 10, 30, None):
+            ApplicantApprovalFactory(application_round=current_round, longest_period_free=days)
+
+        applications = models.ApplicantApproval.objects.filter(
+                application_round=current_round,
+        ).annotate(days_free=Coalesce('longest_period_free', Value(-1)))
+        first, after = keyset_page(applications, ('days_free', 'pk'), True, None, 2)
+        rest, after = keyset_page(applications, ('days_free', 'pk'), True, after, 5)
+        self.assertIsNone(after)
+        self.assertEqual([a.longest_period_free for a in first + rest], [30, 30, 10, None, None])
+
+    def test_filters(self):
+        current_round = RoundPageFactory()
+        reviewer = ApplicationReviewerFactory(reviewing_round=current_round)
+        owned = ApplicantApprovalFactory(application_round=current_round, review_owner=reviewer)
+        flagged = ApplicantApprovalFactory(application_round=current_round, reason_denied='TIME')
+        models.InitialApplicationReview.objects.create(
+                application=flagged,
+                reviewer=reviewer,
+                essay_rating=models.InitialApplicationReview.GOOD,
+                missing_school=True)
+        applications = models.ApplicantApproval.objects.filter(application_round=current_round)
+
+        def filtered(**params):
+            form = ApplicationReviewFilterForm(params)
+            self.assertTrue(form.is_valid())
+            return set(form.filter(applications, reviewer.comrade.account))
+
+        self.assertEqual(filtered(), {owned, flagged})
+        self.assertEqual(filtered(owner='me'), {owned})
+        self.assertEqual(filtered(owner='none'), {flagged})
+        self.assertEqual(filtered(essay_rating=models.InitialApplicationReview.GOOD), {flagged})
+        self.assertEqual(filtered(red_flag='missing_school'), {flagged})
+        self.assertEqual(filtered(red_flag='review_work'), set())
+        self.assertEqual(filtered(reason='TIME'), {flagged})
+        self.assertEqual(filtered(unreviewed='on'), {owned})
+
+        # Free periods that haven't been computed match no range.
+        models.ApplicantApproval.objects.filter(pk=owned.pk).update(longest_period_free=0)
+        self.assertEqual(filtered(max_days_free=10), {owned})
+        self.assertEqual(filtered(min_days_free=0), {owned})
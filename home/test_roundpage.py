@@ -1,11 +1,19 @@
 from datetime import datetime, timedelta, timezone
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
 from django.test import TestCase, override_settings
 from django.urls import reverse
 import unittest
+from unittest import mock
 
 from . import models
+from .factories import ApplicantApprovalFactory
+from .factories import ContributionFactory
+from .factories import InternSelectionFactory
 from .factories import MentorApprovalFactory
 from .factories import ProjectFactory
+from .factories import RoundPageFactory
+from .views import load_project_catalog
 
 
 # don't try to use the static files manifest during tests
@@ -155,3 +163,132 @@ class RoundPageTestCase(TestCase):
         self.assertContains(response, 'review the list of participating communities below who are looking for help', status_code=200)
         # Make sure the page shows the community
         self.assertContains(response, community_name, status_code=200)
+
+class RoundStatisticsTestCase(TestCase):
+    def test_statistics(self):
+        contribution = ContributionFactory()
+        current_round = contribution.applicant.application_round
+        ApplicantApprovalFactory(
+                application_round=current_round,
+                approval_status=models.ApprovalStatus.REJECTED,
+                reason_denied='TIME')
+        models.Sponsorship.objects.create(
+                participation=contribution.project.project_round,
+                coordinator_can_update=True,
+                name='Sponsor',
+                amount=13000)
+
+        current_round = models.RoundPage.objects.get(pk=current_round.pk)
+        self.assertEqual(current_round.get_statistics_on_eligibility_check(), (2, 1, 0, 100, 0))
+        self.assertEqual(current_round.number_contributors(), 1)
+        self.assertEqual(current_round.number_approved_communities_with_projects(), 1)
+        self.assertEqual(current_round.number_approved_projects(), 1)
+        self.assertEqual(current_round.number_funded_interns(), 2)
+        self.assertEqual(current_round.get_contributor_applicant_funding_status(), (1, 1, 0, 2))
+
+    def test_statistics_refreshed_after_changes(self):
+        contribution = ContributionFactory()
+        current_round = contribution.applicant.application_round
+        self.assertEqual(current_round.number_contributors(), 1)
+
+        ContributionFactory(
+                round=current_round,
+                project=contribution.project)
+
+        current_round = models.RoundPage.objects.get(pk=current_round.pk)
+        self.assertEqual(current_round.number_contributors(), 2)
+
+    def test_change_during_refresh_keeps_statistics_stale(self):
+        contribution = ContributionFactory()
+        current_round = contribution.applicant.application_round
+        participations = models.Participation.objects.filter
+        changed = []
+
+        def filter_and_change(*args, **kwargs):
+            # Another request records a contribution after the applications
+            # were counted.
+            if not changed:
+                changed.append(ContributionFactory(round=current_round, project=contribution.project))
+            return participations(*args, **kwargs)
+
+        with mock.patch.object(models.Participation.objects, 'filter', filter_and_change):
+            self.assertEqual(current_round.number_contributors(), 1)
+        statistics = models.RoundStatistics.objects.get(round=current_round)
+        self.assertTrue(statistics.stale)
+
+        current_round = models.RoundPage.objects.get(pk=current_round.pk)
+        self.assertEqual(current_round.number_contributors(), 2)
+        self.assertFalse(models.RoundStatistics.objects.get(round=current_round).stale)
+
+    def test_communities_with_unused_funding(self):
+        intern = InternSelectionFactory(
+                active=True,
+                round__start_from='internannounce')
+        current_round = intern.project.project_round.participating_round
+        participation = intern.project.project_round
+        models.Sponsorship.objects.create(
+                participation=participation,
+                coordinator_can_update=True,
+                name='Sponsor',
+                amount=6500 * 2 + 100)
+
+        self.assertEqual(participation.interns_funded(), 2)
+        self.assertEqual(
+                current_round.get_communities_with_unused_funding(),
+                [(participation.community, 1, 2)])
+
+        annotated = models.Participation.objects.with_funding().get(pk=participation.pk)
+        self.assertEqual(annotated.total_sponsorship, 6500 * 2 + 100)
+        self.assertEqual(annotated.interns_funded(), 2)
+        self.assertEqual(annotated.org_funded_interns, 1)
+
+class ProjectCatalogTestCase(TestCase):
+    def test_query_count_independent_of_communities(self):
+        open_date = datetime.now(timezone.utc) - timedelta(days=10)
+        current_round = RoundPageFactory(start_from='appsopen', start_date=open_date)
+        for _ in range(3):
+            mentor_approval = MentorApprovalFactory(
+                    approval_status=models.ApprovalStatus.APPROVED,
+                    project__approval_status=models.ApprovalStatus.APPROVED,
+                    project__project_round__approval_status=models.ApprovalStatus.APPROVED,
+                    project__project_round__participating_round=current_round)
+            models.ProjectSkill.objects.create(
+                    project=mentor_approval.project,
+                    skill='Python',
+                    required=models.ProjectSkill.STRONG)
+
+        role = models.Role(AnonymousUser(), current_round)
+        # participations, projects, skills, channels, mentors
+        with self.assertNumQueries(5):
+            closed, ontime, late = load_project_catalog(current_round, role)
+            self.assertEqual(len(ontime), 3)
+            for community, funded, projects in ontime:
+                for project in projects:
+                    self.assertEqual([s.skill for s in project.required_skills()], ['Python'])
+                    self.assertEqual(len(project.get_approved_mentors()), 1)
+                    self.assertEqual(list(project.communicationchannel_set.all()), [])
+
+class RoundTimelineTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_phases(self):
+        today = models.get_deadline_date_for(datetime.now(timezone.utc))
+        past_round = RoundPageFactory(start_from='internends', start_date=today - timedelta(days=10))
+        open_round = RoundPageFactory(start_from='appsopen', start_date=today - timedelta(days=1))
+
+        timeline = models.RoundTimeline.load()
+        with self.assertNumQueries(0):
+            self.assertEqual(timeline.application_round().pk, open_round.pk)
+            self.assertEqual(timeline.project_selection_round().pk, open_round.pk)
+            self.assertEqual(timeline.previous_project_selection_round().pk, past_round.pk)
+            self.assertEqual(timeline.upcoming_round().pk, open_round.pk)
+
+    def test_cached_until_round_saved(self):
+        RoundPageFactory()
+        models.RoundTimeline.load()
+        with self.assertNumQueries(0):
+            self.assertEqual(len(models.RoundTimeline.load().rounds), 1)
+
+        RoundPageFactory()
+        self.assertEqual(len(models.RoundTimeline.load().rounds), 2)
@@ -0,0 +1,71 @@
+from django.test import TestCase
+import datetime
+
+from . import models
+from . import schools
+from .factories import ApplicantApprovalFactory
+from .factories import RoundPageFactory
+
+
+class SchoolDomainTestCase(TestCase):
+    def school_information(self, website, **kwargs):
+        return models.SchoolInformation.objects.create(
+            applicant=ApplicantApprovalFactory(**kwargs),
+            university_name='Example University',
+            university_website=website,
+            current_academic_calendar='https://example.edu/calendar',
+            next_academic_calendar='https://example.edu/calendar',
+            degree_name='Computer Science',
+        )
+
+    def test_get_school_domain(self):
+        for url, expected in (
+                ('https://www.Example.edu/', 'example.edu'),
+                ('http://example.edu:8080/cs', 'example.edu'),
+                ('https://cs.example.edu', 'cs.example.edu'),
+                ):
+            with self.subTest(url=url):
+                self.assertEqual(schools.get_school_domain(url), expected)
+
+    def test_classmate_stats_in_one_query(self):
+        current_round = RoundPageFactory(start_from='appsopen')
+        school_info = self.school_information('https://www.example.edu/',
+                application_round=current_round,
+                approval_status=models.ApprovalStatus.PENDING)
+        self.school_information('http://example.edu/admissions',
+                application_round=current_round,
+                approval_status=models.ApprovalStatus.APPROVED)
+        self.school_information('https://example.edu',
+                application_round=current_round,
+                approval_status=models.ApprovalStatus.REJECTED,
+                reason_denied='TIME')
+        self.school_information('https://example.edu',
+                approval_status=models.ApprovalStatus.APPROVED)
+        self.school_information('https://other.edu',
+                application_round=current_round,
+                approval_status=models.ApprovalStatus.APPROVED)
+
+        with self.assertNumQueries(1):
+            stats = school_info.classmate_stats
+        self.assertEqual(stats['total'], 3)
+        self.assertEqual(stats['pending'], 1)
+        self.assertEqual(stats['accepted'], 1)
+        self.assertAlmostEqual(stats['acceptance_rate'], 100 / 3)
+        self.assertAlmostEqual(stats['time_rejection_rate'], 100 / 3)
+
+    def test_find_official_terms(self):
+        school = models.OfficialSchool.objects.create(
+            university_name='Example University',
+            university_website='http://www.example.edu',
+        )
+        models.OfficialSchoolTerm.objects.create(
+            school=school,
+            term_name='Fall',
+            start_date=datetime.date(2018, 9, 1),
+            end_date=datetime.date(2018, 12, 15),
+        )
+        school_info = self.school_information('https://example.edu/')
+
+        with self.assertNumQueries(1):
+            terms = list(school_info.find_official_terms())
+            self.assertEqual([t.school.university_name for t in terms], ['Example University'])
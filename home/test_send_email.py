@@ -0,0 +1,45 @@
+from django.test import override_settings, RequestFactory, TestCase
+
+from . import models
+from .factories import ComradeFactory
+from .factories import MentorApprovalFactory
+from .factories import RoundPageFactory
+from .views import MentorCheckDeadlinesReminder
+
+
+@override_settings(ALLOWED_HOSTS=['www.outreachy.org'])
+class SendEmailPreviewTestCase(TestCase):
+    def setUp(self):
+        self.current_round = RoundPageFactory(start_from='appsopen')
+        self.mentors = [
+            MentorApprovalFactory(
+                approval_status=models.ApprovalStatus.APPROVED,
+                project__approval_status=models.ApprovalStatus.APPROVED,
+                project__project_round__participating_round=self.current_round,
+            ).mentor
+            for _ in range(5)
+        ]
+        self.staff = ComradeFactory(account__is_staff=True).account
+
+    def get(self, **params):
+        request = RequestFactory().get('/', params, secure=True, HTTP_HOST='www.outreachy.org')
+        request.user = self.staff
+        view = MentorCheckDeadlinesReminder()
+        view.request = request
+        view.args = ()
+        view.kwargs = {'round_slug': self.current_round.slug}
+        view.preview_page_size = 2
+        view.recipient_chunk_size = 2
+        return view
+
+    def test_preview_renders_one_page(self):
+        context = self.get(page='3').get_context_data()
+        self.assertEqual(context['paginator'].count, 5)
+        self.assertEqual(context['page_obj'].number, 3)
+        self.assertEqual(len(context['messages']), 1)
+
+    def test_stream_full_recipient_list(self):
+        view = self.get(recipients='')
+        response = view.get(view.request)
+        recipients = b''.join(response.streaming_content).decode('utf-8').splitlines()
+        self.assertEqual(sorted(recipients), sorted(str(m.email_address()) for m in self.mentors))
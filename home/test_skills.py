@@ -0,0 +1,58 @@
+from django.test import TestCase
+import datetime
+
+from . import models
+from .factories import ProjectFactory
+from .factories import RoundPageFactory
+from .skills import classify_skill, reclassify_skills
+
+
+class SkillClassificationTestCase(TestCase):
+    def test_classify_skill(self):
+        for skill, expected in (
+                ('Python 3', ('Python', '')),
+                ('JavaScript', ('JavaScript', '')),
+                ('Some JS', ('JavaScript', '')),
+                ('JSON', ('JSON', '')),
+                ('Java and Android', ('Java', 'Android')),
+                ('Android', ('Android', '')),
+                ('Android apps with node.js', ('JavaScript', 'Android,node.js')),
+                ('Git or Mercurial', ('Git', 'Mercurial')),
+                ('C', ('C programming', '')),
+                ('Ruby on Rails', ('Ruby on Rails', '')),
+                ('  Haskell ', ('Haskell', '')),
+                ):
+            with self.subTest(skill=skill):
+                self.assertEqual(classify_skill(skill), expected)
+
+    def test_common_skills_in_one_query(self):
+        rounds = [
+            RoundPageFactory(start_from='internstarts', start_date=datetime.date(2018 + i, 6, 1))
+            for i in range(2)
+        ]
+        for r in rounds:
+            for skills in (('python', 'Android and Java'), ('Python 3', 'Java, Android and Mercurial')):
+                project = ProjectFactory(
+                    approval_status=models.ApprovalStatus.APPROVED,
+                    project_round__participating_round=r,
+                )
+                for skill in skills:
+                    models.ProjectSkill.objects.create(project=project, skill=skill)
+
+        unapproved = ProjectFactory(project_round__participating_round=rounds[0])
+        models.ProjectSkill.objects.create(project=unapproved, skill='Python')
+
+        with self.assertNumQueries(1):
+            counters = models.ProjectSkill.count_common_skills(rounds)
+        for r in rounds:
+            self.assertEqual(counters[r.pk], {'Python': 2, 'Java': 2, 'Android': 2, 'Mercurial': 1})
+
+    def test_reclassify_skills(self):
+        project = ProjectFactory()
+        skill = models.ProjectSkill.objects.create(project=project, skill='python')
+        models.ProjectSkill.objects.filter(pk=skill.pk).update(canonical_skill='', secondary_skill='')
+
+        self.assertEqual(reclassify_skills(models.ProjectSkill.objects.all()), 1)
+        skill.refresh_from_db()
+        self.assertEqual(skill.canonical_skill, 'Python')
+        self.assertEqual(reclassify_skills(models.ProjectSkill.objects.all()), 0)
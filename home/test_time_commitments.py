@@ -0,0 +1,162 @@
+import datetime
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase
+from itertools import groupby
+import random
+from types import SimpleNamespace
+
+from .factories import ApplicantApprovalFactory
+from .factories import RoundPageFactory
+from .models import ApplicantApproval
+from .models import create_time_commitment_calendar
+from .models import find_longest_free_period
+from .models import RoundTimeline
+from .models import VolunteerTimeCommitment
+
+
+def longest_free_period_from_calendar(tcs, application_round):
+    # The day-by-day version that find_longest_free_period replaced.
+    calendar = create_time_commitment_calendar(tcs, application_round)
+    longest = 0
+    start_day = 0
+    counter = 0
+    for key, group in groupby(calendar, lambda hours: hours <= 20):
+        group_len = len(list(group))
+        if key is True and group_len > longest:
+            longest = group_len
+            start_day = counter
+        counter += group_len
+    if longest == 0:
+        return None, None, None
+    start = application_round.internstarts + datetime.timedelta(days=start_day)
+    return longest, start, start + datetime.timedelta(days=longest - 1)
+
+
+class LongestFreePeriodTestCase(SimpleTestCase):
+    internstarts = datetime.date(2018, 12, 4)
+    internends = datetime.date(2019, 3, 4)
+
+    def tc(self, start, end, hours):
+        return {
+                'start_date': self.internstarts + datetime.timedelta(days=start),
+                'end_date': self.internstarts + datetime.timedelta(days=end),
+                'hours': hours,
+                }
+
+    def find(self, *tcs):
+        return find_longest_free_period(tcs, self.internstarts, self.internends)
+
+    def test_no_commitments(self):
+        self.assertEqual(self.find(), (91, self.internstarts, self.internends))
+
+    def test_never_free(self):
+        self.assertEqual(self.find(self.tc(-10, 100, 40)), (None, None, None))
+
+    def test_commitments_add_up(self):
+        length, start, end = self.find(self.tc(10, 20, 15), self.tc(15, 80, 10))
+        self.assertEqual((length, start, end), (70, self.internstarts + datetime.timedelta(days=21), self.internends))
+
+    def test_earliest_of_equal_runs(self):
+        length, start, end = self.find(self.tc(30, 60, 40))
+        self.assertEqual((length, start), (30, self.internstarts))
+
+    def test_matches_calendar(self):
+        rng = random.Random(0)
+        application_round = SimpleNamespace(internstarts=self.internstarts, internends=self.internends)
+        for _ in range(200):
+            tcs = []
+            for _ in range(rng.randrange(6)):
+                start = rng.randrange(-30, 120)
+                tcs.append(self.tc(start, start + rng.randrange(60), rng.choice((5, 10, 20, 40 * 2 / 3, 40))))
+            self.assertEqual(
+                    find_longest_free_period(tcs, self.internstarts, self.internends),
+                    longest_free_period_from_calendar(tcs, application_round))
+
+
+class SummarizeTimeCommitmentsTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_query_count_independent_of_applications(self):
+        current_round = RoundPageFactory()
+        applications = []
+        for busy_days in (0, 30, 60):
+            application = ApplicantApprovalFactory(application_round=current_round)
+            if busy_days:
+                VolunteerTimeCommitment.objects.create(
+                        applicant=application,
+                        start_date=current_round.internstarts,
+                        end_date=current_round.internstarts + datetime.timedelta(days=busy_days - 1),
+                        hours_per_week=40)
+            applications.append(application)
+
+        queryset = ApplicantApproval.objects.filter(pk__in=[a.pk for a in applications])
+        RoundTimeline.load()
+        # the applications, plus one query per kind of time commitment
+        with self.assertNumQueries(5):
+            summaries = ApplicantApproval.summarize_time_commitments(queryset)
+
+        total_days = (current_round.internends - current_round.internstarts).days + 1
+        for application, busy_days in zip(applications, (0, 30, 60)):
+            summary = summaries[application.pk]
+            self.assertEqual(summary['longest_period_free'], total_days - busy_days)
+            self.assertEqual(summary['free_period_end_date'], current_round.internends)
+            self.assertEqual(summary['longest_period_free'], application.get_time_commitments()['longest_period_free'])
+
+
+class StoredFreePeriodTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_updated_with_time_commitments(self):
+        application = ApplicantApprovalFactory()
+        current_round = application.application_round
+        commitment = VolunteerTimeCommitment.objects.create(
+                applicant=application,
+                start_date=current_round.internstarts,
+                end_date=current_round.internstarts + datetime.timedelta(days=9),
+                hours_per_week=40)
+
+        application.refresh_from_db()
+        total_days = (current_round.internends - current_round.internstarts).days + 1
+        self.assertEqual(application.longest_period_free, total_days - 10)
+        self.assertEqual(application.free_period_start, current_round.internstarts + datetime.timedelta(days=10))
+        self.assertEqual(application.free_period_end, current_round.internends)
+
+        commitment.delete()
+        application.refresh_from_db()
+        self.assertEqual(application.longest_period_free, total_days)
+
+    def test_updated_with_round_dates(self):
+        application = ApplicantApprovalFactory()
+        current_round = application.application_round
+        ApplicantApproval.update_free_periods([application])
+        total_days = (current_round.internends - current_round.internstarts).days + 1
+
+        current_round.internends += datetime.timedelta(days=7)
+        current_round.save()
+        application.refresh_from_db()
+        self.assertEqual(application.longest_period_free, total_days + 7)
+
+    def test_never_free_is_not_unknown(self):
+        application = ApplicantApprovalFactory()
+        self.assertIsNone(application.longest_period_free)
+
+        current_round = application.application_round
+        VolunteerTimeCommitment.objects.create(
+                applicant=application,
+                start_date=current_round.internstarts,
+                end_date=current_round.internends,
+                hours_per_week=40)
+        application.refresh_from_db()
+        self.assertEqual(application.longest_period_free, 0)
+        self.assertIsNone(application.free_period_start)
+
+    def test_summary_without_free_period(self):
+        application = ApplicantApprovalFactory()
+        ApplicantApproval.objects.filter(pk=application.pk).update(longest_period_free=None)
+        application.refresh_from_db()
+
+        with self.assertNumQueries(0):
+            summary = application.get_days_free_summary()
+        self.assertTrue(summary.startswith('Free days not computed yet / '))
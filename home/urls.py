@@ -55,6 +55,8 @@ round_community_patterns = [
 round_patterns = [
     url(r'^communities/(?P<community_slug>[^/]+)/', include(round_community_patterns)),
     url(r'^contract-export/$', views.contract_export_view, name='contract-export'),
+    url(r'^applicant-export/$', views.applicant_export_view, name='applicant-export'),
+    url(r'^contribution-export/$', views.contribution_export_view, name='contribution-export'),
     url(r'^initial-feedback-export/$', views.initial_mentor_feedback_export_view, name='initial-feedback-export'),
     url(r'^initial-feedback-summary/$', views.initial_feedback_summary, name='initial-feedback-summary'),
     url(r'^midpoint-feedback-export/$', views.midpoint_mentor_feedback_export_view, name='midpoint-feedback-export'),
@@ -81,10 +83,13 @@ urlpatterns = [
     url(r'^generic-intern-contract-export/$', views.generic_intern_contract_export_view, name='generic-intern-contract-export'),
     url(r'^generic-mentor-contract-export/$', views.generic_mentor_contract_export_view, name='generic-mentor-contract-export'),
     url(r'^alums/$', views.alums_page, name='alums'),
+    url(r'^planet/$', views.planet, name='planet'),
+    url(r'^planet/feed/$', views.planet_feed, name='planet-feed'),
     url(r'^dashboard/$', views.dashboard, name='dashboard'),
     url(r'^dashboard/pending-applications/$', views.applicant_review_summary, name='pending-applicants-summary', kwargs={'status': ApprovalStatus.PENDING}),
     url(r'^dashboard/rejected-applications/$', views.applicant_review_summary, name='rejected-applicants-summary', kwargs={'status': ApprovalStatus.REJECTED}),
     url(r'^dashboard/approved-applications/$', views.applicant_review_summary, name='approved-applicants-summary', kwargs={'status': ApprovalStatus.APPROVED}),
+    url(r'^dashboard/search-applications/$', views.applicant_review_search, name='applicant-review-search'),
     url(r'^dashboard/delete-application/(?P<applicant_username>[^/]+)/$', views.DeleteApplication.as_view(), name='delete-application'),
     url(r'^dashboard/review-applications/(?P<applicant_username>[^/]+)/$', views.ViewInitialApplication.as_view(), name='applicant-review-detail'),
     url(r'^dashboard/review-applications/update-comment/(?P<applicant_username>[^/]+)/$', views.ReviewCommentUpdate.as_view(), name='update-comment'),
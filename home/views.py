@@ -6,13 +6,18 @@ from django.contrib.auth.decorators import login_required
 from django.contrib.admin.views.decorators import staff_member_required
 from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
 from django.core import mail
+from django.core.cache import cache
 from django.core.mail.backends.base import BaseEmailBackend
-from django.core.exceptions import PermissionDenied
+from django.core.exceptions import ObjectDoesNotExist, PermissionDenied
+from django.core.paginator import EmptyPage, PageNotAnInteger, Paginator
+from django.core import signing
 from django.core.signing import TimestampSigner, SignatureExpired, BadSignature 
+from django import forms
 from django.db import models
+from django.db.models.functions import Coalesce
 from django.forms import inlineformset_factory, ModelForm, modelform_factory, modelformset_factory, ValidationError
 from django.forms.models import BaseInlineFormSet, BaseModelFormSet
-from django.http import JsonResponse, HttpResponse, Http404
+from django.http import HttpResponse, Http404, StreamingHttpResponse
 from django.shortcuts import get_list_or_404
 from django.shortcuts import get_object_or_404
 from django.shortcuts import redirect
@@ -25,16 +30,24 @@ from django.views.decorators.http import require_POST
 from django.views.generic import FormView, View, DetailView, ListView, TemplateView
 from django.views.generic.edit import CreateView, DeleteView, UpdateView
 from formtools.wizard.views import SessionWizardView
-from itertools import chain, groupby
+from functools import wraps
+from itertools import chain, islice
 from markdownx.utils import markdownify
 from registration.forms import RegistrationForm
 from registration.backends.hmac import views as hmac_views
 import reversion
+import uuid
 
 from . import email
 
 from .dashboard import get_dashboard_sections
 
+from .exports import export_response
+from .exports import iterate_in_chunks
+
+from .feeds import PlanetFeed
+from .feeds import cached_feed_response
+
 from .forms import RadioBooleanField
 
 from .mixins import ApprovalStatusAction
@@ -49,6 +62,7 @@ from .models import ApplicantApproval
 from .models import ApplicantGenderIdentity
 from .models import ApplicantRaceEthnicityInformation
 from .models import ApplicationReviewer
+from .models import ApplicationSearchDocument
 from .models import ApprovalStatus
 from .models import BarriersToParticipation
 from .models import CohortPage
@@ -58,10 +72,13 @@ from .models import Comrade
 from .models import ContractorInformation
 from .models import Contribution
 from .models import CoordinatorApproval
-from .models import create_time_commitment_calendar
 from .models import EmploymentTimeCommitment
+from .models import find_longest_free_period
 from .models import FinalApplication
+from .models import get_cache_generation
 from .models import get_deadline_date_for
+from .models import get_public_page_cache_key
+from .models import InternBlogPost
 from .models import InternSelection
 from .models import InitialApplicationReview
 from .models import InitialMentorFeedback
@@ -76,12 +93,14 @@ from .models import NonCollegeSchoolTimeCommitment
 from .models import Notification
 from .models import Participation
 from .models import PaymentEligibility
+from .models import PLANET_GENERATION_KEY
 from .models import PriorFOSSExperience
 from .models import Project
 from .models import ProjectSkill
 from .models import PromotionTracking
 from .models import Role
 from .models import RoundPage
+from .models import RoundTimeline
 from .models import SchoolInformation
 from .models import SchoolTimeCommitment
 from .models import TimeCommitmentSummary
@@ -92,6 +111,54 @@ from .models import WorkEligibility
 
 from os import path
 
+def cache_page_for_anonymous(view):
+    """
+    Serve logged-out visitors a cached copy of a page that looks the same
+    for all of them. The cached copies are thrown away whenever one of the
+    models in PUBLIC_PAGES_DEPENDENCIES changes or a deadline passes.
+
+    That only works if every process shares one cache, which is why
+    production uses the database cache. With Django's default per-process
+    cache, a change is only seen by the process that made it, and the
+    others keep serving their copies for up to the cache's default
+    timeout of five minutes.
+    """
+    @wraps(view)
+    def wrapper(request, *args, **kwargs):
+        if request.user.is_authenticated or request.method not in ('GET', 'HEAD'):
+            return view(request, *args, **kwargs)
+
+        key = get_public_page_cache_key(request)
+        response = cache.get(key)
+        if response is None:
+            response = view(request, *args, **kwargs)
+            if response.status_code == 200 and not response.streaming and is_shareable(request, response):
+                cache.set(key, response)
+        return response
+    return wrapper
+
+def is_shareable(request, response):
+    """
+    Whether a response to an anonymous visitor can be shown to every other
+    anonymous visitor. The CSRF, session, and messages middleware only add
+    their cookies after the view returns, so look at what the view asked
+    them for rather than at the response's cookies.
+    """
+    if callable(getattr(response, 'render', None)):
+        # Template responses only render, and ask for a CSRF token, later.
+        response.render()
+    if response.cookies or request.META.get('CSRF_COOKIE_USED'):
+        return False
+    session = getattr(request, 'session', None)
+    if session is not None and session.modified:
+        return False
+    # Messages shown on this page, or waiting for the next one, belong to
+    # this visitor.
+    messages = getattr(request, '_messages', None)
+    if messages is not None and len(messages):
+        return False
+    return True
+
 class RegisterUserForm(RegistrationForm):
     def clean(self):
         email = self.cleaned_data.get('email')
@@ -379,11 +446,11 @@ def time_commitments_are_approved(wizard, application_round):
             if d ]
 
     required_free_days = 7*7
-    calendar = create_time_commitment_calendar(chain(tcs, ctcs, etcs, stcs), application_round)
+    longest_period_free, free_period_start_date, free_period_end_date = find_longest_free_period(
+            chain(tcs, ctcs, etcs, stcs), application_round.internstarts, application_round.internends)
 
-    for key, group in groupby(calendar, lambda hours: hours <= 20):
-        if key is True and len(list(group)) >= required_free_days:
-            return True
+    if longest_period_free is not None and longest_period_free >= required_free_days:
+        return True
     return False
 
 def determine_eligibility(wizard, application_round):
@@ -410,16 +477,10 @@ def determine_eligibility(wizard, application_round):
 # People can only submit new initial applications or edit initial applications
 # when the application period is open.
 def get_current_round_for_initial_application():
-    now = datetime.now(timezone.utc)
-    today = get_deadline_date_for(now)
-
-    try:
-        return RoundPage.objects.get(
-            appsopen__lte=today,
-            appslate__gt=today,
-        )
-    except RoundPage.DoesNotExist:
+    current_round = RoundTimeline.load().application_round()
+    if current_round is None:
         raise PermissionDenied('The Outreachy application period is closed. If you are an applicant who has submitted an application for an internship project and your time commitments have increased, please contact the Outreachy organizers (see contact link above). Eligibility checking will become available when the next application period opens. Please sign up for the announcements mailing list for an email when the next application period opens: https://lists.outreachy.org/cgi-bin/mailman/listinfo/announce')
+    return current_round
 
 class EligibilityUpdateView(LoginRequiredMixin, ComradeRequiredMixin, reversion.views.RevisionMixin, SessionWizardView):
     template_name = 'home/wizard_form.html'
@@ -715,6 +776,10 @@ class EligibilityUpdateView(LoginRequiredMixin, ComradeRequiredMixin, reversion.
                 r.applicant = self.object
                 r.save()
 
+        # Saving time commitments updates the free period, but an applicant
+        # with no time commitments at all needs it computed too.
+        ApplicantApproval.update_free_periods([self.object])
+
         return redirect(self.request.GET.get('next', reverse('eligibility-results')))
 
 class EligibilityResults(LoginRequiredMixin, ComradeRequiredMixin, DetailView):
@@ -755,6 +820,7 @@ class ViewInitialApplication(LoginRequiredMixin, ComradeRequiredMixin, DetailVie
                     applicant__account__username=self.kwargs['applicant_username'],
                     application_round=current_round)
 
+@cache_page_for_anonymous
 def past_rounds_page(request):
     return render(request, 'home/past_rounds.html',
             {
@@ -762,48 +828,68 @@ def past_rounds_page(request):
             },
             )
 
+def load_project_catalog(current_round, role):
+    """
+    Find the approved projects in approved communities for this round which
+    the person described by role is allowed to see, along with everything
+    the project listings show about them. Returns three lists: closed
+    projects as (community, projects) pairs, and on-time and late projects
+    as (community, interns funded, projects) triples, each sorted by
+    community name.
+
+    This takes the same number of queries no matter how many communities
+    and projects there are.
+    """
+    closed_approved_projects = []
+    ontime_approved_projects = []
+    late_approved_projects = []
+
+    approved_participations = [
+        p for p in current_round.participation_set.approved().with_funding().select_related(
+            'community',
+        ).order_by('community__name')
+        if role.can_see_all_project_details(p)
+    ]
+
+    # Fetch every listed project in one go rather than one query per
+    # community, and point each project back at the participation we
+    # already loaded so templates don't look it up again.
+    approved_projects = {}
+    for project in Project.objects.approved().for_catalog().filter(
+            project_round__in=approved_participations):
+        approved_projects.setdefault(project.project_round_id, []).append(project)
+
+    for p in approved_participations:
+        projects_for_community = approved_projects.get(p.pk, [])
+        for project in projects_for_community:
+            project.project_round = p
+        projects = [project for project in projects_for_community if project.deadline == Project.CLOSED]
+        if projects:
+            closed_approved_projects.append((p.community, projects))
+        projects = [project for project in projects_for_community if project.deadline == Project.ONTIME]
+        if projects:
+            ontime_approved_projects.append((p.community, p.interns_funded(), projects))
+        projects = [project for project in projects_for_community if project.deadline == Project.LATE]
+        if projects:
+            late_approved_projects.append((p.community, p.interns_funded(), projects))
+
+    return closed_approved_projects, ontime_approved_projects, late_approved_projects
+
+@cache_page_for_anonymous
 def current_round_page(request):
     closed_approved_projects = []
     ontime_approved_projects = []
     late_approved_projects = []
     example_skill = ProjectSkill
 
-    now = datetime.now(timezone.utc)
-    today = get_deadline_date_for(now)
-
-    try:
-        previous_round = RoundPage.objects.filter(
-            appslate__lte=today,
-        ).latest('internstarts')
-    except RoundPage.DoesNotExist:
-        previous_round = None
-
-    try:
-        # Keep RoundPage.serve() in sync with this.
-        current_round = RoundPage.objects.get(
-            pingnew__lte=today,
-            # If the application period is closed, don't show projects from the current round
-            appslate__gt=today,
-        )
-    except RoundPage.DoesNotExist:
-        current_round = None
+    timeline = RoundTimeline.load()
+    previous_round = timeline.previous_project_selection_round()
+    # If the application period is closed, don't show projects from the current round
+    current_round = timeline.project_selection_round()
 
-    role = Role(request.user, current_round, today=today)
+    role = Role(request.user, current_round, today=timeline.today)
     if current_round is not None:
-        approved_participations = current_round.participation_set.approved().order_by('community__name')
-
-        for p in approved_participations:
-            if not p.approved_to_see_all_project_details(request.user):
-                continue
-            projects = p.project_set.approved().filter(deadline=Project.CLOSED)
-            if projects:
-                closed_approved_projects.append((p.community, projects))
-            projects = p.project_set.approved().filter(deadline=Project.ONTIME)
-            if projects:
-                ontime_approved_projects.append((p.community, p.interns_funded(), projects))
-            projects = p.project_set.approved().filter(deadline=Project.LATE)
-            if projects:
-                late_approved_projects.append((p.community, p.interns_funded(), projects))
+        closed_approved_projects, ontime_approved_projects, late_approved_projects = load_project_catalog(current_round, role)
 
     return render(request, 'home/round_page_with_communities.html',
             {
@@ -845,6 +931,7 @@ def current_round_page(request):
 #    * If so, put it in a participating communities set
 #    * If not, put it in a not participating communities set
 
+@cache_page_for_anonymous
 def community_cfp_view(request):
     # Cheap trick for case-insensitive sorting: the slug is always lower-cased.
     all_communities = Community.objects.all().order_by('slug')
@@ -864,29 +951,14 @@ def community_cfp_view(request):
     # Mentors can still be sent a manual link to sign up to co-mentor after that date,
     # but their community page just won't show their project.
 
-    now = datetime.now(timezone.utc)
-    today = get_deadline_date_for(now)
-
-    try:
-        previous_round = RoundPage.objects.filter(
-            internstarts__lte=today,
-        ).latest('internstarts')
-    except RoundPage.DoesNotExist:
-        previous_round = None
-
-    try:
-        current_round = RoundPage.objects.get(
-            pingnew__lte=today,
-            internstarts__gt=today,
-        )
-    except RoundPage.DoesNotExist:
-        current_round = None
+    timeline = RoundTimeline.load()
+    previous_round = timeline.previous_community_signup_round()
+    current_round = timeline.community_signup_round()
+    if current_round is None:
         not_participating_communities = all_communities.filter(
             participation__approval_status=ApprovalStatus.APPROVED,
         ).distinct()
     else:
-        # No exception caught, so we have a current_round
-
         # Now grab the community IDs of all communities participating in the current round
         # https://docs.djangoproject.com/en/1.11/topics/db/queries/#following-relationships-backward
         # https://docs.djangoproject.com/en/1.11/ref/models/querysets/#values-list
@@ -927,20 +999,14 @@ def community_cfp_view(request):
 def community_read_only_view(request, community_slug):
     community = get_object_or_404(Community, slug=community_slug)
 
-    now = datetime.now(timezone.utc)
-    today = get_deadline_date_for(now)
+    timeline = RoundTimeline.load()
+    today = timeline.today
 
     participation_info = None
 
-    try:
-        current_round = RoundPage.objects.get(
-            pingnew__lte=today,
-            # If the application period is closed, don't show projects from the current round
-            appslate__gt=today,
-        )
-        previous_round = None
-    except RoundPage.DoesNotExist:
-        current_round = None
+    # If the application period is closed, don't show projects from the current round
+    current_round = timeline.project_selection_round()
+    if current_round is None:
         try:
             previous_round = community.rounds.filter(
                 appslate__lte=today,
@@ -949,6 +1015,7 @@ def community_read_only_view(request, community_slug):
         except RoundPage.DoesNotExist:
             previous_round = None
     else:
+        previous_round = None
         # Try to see if this community is participating in the current round
         # and get the Participation object if so.
         try:
@@ -1006,6 +1073,7 @@ class CommunityNotificationUpdate(LoginRequiredMixin, ComradeRequiredMixin, Upda
     def get_success_url(self):
         return self.object.community.get_preview_url()
 
+@cache_page_for_anonymous
 def community_landing_view(request, round_slug, community_slug):
     # Try to see if this community is participating in that round
     # and if so, get the Participation object and related objects.
@@ -1014,7 +1082,7 @@ def community_landing_view(request, round_slug, community_slug):
             community__slug=community_slug,
             participating_round__slug=round_slug,
             )
-    projects = participation_info.project_set.approved()
+    projects = participation_info.project_set.approved().for_catalog()
     ontime_projects = [p for p in projects if p.deadline == Project.ONTIME]
     late_projects = [p for p in projects if p.deadline == Project.LATE]
     closed_projects = [p for p in projects if p.deadline == Project.CLOSED]
@@ -1027,7 +1095,7 @@ def community_landing_view(request, round_slug, community_slug):
     if request.user.is_authenticated:
         approved_coordinator_list = participation_info.community.coordinatorapproval_set.approved()
 
-    approved_to_see_all_project_details = participation_info.approved_to_see_all_project_details(request.user)
+    approved_to_see_all_project_details = role.can_see_all_project_details(participation_info)
 
     mentors_pending_projects = Project.objects.none()
     approved_coordinator = False
@@ -1079,14 +1147,9 @@ class CommunityCreate(LoginRequiredMixin, ComradeRequiredMixin, CreateView):
             ]
 
     def get_form(self):
-        now = datetime.now(timezone.utc)
-        today = get_deadline_date_for(now)
-
-        try:
-            self.current_round = RoundPage.objects.filter(
-                lateorgs__gt=today,
-            ).earliest('lateorgs')
-        except RoundPage.DoesNotExist:
+        timeline = RoundTimeline.load()
+        self.current_round = timeline.earliest('lateorgs', lambda r: r.lateorgs > timeline.today)
+        if self.current_round is None:
             raise PermissionDenied("There is no round you can participate in right now.")
         return super(CommunityCreate, self).get_form()
 
@@ -1425,29 +1488,108 @@ class CoordinatorApprovalPreview(Preview):
 class SendEmailView(LoginRequiredMixin, ComradeRequiredMixin, BaseEmailBackend, TemplateView):
     template_name = 'home/send_email_preview.html'
 
-    def generate_messages(self, current_round, connection):
+    # How many objects from get_queryset to preview messages for at once.
+    preview_page_size = 20
+
+    # How many objects to generate messages for at once while streaming the
+    # full recipient list.
+    recipient_chunk_size = 100
+
+    def get_queryset(self, current_round):
+        """
+        Subclasses that send messages about each of a collection of objects,
+        such as projects or interns, should return those objects here and
+        implement generate_messages_for. That lets the preview show one page
+        of messages at a time instead of generating the whole mailing.
         """
-        Subclasses must implement this function to generate the desired emails,
-        and must pass the connection argument on to the final send_mail or
+        return None
+
+    def generate_messages_for(self, objects, current_round, connection):
+        """
+        Generate the messages for some of the objects from get_queryset,
+        passing the connection argument on to the final send_mail or
         send_messages calls.
         """
-        pass
+        raise NotImplementedError
+
+    def generate_messages(self, current_round, connection):
+        """
+        Subclasses must implement either this function or get_queryset and
+        generate_messages_for to generate the desired emails, and must pass
+        the connection argument on to the final send_mail or send_messages
+        calls.
+        """
+        objects = self.get_queryset(current_round)
+        if objects is not None:
+            self.generate_messages_for(objects, current_round, connection)
 
     def get_round(self):
         return get_object_or_404(RoundPage, slug=self.kwargs['round_slug'])
 
+    def get(self, request, *args, **kwargs):
+        if 'recipients' in request.GET:
+            return self.stream_recipients()
+        return super(SendEmailView, self).get(request, *args, **kwargs)
+
     def get_context_data(self, **kwargs):
         """
         Use this view's BaseEmailBackend implementation to do a dry-run of
         sending the generated messages, and return a preview of the messages
-        that would be sent.
+        that would be sent. When the view has a queryset, only one page of
+        it is previewed.
         """
-        self.messages = []
-        self.generate_messages(current_round=self.get_round(), connection=self)
+        current_round = self.get_round()
+        objects = self.get_queryset(current_round)
         context = super(SendEmailView, self).get_context_data(**kwargs)
+
+        self.messages = []
+        if objects is None:
+            self.generate_messages(current_round=current_round, connection=self)
+        else:
+            if isinstance(objects, models.QuerySet) and not objects.ordered:
+                objects = objects.order_by('pk')
+            paginator = Paginator(objects, self.preview_page_size)
+            try:
+                page = paginator.page(self.request.GET.get('page', 1))
+            except (PageNotAnInteger, EmptyPage):
+                page = paginator.page(1)
+            self.generate_messages_for(page.object_list, current_round, connection=self)
+            context['paginator'] = paginator
+            context['page_obj'] = page
+
         context['messages'] = self.messages
+        # Submitting the same preview twice should only send the messages
+        # once, if the email backend supports it.
+        context['idempotency_key'] = uuid.uuid4().hex
         return context
 
+    def stream_recipients(self):
+        """
+        Send the address of every recipient of the whole mailing, one per
+        line, generating messages for a chunk of objects at a time so memory
+        use doesn't grow with the size of the mailing.
+        """
+        current_round = self.get_round()
+        objects = self.get_queryset(current_round)
+
+        def recipients():
+            if objects is None:
+                chunks = [None]
+            else:
+                iterator = objects.iterator() if isinstance(objects, models.QuerySet) else iter(objects)
+                chunks = iter(lambda: list(islice(iterator, self.recipient_chunk_size)), [])
+            for chunk in chunks:
+                self.messages = []
+                if chunk is None:
+                    self.generate_messages(current_round=current_round, connection=self)
+                else:
+                    self.generate_messages_for(chunk, current_round, connection=self)
+                for message in self.messages:
+                    for recipient in message.recipients():
+                        yield '{}\n'.format(recipient)
+
+        return StreamingHttpResponse(recipients(), content_type='text/plain; charset=utf-8')
+
     def send_messages(self, messages):
         """
         Implementation of BaseEmailBackend that just saves the generated
@@ -1460,17 +1602,20 @@ class SendEmailView(LoginRequiredMixin, ComradeRequiredMixin, BaseEmailBackend,
         """
         Use the real email backend to send the generated messages.
         """
-        with mail.get_connection() as connection:
+        idempotency_key = request.POST.get('idempotency_key')
+        with mail.get_connection(idempotency_key=idempotency_key) as connection:
             self.generate_messages(current_round=self.get_round(), connection=connection)
         return redirect(reverse('dashboard'))
 
 class MentorCheckDeadlinesReminder(SendEmailView):
-    def generate_messages(self, current_round, connection):
+    def get_queryset(self, current_round):
         if not self.request.user.is_staff:
             raise PermissionDenied("You are not authorized to send reminder emails.")
-        projects = Project.objects.filter(
+        return Project.objects.filter(
                 approval_status__in=[Project.APPROVED, Project.PENDING],
                 project_round__participating_round=current_round)
+
+    def generate_messages_for(self, projects, current_round, connection):
         for p in projects:
             email.project_applicant_review(p, self.request, connection=connection)
 
@@ -1482,7 +1627,7 @@ def get_open_approved_projects(current_round):
         return Project.objects.filter(
                 deadline=Project.LATE,
                 project_round__participating_round=current_round).all().approved()
-    return ()
+    return Project.objects.none()
 
 def get_closed_approved_projects(current_round):
     if current_round.has_ontime_application_deadline_passed():
@@ -1493,31 +1638,37 @@ def get_closed_approved_projects(current_round):
         return Project.objects.filter(
                 deadline=Project.LATE,
                 project_round__participating_round=current_round).all().approved()
-    return ()
+    return Project.objects.none()
 
 class MentorApplicationDeadlinesReminder(SendEmailView):
-    def generate_messages(self, current_round, connection):
+    def get_queryset(self, current_round):
         if not self.request.user.is_staff:
             raise PermissionDenied("You are not authorized to send reminder emails.")
-        projects = get_open_approved_projects(current_round)
+        return get_open_approved_projects(current_round)
+
+    def generate_messages_for(self, projects, current_round, connection):
         for p in projects:
             email.mentor_application_deadline_reminder(p, self.request, connection=connection)
 
 class MentorInternSelectionReminder(SendEmailView):
-    def generate_messages(self, current_round, connection):
+    def get_queryset(self, current_round):
         if not self.request.user.is_staff:
             raise PermissionDenied("You are not authorized to send reminder emails.")
-        projects = get_closed_approved_projects(current_round)
+        return get_closed_approved_projects(current_round)
+
+    def generate_messages_for(self, projects, current_round, connection):
         for p in projects:
             email.mentor_intern_selection_reminder(p, self.request, connection=connection)
 
 class CoordinatorInternSelectionReminder(SendEmailView):
-    def generate_messages(self, current_round, connection):
+    def get_queryset(self, current_round):
         if not self.request.user.is_staff:
             raise PermissionDenied("You are not authorized to send reminder emails.")
-        participations = Participation.objects.filter(
+        return Participation.objects.filter(
                 participating_round=current_round,
                 approval_status=Participation.APPROVED)
+
+    def generate_messages_for(self, participations, current_round, connection):
         for p in participations:
             email.coordinator_intern_selection_reminder(p, self.request, connection=connection)
 
@@ -1553,36 +1704,42 @@ def get_contributors_with_upcoming_deadlines(current_round):
                 applicantapproval__application_round=current_round,
                 applicantapproval__approval_status=ApprovalStatus.APPROVED,
                 applicantapproval__contribution__project__deadline=Project.LATE).distinct()
-    return []
+    return Comrade.objects.none()
 
 class ContributorsApplicationPeriodEndedReminder(SendEmailView):
-    def generate_messages(self, current_round, connection):
+    def get_queryset(self, current_round):
         if not self.request.user.is_staff:
             raise PermissionDenied("You are not authorized to send reminder emails.")
         contributors = Comrade.objects.filter(
                 applicantapproval__application_round=current_round,
                 applicantapproval__approval_status=ApprovalStatus.APPROVED,
                 applicantapproval__contribution__isnull=False).distinct()
+        return current_round.applicantapproval_set.filter(
+                applicant__in=contributors,
+        ).select_related('applicant__account', 'application_round')
 
-        for c in contributors:
-            email.contributor_application_period_ended(
-                    c,
-                    current_round,
-                    self.request,
-                    connection=connection)
+    def generate_messages_for(self, applications, current_round, connection):
+        email.contributor_application_period_ended(
+                applications,
+                current_round,
+                self.request,
+                connection=connection)
 
 class ContributorsDeadlinesReminder(SendEmailView):
-    def generate_messages(self, current_round, connection):
+    def get_queryset(self, current_round):
         if not self.request.user.is_staff:
             raise PermissionDenied("You are not authorized to send reminder emails.")
         contributors = get_contributors_with_upcoming_deadlines(current_round)
+        return current_round.applicantapproval_set.filter(
+                applicant__in=contributors,
+        ).select_related('applicant__account', 'application_round')
 
-        for c in contributors:
-            email.contributor_deadline_reminder(
-                    c,
-                    current_round,
-                    self.request,
-                    connection=connection)
+    def generate_messages_for(self, applications, current_round, connection):
+        email.contributor_deadline_reminder(
+                applications,
+                current_round,
+                self.request,
+                connection=connection)
 
 class ProjectContributions(LoginRequiredMixin, ComradeRequiredMixin, EligibleApplicantRequiredMixin, TemplateView):
     template_name = 'home/project_contributions.html'
@@ -1837,10 +1994,22 @@ def community_applicants(request, round_slug, community_slug):
     if not user_is_staff and not user_is_coordinator and not participation.is_mentor(request.user):
         raise PermissionDenied("You are not an approved mentor for this community.")
 
+    # Summarize everyone's time commitments together rather than querying
+    # for each row of the tables.
+    projects = list(participation.project_set.all())
+    applications = []
+    for project in projects:
+        project.selected_interns = list(project.get_interns().select_related('applicant__applicant__account'))
+        project.applicants_and_contributions = list(project.get_applicants_and_contributions_list())
+        applications.extend(intern.applicant for intern in project.selected_interns)
+        applications.extend(project.applicants_and_contributions)
+    ApplicantApproval.summarize_time_commitments(applications)
+
     return render(request, 'home/community_applicants.html', {
         'current_round': current_round,
         'community': participation.community,
         'participation': participation,
+        'projects': projects,
         'is_coordinator': user_is_coordinator,
         'is_staff': user_is_staff,
         })
@@ -1859,22 +2028,16 @@ def contribution_tips(request):
         })
 
 def eligibility_information(request):
-    now = datetime.now(timezone.utc)
-    today = get_deadline_date_for(now)
-
-    try:
-        # The most relevant dates come from the soonest round where internships
-        # haven't started yet...
-        current_round = RoundPage.objects.filter(
-            internstarts__gt=today,
-        ).earliest('internstarts')
-    except RoundPage.DoesNotExist:
-        try:
-            # ...but if there aren't any, use the round that started most
-            # recently, so people get some idea of what the timeline looks like
-            # even when the next round isn't announced yet.
-            current_round = RoundPage.objects.latest('internstarts')
-        except RoundPage.DoesNotExist:
+    timeline = RoundTimeline.load()
+    # The most relevant dates come from the soonest round where internships
+    # haven't started yet...
+    current_round = timeline.upcoming_round()
+    if current_round is None:
+        # ...but if there aren't any, use the round that started most
+        # recently, so people get some idea of what the timeline looks like
+        # even when the next round isn't announced yet.
+        current_round = timeline.latest('internstarts')
+        if current_round is None:
             raise Http404("No internship rounds configured yet!")
 
     return render(request, 'home/eligibility.html', {
@@ -1986,11 +2149,7 @@ def contract_export_view(request, round_slug):
                 'contract text': contract.text,
                 }
 
-    this_round = get_object_or_404(RoundPage,
-            slug=round_slug)
-    interns = this_round.get_approved_intern_selections().exclude(intern_contract=None)
-    dictionary_list = []
-    for sel in interns:
+    def export_intern(sel):
         intern_export = export_comrade_with_contract(sel.applicant.applicant,
                 sel.intern_contract)
         intern_export['community'] = sel.community_name()
@@ -1998,10 +2157,65 @@ def contract_export_view(request, round_slug):
                 export_comrade_with_contract(mr.mentor.mentor, mr.contract)
                 for mr in sel.mentorrelationship_set.all()
                 ]
-        dictionary_list.append(intern_export)
-    response = JsonResponse(dictionary_list, safe=False)
-    response['Content-Disposition'] = 'attachment; filename="' + round_slug + '-contracts.json"'
-    return response
+        return intern_export
+
+    this_round = get_object_or_404(RoundPage,
+            slug=round_slug)
+    interns = this_round.get_approved_intern_selections().exclude(
+            intern_contract=None,
+    ).select_related(
+            'applicant__applicant__account',
+            'intern_contract',
+            'project__project_round__community',
+    )
+    mentors = models.Prefetch('mentorrelationship_set',
+            queryset=MentorRelationship.objects.select_related('mentor__mentor__account', 'contract'))
+    rows = (export_intern(sel) for sel in iterate_in_chunks(interns, prefetch=[mentors]))
+    return export_response(request, rows, round_slug + '-contracts')
+
+@login_required
+@staff_member_required
+def applicant_export_view(request, round_slug):
+    this_round = get_object_or_404(RoundPage, slug=round_slug)
+    applications = ApplicantApproval.objects.filter(
+            application_round=this_round,
+    ).select_related(
+            'applicant__account',
+            'review_owner__comrade',
+    ).order_by('submission_date', 'pk')
+    rows = ({
+            'public name': a.applicant.public_name,
+            'legal name': a.applicant.legal_name,
+            'email address': a.applicant.account.email,
+            'approval status': a.get_approval_status_display(),
+            'reason for status': a.reason_denied,
+            'submitted on': str(a.submission_date),
+            'longest period free': a.longest_period_free,
+            'review owner': a.review_owner.comrade.public_name if a.review_owner else None,
+            } for a in applications.iterator())
+    return export_response(request, rows, round_slug + '-applicants')
+
+@login_required
+@staff_member_required
+def contribution_export_view(request, round_slug):
+    this_round = get_object_or_404(RoundPage, slug=round_slug)
+    contributions = Contribution.objects.filter(
+            project__project_round__participating_round=this_round,
+    ).select_related(
+            'applicant__applicant__account',
+            'project__project_round__community',
+    ).order_by('project__project_round__community__name', 'project__short_title', 'date_started', 'pk')
+    rows = ({
+            'applicant public name': c.applicant.applicant.public_name,
+            'applicant email address': c.applicant.applicant.account.email,
+            'community': c.project.project_round.community.name,
+            'project': c.project.short_title,
+            'started on': str(c.date_started),
+            'merged on': str(c.date_merged) if c.date_merged else None,
+            'url': c.url,
+            'description': c.description,
+            } for c in contributions.iterator())
+    return export_response(request, rows, round_slug + '-contributions')
 
 class SignedContractForm(ModelForm):
     class Meta:
@@ -2445,7 +2659,7 @@ class InternAgreementSign(LoginRequiredMixin, ComradeRequiredMixin, CreateView):
         return reverse('dashboard')
 
 def round_statistics(request, round_slug):
-    current_round = RoundPage.objects.get(slug=round_slug)
+    current_round = RoundPage.objects.select_related('statistics').get(slug=round_slug)
     todays_date = datetime.now()
     return render(request, 'home/blog/round-statistics.html', {
         'current_round': current_round,
@@ -2453,34 +2667,36 @@ def round_statistics(request, round_slug):
         })
 
 class InternNotification(SendEmailView):
-    def generate_messages(self, current_round, connection):
+    def get_queryset(self, current_round):
         if not self.request.user.is_staff:
             raise PermissionDenied("You are not authorized to send reminder emails.")
-        interns = current_round.get_approved_intern_selections()
+        return current_round.get_approved_intern_selections()
 
+    def generate_messages_for(self, interns, current_round, connection):
         for i in interns:
             email.notify_accepted_intern(i, self.request, connection=connection)
 
 class InternWeek(SendEmailView):
-    def generate_messages(self, current_round, connection):
+    def get_queryset(self, current_round):
         if not self.request.user.is_staff:
             raise PermissionDenied("You are not authorized to send reminder emails.")
+        return current_round.get_in_good_standing_intern_selections()
 
+    def generate_messages_for(self, interns, current_round, connection):
         template = 'home/email/internship-week-{}.txt'.format(self.kwargs['week'])
-        interns = current_round.get_in_good_standing_intern_selections()
-
         for i in interns:
             email.biweekly_internship_email(i, self.request, template, connection=connection)
 
 class InitialFeedbackInstructions(SendEmailView):
-    def generate_messages(self, current_round, connection):
+    def get_queryset(self, current_round):
         if not self.request.user.is_staff:
             raise PermissionDenied("You are not authorized to send reminder emails.")
 
         # Only get interns that are in good standing and
         # where a mentor or intern hasn't submitted feedback.
-        interns = current_round.get_interns_with_open_initial_feedback()
+        return current_round.get_interns_with_open_initial_feedback()
 
+    def generate_messages_for(self, interns, current_round, connection):
         for i in interns:
             email.feedback_email(i, self.request, "initial", i.is_initial_feedback_on_intern_past_due(), connection=connection)
 
@@ -2542,6 +2758,8 @@ class InitialMentorFeedbackUpdate(LoginRequiredMixin, reversion.views.RevisionMi
         feedback = form.save(commit=False)
         feedback.allow_edits = False
         feedback.ip_address = self.request.META.get('REMOTE_ADDR')
+        feedback.submitted_by = self.request.user
+        feedback.submitted_at = datetime.now(timezone.utc)
         feedback.save()
         return redirect(reverse('dashboard') + '#feedback')
 
@@ -2584,6 +2802,8 @@ class InitialInternFeedbackUpdate(LoginRequiredMixin, reversion.views.RevisionMi
         feedback = form.save(commit=False)
         feedback.allow_edits = False
         feedback.ip_address = self.request.META.get('REMOTE_ADDR')
+        feedback.submitted_by = self.request.user
+        feedback.submitted_at = datetime.now(timezone.utc)
         feedback.save()
         return redirect(reverse('dashboard') + '#feedback')
 
@@ -2596,7 +2816,7 @@ def export_feedback(feedback):
             'mentor public name': feedback.get_mentor_public_name(),
             'mentor legal name': feedback.get_mentor_legal_name(),
             'mentor email address': feedback.get_mentor_email(),
-            'feedback submitted on': str(feedback.get_date_submitted()),
+            'feedback submitted on': str(feedback.submitted_at),
             'feedback submitted from': feedback.ip_address,
             'payment approved': feedback.payment_approved,
             'progress report': feedback.progress_report,
@@ -2606,20 +2826,25 @@ def export_feedback(feedback):
             'termination reason': feedback.termination_reason,
             }
 
+def mentor_feedback_export(request, round_slug, feedback_model, suffix):
+    this_round = get_object_or_404(RoundPage, slug=round_slug)
+    feedback = feedback_model.objects.filter(
+            intern_selection__in=this_round.get_approved_intern_selections(),
+    ).select_related(
+            'intern_selection__applicant__applicant__account',
+            'intern_selection__project__project_round__community',
+            'submitted_by__comrade',
+    ).order_by(
+            'intern_selection__project__project_round__community__name',
+            'intern_selection__project__short_title',
+    )
+    rows = (export_feedback(f) for f in iterate_in_chunks(feedback))
+    return export_response(request, rows, round_slug + suffix)
+
 @login_required
 @staff_member_required
 def initial_mentor_feedback_export_view(request, round_slug):
-    this_round = get_object_or_404(RoundPage, slug=round_slug)
-    interns = this_round.get_approved_intern_selections()
-    dictionary_list = []
-    for i in interns:
-        try:
-            dictionary_list.append(export_feedback(i.initialmentorfeedback))
-        except InitialMentorFeedback.DoesNotExist:
-            continue
-    response = JsonResponse(dictionary_list, safe=False)
-    response['Content-Disposition'] = 'attachment; filename="' + round_slug + '-initial-feedback.json"'
-    return response
+    return mentor_feedback_export(request, round_slug, InitialMentorFeedback, '-initial-feedback')
 
 @login_required
 @staff_member_required
@@ -2633,14 +2858,15 @@ def initial_feedback_summary(request, round_slug):
             )
 
 class MidpointFeedbackInstructions(SendEmailView):
-    def generate_messages(self, current_round, connection):
+    def get_queryset(self, current_round):
         if not self.request.user.is_staff:
             raise PermissionDenied("You are not authorized to send reminder emails.")
 
         # Only get interns that are in good standing and
         # where a mentor or intern hasn't submitted feedback.
-        interns = current_round.get_interns_with_open_midpoint_feedback()
+        return current_round.get_interns_with_open_midpoint_feedback()
 
+    def generate_messages_for(self, interns, current_round, connection):
         for i in interns:
             email.feedback_email(i, self.request, "midpoint", i.is_midpoint_feedback_on_intern_past_due(), connection=connection)
 
@@ -2696,6 +2922,8 @@ class MidpointMentorFeedbackUpdate(LoginRequiredMixin, reversion.views.RevisionM
         feedback = form.save(commit=False)
         feedback.allow_edits = False
         feedback.ip_address = self.request.META.get('REMOTE_ADDR')
+        feedback.submitted_by = self.request.user
+        feedback.submitted_at = datetime.now(timezone.utc)
         feedback.save()
         return redirect(reverse('dashboard') + '#feedback')
 
@@ -2731,23 +2959,15 @@ class MidpointInternFeedbackUpdate(LoginRequiredMixin, reversion.views.RevisionM
         feedback = form.save(commit=False)
         feedback.allow_edits = False
         feedback.ip_address = self.request.META.get('REMOTE_ADDR')
+        feedback.submitted_by = self.request.user
+        feedback.submitted_at = datetime.now(timezone.utc)
         feedback.save()
         return redirect(reverse('dashboard') + '#feedback')
 
 @login_required
 @staff_member_required
 def midpoint_mentor_feedback_export_view(request, round_slug):
-    this_round = get_object_or_404(RoundPage, slug=round_slug)
-    interns = this_round.get_approved_intern_selections()
-    dictionary_list = []
-    for i in interns:
-        try:
-            dictionary_list.append(export_feedback(i.midpointmentorfeedback))
-        except MidpointMentorFeedback.DoesNotExist:
-            continue
-    response = JsonResponse(dictionary_list, safe=False)
-    response['Content-Disposition'] = 'attachment; filename="' + round_slug + '-midpoint-feedback.json"'
-    return response
+    return mentor_feedback_export(request, round_slug, MidpointMentorFeedback, '-midpoint-feedback')
 
 @login_required
 @staff_member_required
@@ -2760,6 +2980,7 @@ def midpoint_feedback_summary(request, round_slug):
             },
             )
 
+@cache_page_for_anonymous
 def alums_page(request):
     # Get all the older AlumInfo models (before we had round pages)
     pages = CohortPage.objects.all()
@@ -2774,6 +2995,25 @@ def alums_page(request):
         'rounds': rounds,
         })
 
+def get_planet_posts():
+    # The posts only change when fetchplanet runs, which starts a new
+    # generation.
+    key = 'planet-posts:{}'.format(get_cache_generation(PLANET_GENERATION_KEY))
+    posts = cache.get(key)
+    if posts is None:
+        posts = list(InternBlogPost.for_planet())
+        cache.set(key, posts)
+    return posts
+
+def planet(request):
+    return render(request, 'home/planet.html', {
+        'posts': get_planet_posts(),
+        })
+
+def planet_feed(request):
+    return cached_feed_response(request, 'planet-feed', get_cache_generation(PLANET_GENERATION_KEY),
+            lambda: PlanetFeed()(request, get_planet_posts()))
+
 def privacy_policy(request):
     with open(path.join(settings.BASE_DIR, 'docs', 'privacy-policy.md')) as policy_file:
         policy = policy_file.read()
@@ -2885,11 +3125,158 @@ class Survey2018Notification(LoginRequiredMixin, ComradeRequiredMixin, TemplateV
             AlumSurveyTracker.objects.create(intern_info=i)
         return redirect(reverse('dashboard'))
 
+class ReviewGridRow(object):
+    """
+    Everything one row of the applicant review tables shows, computed up
+    front from the data that ApplicantApproval.objects.for_review_grid()
+    fetched.
+    """
+
+    def __init__(self, application):
+        self.application = application
+        self.reason_for_status = ''
+        if application.reason_denied:
+            # The template used to call this directly, which quietly
+            # showed nothing if part of the application was missing.
+            try:
+                self.reason_for_status = application.get_reason_for_status()
+            except ObjectDoesNotExist:
+                pass
+        self.essay_ratings = application.get_essay_ratings()
+        self.red_flags = application.get_all_red_flags()
+
+    @property
+    def needs_revision(self):
+        for field in ('barrierstoparticipation', 'schoolinformation'):
+            try:
+                if getattr(self.application, field).applicant_should_update:
+                    return True
+            except ObjectDoesNotExist:
+                pass
+        return False
+
+def load_review_grid(applications):
+    """
+    Build a ReviewGridRow for each of the given applications. This takes the
+    same number of queries however many applications there are.
+    """
+    return [ReviewGridRow(application) for application in applications.for_review_grid()]
+
+APPLICANT_REVIEW_PAGE_SIZE = 100
+
+def keyset_page(queryset, keys, descending, after, page_size):
+    """
+    Return one page of the queryset, ordered by the given keys, which must
+    end with a unique field like 'pk'. Instead of an offset, the page starts
+    after the row whose key values are in ``after`` (a cursor from a
+    previous call, or None for the first page), so the database can jump
+    straight there using its indexes however deep into the list it is.
+
+    Returns the objects on the page and the cursor for the next page, which
+    is None if this is the last page.
+    """
+    if after is not None:
+        lookup = 'lt' if descending else 'gt'
+        # (a, b, c) > (x, y, z) is a > x or (a = x and (b, c) > (y, z))
+        condition = models.Q(**{'{}__{}'.format(keys[-1], lookup): after[-1]})
+        for key, value in zip(reversed(keys[:-1]), reversed(after[:-1])):
+            condition = models.Q(**{'{}__{}'.format(key, lookup): value}) | (models.Q(**{key: value}) & condition)
+        queryset = queryset.filter(condition)
+
+    queryset = queryset.order_by(*[('-' if descending else '') + key for key in keys])
+    objects = list(queryset[:page_size + 1])
+    if len(objects) <= page_size:
+        return objects, None
+
+    objects = objects[:page_size]
+    last = objects[-1]
+    cursor = []
+    for key in keys:
+        value = getattr(last, key)
+        if isinstance(value, date):
+            value = value.isoformat()
+        cursor.append(value)
+    return objects, cursor
+
+class ApplicationReviewFilterForm(forms.Form):
+    """
+    The ways reviewers can narrow down and sort the applicant review
+    summary. Every filter is applied in the database.
+    """
+    ORDER_CHOICES = (
+        ('submission_date', 'Application date'),
+        ('days_free', 'Fewest days free first'),
+        ('-days_free', 'Most days free first'),
+    )
+    OWNER_CHOICES = (
+        ('', 'Anyone or no one'),
+        ('me', 'Me'),
+        ('none', 'No one'),
+    )
+    RED_FLAG_CHOICES = (
+        ('', 'Any or none'),
+        ('review_school', 'Review school terms'),
+        ('missing_school', 'Missing school terms'),
+        ('review_work', 'Review work commitments'),
+        ('missing_work', 'Missing work hours'),
+        ('incorrect_dates', 'Incorrect time commitment dates'),
+    )
+    REASON_CHOICES = (
+        ('', 'Any'),
+        ('GENERAL', 'General eligibility'),
+        ('SANCTIONED', 'Under U.S. sanctions'),
+        ('SELFIDENTIFY', 'Self-identified their gender'),
+        ('TIME', 'Not enough days free'),
+        ('ALIGN', 'Essay not aligned with program goals'),
+    )
+
+    order = forms.ChoiceField(choices=ORDER_CHOICES, required=False, label='Sorted by')
+    min_days_free = forms.IntegerField(min_value=0, required=False, label='Days free from')
+    max_days_free = forms.IntegerField(min_value=0, required=False, label='to')
+    owner = forms.ChoiceField(choices=OWNER_CHOICES, required=False, label='Owned by')
+    essay_rating = forms.ChoiceField(
+        choices=(('', 'Any'),) + InitialApplicationReview.RATING_CHOICES,
+        required=False, label='Rated')
+    red_flag = forms.ChoiceField(choices=RED_FLAG_CHOICES, required=False, label='Red flag')
+    reason = forms.ChoiceField(choices=REASON_CHOICES, required=False, label='Reason for status')
+    unreviewed = forms.BooleanField(required=False, label='Not reviewed by me')
+
+    def filter(self, applications, user):
+        data = self.cleaned_data
+        if data.get('min_days_free') is not None:
+            applications = applications.filter(longest_period_free__gte=data['min_days_free'])
+        if data.get('max_days_free') is not None:
+            applications = applications.filter(longest_period_free__lte=data['max_days_free'])
+
+        if data.get('owner') == 'me':
+            applications = applications.filter(review_owner__comrade__account=user)
+        elif data.get('owner') == 'none':
+            applications = applications.filter(review_owner__isnull=True)
+
+        reviews = InitialApplicationReview.objects.all()
+        if data.get('essay_rating'):
+            applications = applications.filter(pk__in=reviews.filter(
+                essay_rating=data['essay_rating'],
+            ).values('application'))
+        if data.get('red_flag'):
+            applications = applications.filter(pk__in=reviews.filter(**{
+                data['red_flag']: True,
+            }).values('application'))
+        if data.get('unreviewed'):
+            applications = applications.exclude(pk__in=reviews.filter(
+                reviewer__comrade__account=user,
+            ).values('application'))
+
+        if data.get('reason'):
+            applications = applications.filter(reason_denied__startswith=data['reason'])
+
+        return applications
+
 @login_required
 def applicant_review_summary(request, status):
     """
     For applicant reviewers and staff, show the status of applications that
-    have the specified approval status.
+    have the specified approval status, one page at a time.
     """
     current_round = get_current_round_for_initial_application()
 
@@ -2899,17 +3286,79 @@ def applicant_review_summary(request, status):
     applications = ApplicantApproval.objects.filter(
         application_round=current_round,
         approval_status=status,
-    ).order_by('applicant__account__username').order_by('submission_date')
+    )
+
+    filters = ApplicationReviewFilterForm(request.GET)
+    if filters.is_valid():
+        applications = filters.filter(applications, request.user)
+        order = filters.cleaned_data.get('order') or 'submission_date'
+    else:
+        order = 'submission_date'
+
+    if order == 'submission_date':
+        keys = ('submission_date', 'pk')
+    else:
+        # Free periods that haven't been computed yet are null, so count
+        # them as -1 to give every row a comparable key.
+        applications = applications.annotate(days_free=Coalesce('longest_period_free', models.Value(-1)))
+        keys = ('days_free', 'pk')
+    descending = order.startswith('-')
 
+    try:
+        after = signing.loads(request.GET['after'], salt='applicant-review-summary')
+    except (KeyError, signing.BadSignature):
+        after = None
+
+    page, next_cursor = keyset_page(applications.for_review_grid(), keys, descending, after, APPLICANT_REVIEW_PAGE_SIZE)
+    rows = [ReviewGridRow(application) for application in page]
+
+    next_page = None
+    if next_cursor is not None:
+        params = request.GET.copy()
+        params['after'] = signing.dumps(next_cursor, salt='applicant-review-summary')
+        next_page = '?' + params.urlencode()
+    first_page = None
+    if after is not None:
+        params = request.GET.copy()
+        del params['after']
+        first_page = '?' + params.urlencode()
+
+    context = {
+        'filters': filters,
+        'next_page': next_page,
+        'first_page': first_page,
+    }
     if status == ApprovalStatus.PENDING:
-        context_name = 'pending_applications'
+        context['pending_applications'] = [row for row in rows if not row.needs_revision]
+        context['pending_revisions'] = [row for row in rows if row.needs_revision]
     elif status == ApprovalStatus.REJECTED:
-        context_name = 'rejected_applications'
+        context['rejected_applications'] = rows
     elif status == ApprovalStatus.APPROVED:
-        context_name = 'approved_applications'
+        context['approved_applications'] = rows
+    return render(request, 'home/applicant_review_summary.html', context)
+
+@login_required
+def applicant_review_search(request):
+    """
+    For applicant reviewers and staff, search this round's applications by
+    applicant name, username, email address, school, or essay text, best
+    match first.
+    """
+    current_round = get_current_round_for_initial_application()
+
+    if not request.user.is_staff and not current_round.is_reviewer(request.user):
+        raise PermissionDenied("You are not authorized to review applications.")
+
+    query = request.GET.get('q', '').strip()
+    rows = []
+    if query:
+        applications = ApplicationSearchDocument.search(query, current_round,
+                applications=ApplicantApproval.objects.for_review_grid())
+        rows = [ReviewGridRow(application) for application in applications]
 
-    return render(request, 'home/applicant_review_summary.html', {
-        context_name: applications,
+    return render(request, 'home/applicant_review_search.html', {
+        'query': query,
+        'rows': rows,
     })
 
 # Passed action, applicant_username
@@ -3195,6 +3644,7 @@ class ReviewCommentUpdate(LoginRequiredMixin, ComradeRequiredMixin, UpdateView):
             'applicant_username': self.kwargs['applicant_username'],
             })
 
+@cache_page_for_anonymous
 def travel_stipend(request):
     rounds = RoundPage.objects.all().order_by('-internstarts')
     return render(request, 'home/travel_stipend.html', {
@@ -254,6 +254,11 @@ ACCOUNT_ACTIVATION_DAYS = 7
 
 DEFAULT_FROM_EMAIL = 'organizers@outreachy.org'
 
+# When EMAIL_BACKEND is home.email.OutboxEmailBackend, web requests only
+# queue messages, and `./manage.py deliveroutbox` sends them using this
+# backend.
+OUTBOX_DELIVERY_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
+
 # Get optional settings for Raven/Sentry error logging. The Sentry DSN
 # should be given by the environment variable SENTRY_DSN, which is the
 # only environment variable that Raven automatically checks so we don't
@@ -20,9 +20,23 @@ TRUSTED_PROXIES = os.getenv('TRUSTED_PROXIES', '172.17.0.1').split()
 
 SECRET_KEY = os.environ['SECRET_KEY']
 
+# The web workers, the outbox worker, and scheduled commands like
+# fetchplanet each run in their own process, and cached pages, feeds, and
+# dashboards are invalidated by whichever one changes the data, so they
+# all have to share one cache. Create its table with
+# `python manage.py createcachetable`.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+        'LOCATION': 'django_cache',
+    },
+}
+
 EMAIL_HOST = os.environ.get('EMAIL_HOST')
 if EMAIL_HOST:
-    EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
+    # Queue messages in the database; the deliveroutbox command sends them.
+    EMAIL_BACKEND = 'home.email.OutboxEmailBackend'
+    OUTBOX_DELIVERY_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
     # Environment variables are strings, so we need to convert to an integer
     EMAIL_PORT = int(os.environ.get('EMAIL_PORT', 25))
     EMAIL_HOST_USER = os.environ.get('EMAIL_HOST_USER', '')
@@ -0,0 +1,133 @@
+"""
+Counting searches for Wagtail's search promotions and reports, without
+writing to the database on every search. Hits collect in memory and are
+written to Wagtail's Query and QueryDailyHits tables in a few bulk queries
+once enough time has passed or enough searches have piled up, and when the
+process exits.
+"""
+
+import atexit
+import collections
+import threading
+import time
+
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from wagtail.wagtailsearch.models import Query, QueryDailyHits
+from wagtail.wagtailsearch.utils import normalise_query_string
+
+FLUSH_INTERVAL = 60
+FLUSH_SIZE = 500
+
+_lock = threading.Lock()
+_hits = collections.Counter()
+_last_flush = time.monotonic()
+
+def record_hit(query_string):
+    query_string = normalise_query_string(query_string)
+    if not query_string:
+        return
+    with _lock:
+        # Query.add_hit counts by the same date.
+        _hits[(query_string, timezone.now().date())] += 1
+        due = (len(_hits) >= FLUSH_SIZE
+                or time.monotonic() - _last_flush >= FLUSH_INTERVAL)
+        if not due:
+            return
+        hits = _take()
+    _save(hits)
+
+def _take():
+    global _last_flush
+    hits = dict(_hits)
+    _hits.clear()
+    _last_flush = time.monotonic()
+    return hits
+
+def flush():
+    """
+    Write out every hit recorded so far, returning how many searches that
+    was.
+    """
+    with _lock:
+        hits = _take()
+    _save(hits)
+    return sum(hits.values())
+
+def _save(hits):
+    if not hits:
+        return
+
+    # Query.query_string is unique, so create the queries we haven't seen
+    # before and then look them all up again.
+    query_strings = {query_string for query_string, date in hits}
+    existing = set(Query.objects.filter(
+        query_string__in=query_strings,
+    ).values_list('query_string', flat=True))
+    try:
+        with transaction.atomic():
+            Query.objects.bulk_create([
+                Query(query_string=query_string)
+                for query_string in query_strings - existing
+            ])
+    except IntegrityError:
+        # Another process created some of them first, which is fine.
+        pass
+    query_ids = dict(Query.objects.filter(
+        query_string__in=query_strings,
+    ).values_list('query_string', 'pk'))
+
+    hits = {
+        (query_ids[query_string], date): count
+        for (query_string, date), count in hits.items()
+        if query_string in query_ids
+    }
+
+    try:
+        with transaction.atomic():
+            _save_daily_hits(hits)
+    except IntegrityError:
+        # Another process started counting one of these queries today
+        # while we were looking, so take the slow path and count each one
+        # the way Query.add_hit does.
+        for (query_id, date), count in hits.items():
+            daily_hits, created = QueryDailyHits.objects.get_or_create(query_id=query_id, date=date)
+            QueryDailyHits.objects.filter(pk=daily_hits.pk).update(hits=F('hits') + count)
+
+def _save_daily_hits(hits):
+    dates = {date for query_id, date in hits}
+    existing = set(QueryDailyHits.objects.filter(
+        query_id__in={query_id for query_id, date in hits},
+        date__in=dates,
+    ).values_list('query_id', 'date'))
+
+    # One UPDATE for every distinct number of hits, which is usually
+    # just a few, rather than one for every query.
+    by_count = collections.defaultdict(list)
+    for key, count in hits.items():
+        if key in existing:
+            by_count[count].append(key)
+    for count, keys in by_count.items():
+        for date in {date for query_id, date in keys}:
+            QueryDailyHits.objects.filter(
+                query_id__in=[query_id for query_id, d in keys if d == date],
+                date=date,
+            ).update(hits=F('hits') + count)
+
+    QueryDailyHits.objects.bulk_create([
+        QueryDailyHits(query_id=query_id, date=date, hits=count)
+        for (query_id, date), count in hits.items()
+        if (query_id, date) not in existing
+    ])
+
+def _flush_at_exit():
+    try:
+        flush()
+    except Exception:
+        # The database may already be gone by now; losing a few search
+        # counts isn't worth a traceback on every shutdown.
+        pass
+
+atexit.register(_flush_at_exit)
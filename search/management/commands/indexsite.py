@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+from wagtail.wagtailcore.models import Page
+from home.models import Community, Project
+from search.models import SiteSearchDocument
+
+class Command(BaseCommand):
+    help = 'Rebuilds the search documents the site search looks through'
+
+    def handle(self, *args, **options):
+        SiteSearchDocument.objects.all().delete()
+        for page in Page.objects.live().public():
+            SiteSearchDocument.index_page(page)
+        for community in Community.objects.all():
+            SiteSearchDocument.index_community(community)
+        for project in Project.objects.select_related(
+                'project_round__community',
+                'project_round__participating_round'):
+            SiteSearchDocument.index_project(project)
+        self.stdout.write("Indexed {} documents".format(SiteSearchDocument.objects.count()))
@@ -0,0 +1,267 @@
+from __future__ import absolute_import, unicode_literals
+
+import datetime
+import hashlib
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.db import connections, models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils.html import strip_tags
+from django.utils.text import Truncator
+
+from wagtail.wagtailcore.fields import RichTextField, StreamField
+from wagtail.wagtailcore.models import Page
+from wagtail.wagtailcore.signals import page_published, page_unpublished
+
+from home import fulltext
+from home.models import ApprovalStatus
+from home.models import Community
+from home.models import Participation
+from home.models import Project
+from home.models import RoundPage
+from home.models import get_cache_generation
+from home.models import get_deadline_date_for
+from home.models import new_cache_generation
+
+SEARCH_GENERATION_KEY = 'site-search-generation'
+
+class SiteSearchDocument(models.Model):
+    """
+    One public page of the site, as the site search sees it: live Wagtail
+    pages, plus approved projects and the communities they belong to. The
+    signal handlers below keep these up to date, and the full-text index
+    over them is whatever home/fulltext.py could create for this database.
+    """
+    content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
+    object_id = models.PositiveIntegerField()
+
+    title = models.CharField(max_length=255)
+    description = models.TextField(blank=True)
+    body = models.TextField(blank=True)
+    url = models.CharField(max_length=255)
+
+    # Some pages only become public on a certain date, like the project
+    # list for a round.
+    public_from = models.DateField(null=True, blank=True)
+
+    class Meta:
+        unique_together = (
+                ('content_type', 'object_id'),
+                )
+
+    def __str__(self):
+        return self.title
+
+    @classmethod
+    def index(cls, obj, **fields):
+        cls.objects.update_or_create(
+                content_type=ContentType.objects.get_for_model(obj, for_concrete_model=False),
+                object_id=obj.pk,
+                defaults=fields)
+        new_cache_generation(SEARCH_GENERATION_KEY)
+
+    @classmethod
+    def unindex(cls, obj):
+        deleted, _ = cls.objects.filter(
+                content_type=ContentType.objects.get_for_model(obj, for_concrete_model=False),
+                object_id=obj.pk).delete()
+        if deleted:
+            new_cache_generation(SEARCH_GENERATION_KEY)
+
+    @classmethod
+    def index_page(cls, page):
+        # Index every page under wagtailcore.Page, whatever its specific
+        # type, so we can find it again from any of its signals.
+        page = Page.objects.live().public().filter(pk=page.pk).first()
+        if page is None or page.url is None:
+            return
+        specific = page.specific
+        body = []
+        for field in specific._meta.concrete_fields:
+            value = field.value_from_object(specific)
+            if isinstance(field, StreamField):
+                body.extend(field.get_searchable_content(value))
+            elif isinstance(field, RichTextField):
+                body.append(strip_tags(value))
+        body = '\n'.join(text for text in body if text)
+        cls.objects.update_or_create(
+                content_type=ContentType.objects.get_for_model(Page),
+                object_id=page.pk,
+                defaults={
+                    'title': page.seo_title or page.title,
+                    'description': page.search_description or Truncator(body).words(40),
+                    'body': body,
+                    'url': page.url,
+                    'public_from': None,
+                })
+        new_cache_generation(SEARCH_GENERATION_KEY)
+
+    @classmethod
+    def unindex_page(cls, page):
+        deleted, _ = cls.objects.filter(
+                content_type=ContentType.objects.get_for_model(Page),
+                object_id=page.pk).delete()
+        if deleted:
+            new_cache_generation(SEARCH_GENERATION_KEY)
+
+    @classmethod
+    def index_project(cls, project):
+        participation = project.project_round
+        if (project.approval_status != ApprovalStatus.APPROVED
+                or participation.approval_status != ApprovalStatus.APPROVED):
+            cls.unindex(project)
+            return
+        community = participation.community
+        body = [
+                project.long_description,
+                project.intern_tasks,
+                project.intern_benefits,
+                project.contribution_tasks,
+        ]
+        cls.index(project,
+                title='{}: {}'.format(community.name, project.short_title),
+                description=community.description,
+                body='\n'.join(strip_tags(text) for text in body if text),
+                url=project.get_landing_url(),
+                # Projects are listed once the application period opens.
+                public_from=participation.participating_round.appsopen)
+
+    @classmethod
+    def index_community(cls, community):
+        if not community.participation_set.approved().exists():
+            cls.unindex(community)
+            return
+        body = [community.long_description, community.tutorial]
+        cls.index(community,
+                title=community.name,
+                description=community.description,
+                body='\n'.join(strip_tags(text) for text in body if text),
+                url=community.get_preview_url(),
+                public_from=None)
+
+    @staticmethod
+    def search(query):
+        return SiteSearchResults(query)
+
+class SiteSearchResults(object):
+    """
+    The documents matching a search, best match first, which only hits the
+    database for the parts of the list that are used, like a QuerySet, so
+    it can be handed to a Paginator. Each slice and the count are cached
+    until the next time anything is indexed, so repeating a popular search
+    costs nothing.
+    """
+
+    def __init__(self, query):
+        self.query = query
+        now = datetime.datetime.now(datetime.timezone.utc)
+        self.today = get_deadline_date_for(now)
+        self.connection = connections[SiteSearchDocument.objects.db]
+        self.where = 'd.public_from IS NULL OR d.public_from <= %s'
+        self.params = [self.today]
+
+    def cache_key(self, part):
+        # Documents become public on a certain date, so the date has to be
+        # part of the key too.
+        generation = get_cache_generation(SEARCH_GENERATION_KEY)
+        query = hashlib.md5(self.query.encode('utf-8')).hexdigest()
+        return 'site-search:{}:{}:{}:{}'.format(generation, self.today, query, part)
+
+    def fallback(self):
+        documents = SiteSearchDocument.objects.filter(
+                models.Q(public_from__isnull=True) | models.Q(public_from__lte=self.today))
+        for term in fulltext.search_terms(self.query):
+            documents = documents.filter(
+                    models.Q(title__icontains=term)
+                    | models.Q(description__icontains=term)
+                    | models.Q(body__icontains=term))
+        return documents.order_by('title', 'pk')
+
+    def count(self):
+        key = self.cache_key('count')
+        count = cache.get(key)
+        if count is None:
+            count = fulltext.SITE.count(self.connection, self.query, where=self.where, params=self.params)
+            if count is None:
+                count = self.fallback().count() if fulltext.search_terms(self.query) else 0
+            cache.set(key, count)
+        return count
+
+    def __len__(self):
+        return self.count()
+
+    def __getitem__(self, key):
+        if not isinstance(key, slice) or key.step is not None:
+            raise TypeError("SiteSearchResults can only be sliced")
+        start = key.start or 0
+        stop = key.stop if key.stop is not None else self.count()
+        if stop <= start:
+            return []
+
+        cache_key = self.cache_key('{}-{}'.format(start, stop))
+        results = cache.get(cache_key)
+        if results is None:
+            matches = fulltext.SITE.search(self.connection, self.query, stop - start, start,
+                    where=self.where, params=self.params)
+            if matches is None:
+                if fulltext.search_terms(self.query):
+                    documents = list(self.fallback()[start:stop])
+                else:
+                    documents = []
+            else:
+                found = SiteSearchDocument.objects.in_bulk([pk for pk, score in matches])
+                documents = [found[pk] for pk, score in matches if pk in found]
+            # Cache just what the results page shows.
+            results = [
+                {'title': d.title, 'description': d.description, 'url': d.url}
+                for d in documents
+            ]
+            cache.set(cache_key, results)
+        return results
+
+@receiver(page_published)
+def index_published_page(sender, instance, **kwargs):
+    SiteSearchDocument.index_page(instance)
+
+@receiver(page_unpublished)
+def unindex_unpublished_page(sender, instance, **kwargs):
+    SiteSearchDocument.unindex_page(instance)
+
+@receiver(post_delete)
+def unindex_deleted_page(sender, instance, **kwargs):
+    if isinstance(instance, Page):
+        SiteSearchDocument.unindex_page(instance)
+
+@receiver(post_save, sender=Project)
+def index_saved_project(sender, instance, **kwargs):
+    SiteSearchDocument.index_project(instance)
+
+@receiver(post_delete, sender=Project)
+def unindex_deleted_project(sender, instance, **kwargs):
+    SiteSearchDocument.unindex(instance)
+
+@receiver(post_save, sender=Community)
+def index_saved_community(sender, instance, **kwargs):
+    SiteSearchDocument.index_community(instance)
+
+@receiver(post_delete, sender=Community)
+def unindex_deleted_community(sender, instance, **kwargs):
+    SiteSearchDocument.unindex(instance)
+
+@receiver(post_save, sender=Participation)
+def index_participation(sender, instance, **kwargs):
+    # Approving a community for a round makes it and its approved projects
+    # public.
+    SiteSearchDocument.index_community(instance.community)
+    for project in instance.project_set.select_related('project_round__community', 'project_round__participating_round'):
+        SiteSearchDocument.index_project(project)
+
+@receiver(post_save, sender=RoundPage)
+def index_round_projects(sender, instance, **kwargs):
+    # Projects become public when their round's application period opens.
+    for project in Project.objects.filter(
+            project_round__participating_round=instance,
+    ).select_related('project_round__community', 'project_round__participating_round'):
+        SiteSearchDocument.index_project(project)
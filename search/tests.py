@@ -0,0 +1,82 @@
+from django.core.paginator import Paginator
+from django.test import TestCase
+
+from wagtail.wagtailsearch.models import Query
+
+from home.factories import ParticipationFactory
+from home.factories import ProjectFactory
+from home.factories import RoundPageFactory
+from home.models import ApprovalStatus
+
+from . import hits
+from .models import SiteSearchDocument
+
+
+class SiteSearchTestCase(TestCase):
+    def search(self, query):
+        return [result['title'] for result in SiteSearchDocument.search(query)[:10]]
+
+    def test_only_approved_and_open_projects(self):
+        participation = ParticipationFactory(
+            community__name='Wombats',
+            participating_round=RoundPageFactory(start_from='appsopen'),
+            approval_status=ApprovalStatus.APPROVED,
+        )
+        ProjectFactory(
+            project_round=participation,
+            short_title='Burrow mapper',
+            approval_status=ApprovalStatus.APPROVED,
+        )
+        ProjectFactory(
+            project_round=participation,
+            short_title='Burrow painter',
+            approval_status=ApprovalStatus.PENDING,
+        )
+        ProjectFactory(
+            project_round__participating_round=RoundPageFactory(start_from='pingnew'),
+            project_round__approval_status=ApprovalStatus.APPROVED,
+            short_title='Burrow digger',
+            approval_status=ApprovalStatus.APPROVED,
+        )
+
+        self.assertEqual(self.search('burrow'), ['Wombats: Burrow mapper'])
+        self.assertEqual(self.search('wombats'), ['Wombats', 'Wombats: Burrow mapper'])
+
+        participation.approval_status = ApprovalStatus.WITHDRAWN
+        participation.save()
+        self.assertEqual(self.search('wombats'), [])
+
+    def test_paginated_results(self):
+        participation = ParticipationFactory(
+            participating_round=RoundPageFactory(start_from='appsopen'),
+            approval_status=ApprovalStatus.APPROVED,
+        )
+        for number in range(12):
+            ProjectFactory(
+                project_round=participation,
+                short_title='Kernel patch {}'.format(number),
+                approval_status=ApprovalStatus.APPROVED,
+            )
+
+        paginator = Paginator(SiteSearchDocument.search('kernel'), 10)
+        self.assertEqual(paginator.count, 12)
+        self.assertEqual(len(paginator.page(2).object_list), 2)
+
+        # Repeating the search comes from the cache.
+        with self.assertNumQueries(0):
+            paginator = Paginator(SiteSearchDocument.search('kernel'), 10)
+            self.assertEqual(paginator.count, 12)
+            self.assertEqual(len(paginator.page(2).object_list), 2)
+
+class SearchHitsTestCase(TestCase):
+    def test_hits_flushed_in_bulk(self):
+        hits.flush()
+        Query.get('wombats').add_hit()
+        for query in ('Wombats', 'wombats ', 'burrows', 'wombats'):
+            hits.record_hit(query)
+        self.assertEqual(Query.objects.count(), 1)
+
+        with self.assertNumQueries(10):
+            self.assertEqual(hits.flush(), 4)
+        self.assertEqual(Query.get('wombats').hits, 4)
+        self.assertEqual(Query.get('burrows').hits, 1)
@@ -3,8 +3,8 @@ from __future__ import absolute_import, unicode_literals
 from django.core.paginator import EmptyPage, PageNotAnInteger, Paginator
 from django.shortcuts import render
 
-from wagtail.wagtailcore.models import Page
-from wagtail.wagtailsearch.models import Query
+from .hits import record_hit
+from .models import SiteSearchDocument
 
 
 def search(request):
@@ -13,13 +13,12 @@ def search(request):
 
     # Search
     if search_query:
-        search_results = Page.objects.live().search(search_query)
-        query = Query.get(search_query)
+        search_results = SiteSearchDocument.search(search_query)
 
         # Record hit
-        query.add_hit()
+        record_hit(search_query)
     else:
-        search_results = Page.objects.none()
+        search_results = []
 
     # Pagination
     paginator = Paginator(search_results, 10)